@@ -14,6 +14,8 @@ import re
 from pathlib import Path
 
 from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import instance_config_parser
+from trackingfunctionsdk.common.helpers import phc_index
 from trackingfunctionsdk.services.config_watcher import ConfigFileWatcher
 from trackingfunctionsdk.services.daemon import DaemonControl
 from trackingfunctionsdk.services.health import HealthServer
@@ -108,8 +110,14 @@ if __name__ == "__main__":
 
     def on_config_change():
         """Callback when config files change"""
+        phc_index.invalidate()
+        try:
+            instance_config_parser.reload_monitoring_config()
+        except OSError as ex:
+            LOG.error("Failed to reload instance monitoring config: %s", ex)
         if daemon:
-            daemon.request_reload()
+            # The running daemon only rebuilds the instances that changed
+            daemon.request_reload(json.dumps(build_context()))
 
     try:
         # Start health server once for k8s httpGet health checks (shared across
@@ -26,6 +26,8 @@ class BrokerClientBase(object):
         self.listeners = {}
         self.broker_endpoint = RpcEndpointInfo(broker_transport_endpoint)
         self.transport = rpc_helper.get_transport(self.broker_endpoint)
+        self.rpc_clients = rpc_helper.RpcClientCache(
+            self.transport, self.broker_endpoint)
         self._workerevent = threading.Event()
         self._workerlock = threading.Lock()
         self._workerterminated = False
@@ -44,6 +46,7 @@ class BrokerClientBase(object):
         if self._workerevent:
             self._workerevent.set()
         if self.transport:
+            self.rpc_clients.clear()
             self.transport.cleanup()
             del self.transport
             self.transport = None
@@ -157,17 +160,13 @@ class BrokerClientBase(object):
                     'is' if self.__is_connected(context) else 'is not yet'))
 
     def call(self, topic, server, api_name, timeout=None, retry=None, **api_kwargs):
-        target = oslo_messaging.Target(
-            topic=topic, server=server, version=self.broker_endpoint.Version,
-            namespace=self.broker_endpoint.Namespace)
         # note: the call might stuck here on 'Connection failed' and retry forever
         # due to the tcp connection is unreachable: 'AMQP server on <broker host>:<port> is unreachable: timed out'
-        queryclient = oslo_messaging.get_rpc_client(self.transport, target, timeout = timeout, retry = retry)
+        queryclient = self.rpc_clients.get(
+            topic, server=server, timeout=timeout, retry=retry)
         return queryclient.call({}, api_name, **api_kwargs)
 
     def cast(self, topic, api_name, timeout=None, retry=None, **api_kwargs):
-        target = oslo_messaging.Target(
-            topic=topic, fanout=True, version=self.broker_endpoint.Version,
-            namespace=self.broker_endpoint.Namespace)
-        queryclient = oslo_messaging.get_rpc_client(self.transport, target, timeout = timeout, retry = retry)
+        queryclient = self.rpc_clients.get(
+            topic, fanout=True, timeout=timeout, retry=retry)
         queryclient.cast({}, api_name, **api_kwargs)
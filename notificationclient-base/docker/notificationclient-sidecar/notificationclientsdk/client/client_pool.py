@@ -0,0 +1,219 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Pool of NotificationServiceClients for pull status requests
+
+Every CurrentState request and every new subscription used to build a
+NotificationServiceClient, i.e. a new transport, AMQP connection and
+refresher thread, for a single QueryStatus call. The pool keeps one client
+per broker pod IP for the pull requests of the sidecar:
+
+- a client whose broker pod IP changed, as reported by the BrokerState of
+  its broker, is closed and replaced
+- a client whose request failed on the connection or timed out is removed,
+  the next request reconnects
+- clients unused for BROKER_CLIENT_IDLE_SECONDS are closed, by the next
+  request or by a timer once requests stop
+
+A client is shared by the requests in flight, so a client removed from the
+pool is only closed once the last of its requests released it.
+
+Usage:
+    client = pool.get(broker_name, broker_pod_ip, transport_endpoint)
+    try:
+        status = client.query_resource_status(ResourceType.TypePTP)
+    except Exception:
+        pool.discard(broker_pod_ip, client)
+        raise
+    finally:
+        pool.release(broker_pod_ip, client)
+"""
+
+import logging
+import threading
+import time
+
+from notificationclientsdk.client.notificationservice import \
+    NotificationServiceClient
+from notificationclientsdk.common.helpers import constants, log_helper
+from notificationclientsdk.model.dto.broker_state import BrokerState
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+
+class _PooledClient(object):
+    __slots__ = ('client', 'broker_name', 'last_used', 'in_use')
+
+    def __init__(self, client, broker_name, last_used):
+        self.client = client
+        self.broker_name = broker_name
+        self.last_used = last_used
+        # Requests holding the client, between get() and release()
+        self.in_use = 0
+
+    def is_healthy(self):
+        # cleanup() drops the transport of a client
+        return self.client.transport is not None
+
+
+class NotificationServiceClientPool(object):
+    """NotificationServiceClients shared by requests, keyed by broker pod IP
+
+    get() may be called from any thread, every get() is paired with a
+    release(). Clients are closed outside of the pool lock since closing one
+    waits for its listeners to stop.
+    """
+
+    def __init__(self, idle_seconds=constants.BROKER_CLIENT_IDLE_SECONDS,
+                 clock=time.monotonic):
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # broker pod IP -> _PooledClient
+        self._clients = {}
+        # broker name -> BrokerState, tracking the pod IP of the broker
+        self._broker_states = {}
+        # id(client) -> _PooledClient removed from the pool, closed once
+        # released by the requests in flight
+        self._retired = {}
+        self._evict_timer = None
+
+    def get(self, broker_name, broker_pod_ip, transport_endpoint):
+        """Return the client of a broker, connecting it if needed"""
+        now = self._clock()
+        closing = []
+        with self._lock:
+            closing.extend(self.__evict_idle(now))
+            brokerstate = self._broker_states.get(broker_name)
+            if brokerstate is None:
+                brokerstate = BrokerState(BrokerName=broker_name)
+                self._broker_states[broker_name] = brokerstate
+            previous_ip = brokerstate.BrokerIP
+            brokerstate.update_broker_ip(broker_pod_ip)
+            if brokerstate.is_broker_ip_changed():
+                brokerstate.ack_broker_ip_changed()
+                pooled = self._clients.get(previous_ip)
+                if pooled is not None and pooled.broker_name == broker_name:
+                    LOG.info("Broker {0} moved from {1} to {2}".format(
+                        broker_name, previous_ip, broker_pod_ip))
+                    closing.extend(self.__retire(previous_ip))
+
+            pooled = self._clients.get(broker_pod_ip)
+            if pooled is not None and not pooled.is_healthy():
+                closing.extend(self.__retire(broker_pod_ip))
+                pooled = None
+            if pooled is None:
+                pooled = _PooledClient(
+                    NotificationServiceClient(
+                        broker_name, transport_endpoint, broker_pod_ip),
+                    broker_name, now)
+                self._clients[broker_pod_ip] = pooled
+                LOG.debug("Pooled client for {0}@{1}".format(
+                    broker_name, broker_pod_ip))
+                self.__schedule_eviction()
+            pooled.last_used = now
+            pooled.in_use += 1
+            client = pooled.client
+        self.__close(closing)
+        return client
+
+    def release(self, broker_pod_ip, client):
+        """Return a client got by a request, closing it if it was removed"""
+        now = self._clock()
+        with self._lock:
+            pooled = self._clients.get(broker_pod_ip)
+            if pooled is not None and pooled.client is client:
+                pooled.in_use -= 1
+                pooled.last_used = now
+                return
+            pooled = self._retired.get(id(client))
+            if pooled is None:
+                return
+            pooled.in_use -= 1
+            if pooled.in_use > 0:
+                return
+            del self._retired[id(client)]
+        self.__close([client])
+
+    def discard(self, broker_pod_ip, client=None):
+        """Remove the client of a broker pod IP after a failed request
+
+        The client is closed once the requests in flight released it. If
+        client is given, the pooled client is only removed if it is still
+        that one, not one reconnected by another request in the meantime.
+        """
+        with self._lock:
+            pooled = self._clients.get(broker_pod_ip)
+            if pooled is None or (client is not None and
+                                  pooled.client is not client):
+                return
+            closing = self.__retire(broker_pod_ip)
+        self.__close(closing)
+
+    def evict_idle(self):
+        """Close the clients unused for idle_seconds"""
+        with self._lock:
+            closing = self.__evict_idle(self._clock())
+        self.__close(closing)
+
+    def cleanup(self):
+        """Close every client, including the ones still in use"""
+        with self._lock:
+            closing = [pooled.client for pooled in self._clients.values()]
+            closing.extend(
+                pooled.client for pooled in self._retired.values())
+            self._clients.clear()
+            self._retired.clear()
+            self._broker_states.clear()
+            if self._evict_timer is not None:
+                self._evict_timer.cancel()
+                self._evict_timer = None
+        self.__close(closing)
+
+    def __retire(self, broker_pod_ip):
+        # Remove a client from the pool, returning it if it can be closed
+        pooled = self._clients.pop(broker_pod_ip)
+        if pooled.in_use == 0:
+            return [pooled.client]
+        self._retired[id(pooled.client)] = pooled
+        return []
+
+    def __evict_idle(self, now):
+        idle = [broker_pod_ip
+                for broker_pod_ip, pooled in self._clients.items()
+                if pooled.in_use == 0 and
+                now - pooled.last_used >= self.idle_seconds]
+        closing = []
+        for broker_pod_ip in idle:
+            closing.extend(self.__retire(broker_pod_ip))
+        return closing
+
+    def __schedule_eviction(self):
+        # Evict from a timer as well, get() no longer runs once requests stop
+        if self._evict_timer is not None or self.idle_seconds <= 0:
+            return
+        self._evict_timer = threading.Timer(
+            self.idle_seconds, self.__evict_timer_expired)
+        self._evict_timer.daemon = True
+        self._evict_timer.start()
+
+    def __evict_timer_expired(self):
+        with self._lock:
+            self._evict_timer = None
+            closing = self.__evict_idle(self._clock())
+            if self._clients:
+                self.__schedule_eviction()
+        self.__close(closing)
+
+    @staticmethod
+    def __close(clients):
+        for client in clients:
+            try:
+                client.cleanup()
+            except Exception as ex:
+                LOG.warning("Failed to close client of {0}: {1}".format(
+                    client.broker_name, str(ex)))
@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import os
+
 SPEC_VERSION = "1.0"
 DATA_TYPE_NOTIFICATION = "notification"
 DATA_TYPE_METRIC = "metric"
@@ -47,3 +49,29 @@ VALID_SOURCE_URI = {
 
 WILDCARD_CURRENT_NODE = '.'
 WILDCARD_ALL_NODES = '*'
+
+# RPC clients kept per broker connection, one per topic and server
+RPC_CLIENT_CACHE_SIZE = 64
+# Pooled clients of the brokers queried for pull status requests are closed
+# after BROKER_CLIENT_IDLE_SECONDS without a request
+BROKER_CLIENT_IDLE_SECONDS = float(
+    os.environ.get("BROKER_CLIENT_IDLE_SECONDS", 300))
+# CurrentState responses are reused for CURRENT_STATE_TTL_SECONDS, updated
+# with the notifications received meanwhile. 0 queries the daemon every time
+CURRENT_STATE_TTL_SECONDS = float(
+    os.environ.get("CURRENT_STATE_TTL_SECONDS", 2))
+# Notifications are posted to the subscribers by DELIVERY_WORKERS threads,
+# each subscription queueing the latest state of up to DELIVERY_QUEUE_SIZE
+# resource addresses. A full queue drops the oldest notification queued
+# (DELIVERY_DROP_OLDEST) or the one being queued (DELIVERY_DROP_NEWEST)
+DELIVERY_WORKERS = int(os.environ.get("DELIVERY_WORKERS", 8))
+DELIVERY_QUEUE_SIZE = int(os.environ.get("DELIVERY_QUEUE_SIZE", 64))
+DELIVERY_DROP_OLDEST = "drop-oldest"
+DELIVERY_DROP_NEWEST = "drop-newest"
+DELIVERY_DROP_POLICY = os.environ.get("DELIVERY_DROP_POLICY",
+                                      DELIVERY_DROP_OLDEST)
+DELIVERY_BACKOFF_SECONDS = 1  # doubled after every failed attempt
+DELIVERY_BACKOFF_MAX_SECONDS = 30
+DELIVERY_MAX_ATTEMPTS = 5
+# Delivery queue stats are logged every STATS_LOG_INTERVAL seconds
+STATS_LOG_INTERVAL = float(os.environ.get("STATS_LOG_INTERVAL", 300))
@@ -5,11 +5,14 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import collections
 import os
 import json
+import threading
 
 import oslo_messaging
 from oslo_config import cfg
+from notificationclientsdk.common.helpers import constants
 
 
 def setup_client(rpc_endpoint_info, topic, server):
@@ -25,3 +28,44 @@ def setup_client(rpc_endpoint_info, topic, server):
 def get_transport(rpc_endpoint_info):
     oslo_messaging.set_transport_defaults(rpc_endpoint_info.Exchange)
     return oslo_messaging.get_rpc_transport(cfg.CONF, url=rpc_endpoint_info.TransportEndpoint)
+
+
+class RpcClientCache(object):
+    """Bounded LRU cache of RPC clients of one transport
+
+    Building a Target and an RPCClient for every message is a significant
+    part of the cost of a cast. Clients are keyed by topic, fanout, server,
+    timeout and retry; the least recently used one is dropped once more
+    than max_size are cached.
+    """
+
+    def __init__(self, transport, rpc_endpoint_info,
+                 max_size=constants.RPC_CLIENT_CACHE_SIZE):
+        self.transport = transport
+        self.rpc_endpoint_info = rpc_endpoint_info
+        self.max_size = max_size
+        self._clients = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, topic, fanout=None, server=None, timeout=None,
+            retry=None):
+        key = (topic, fanout, server, timeout, retry)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+            target = oslo_messaging.Target(
+                topic=topic, fanout=fanout, server=server,
+                version=self.rpc_endpoint_info.Version,
+                namespace=self.rpc_endpoint_info.Namespace)
+            client = oslo_messaging.get_rpc_client(
+                self.transport, target, timeout=timeout, retry=retry)
+            self._clients[key] = client
+            if len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
@@ -17,7 +17,9 @@ LOG = logging.getLogger(__name__)
 log_helper.config_logger(LOG)
 
 
-def notify(subscriptioninfo, notification, timeout=2, retry=3):
+def notify(subscriptioninfo, notification, timeout=2, retry=3, session=None):
+    # Posting through a session reuses its kept-alive connection
+    post = session.post if session is not None else requests.post
     result = False
     while True:
         retry = retry - 1
@@ -28,8 +30,8 @@ def notify(subscriptioninfo, notification, timeout=2, retry=3):
                 # version 1
                 data = format_notification_data(subscriptioninfo, notification)
                 data = json.dumps(data)
-                response = requests.post(url, data=data, headers=headers,
-                                        timeout=timeout)
+                response = post(url, data=data, headers=headers,
+                                timeout=timeout)
                 response.raise_for_status()
             else:
                 if isinstance(notification, list):
@@ -39,8 +41,8 @@ def notify(subscriptioninfo, notification, timeout=2, retry=3):
                     for item in notification:
                         data = json.dumps(item)
                         LOG.info("Notification to post %s", (data))
-                        response = requests.post(url, data=data, headers=headers,
-                                                timeout=timeout)
+                        response = post(url, data=data, headers=headers,
+                                        timeout=timeout)
                         response.raise_for_status()
                 else:
                     # Dict type notification response format
@@ -49,8 +51,8 @@ def notify(subscriptioninfo, notification, timeout=2, retry=3):
                         # Not a nested dict, post the data
                         data = json.dumps(notification)
                         LOG.info("Notification to post %s", (data))
-                        response = requests.post(url, data=data, headers=headers,
-                                                timeout=timeout)
+                        response = post(url, data=data, headers=headers,
+                                        timeout=timeout)
                         response.raise_for_status()
                     else:
                         for item in notification:
@@ -58,8 +60,8 @@ def notify(subscriptioninfo, notification, timeout=2, retry=3):
                             data = format_notification_data(subscriptioninfo, {item: notification[item]})
                             data = json.dumps(data)
                             LOG.info("Notification to post %s", (data))
-                            response = requests.post(url, data=data, headers=headers,
-                                                    timeout=timeout)
+                            response = post(url, data=data, headers=headers,
+                                            timeout=timeout)
                             response.raise_for_status()
 
             if notification == {}:
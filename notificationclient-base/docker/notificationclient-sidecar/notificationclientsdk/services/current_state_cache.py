@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Short-lived cache of CurrentState responses
+
+Every CurrentState request used to be a QueryStatus RPC to the tracking
+daemon. The API process now keeps the last response of each query for
+CURRENT_STATE_TTL_SECONDS. The notification worker records the latest
+event of every resource address it is pushed, or syncs up, in a table
+shared with the API process. A cached response is answered with the
+newest of its own event and the recorded one for each resource address,
+so state changes pushed meanwhile are reported without another RPC. The
+instances a response covers still come from the daemon.
+
+Usage:
+    # notification worker
+    record_events(current_states, notification_info)
+    # API process
+    cache = CurrentStateCache(current_states)
+    status = cache.get(nodename, resource_address, optional)
+    if status is None:
+        status = query_daemon(...)
+        cache.put(nodename, resource_address, optional, status)
+"""
+
+import collections
+import copy
+import logging
+import threading
+import time
+
+from notificationclientsdk.common.helpers import constants, log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+
+def is_event(item):
+    return isinstance(item, dict) and 'data' in item and 'time' in item
+
+
+def event_address(event):
+    try:
+        return event['data']['values'][0]['ResourceAddress']
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def status_events(status):
+    """Return the events of a status, in any of the formats it comes in
+
+    That is a list of events, a single event, or a dict of events keyed by
+    instance. v1 statuses have no events.
+    """
+    if isinstance(status, list):
+        return [item for item in status if is_event(item)]
+    if is_event(status):
+        return [status]
+    if isinstance(status, dict):
+        return [item for item in status.values() if is_event(item)]
+    return []
+
+
+def record_events(current_states, status):
+    """Record the events of a status as the latest of their resources
+
+    Must be called before the event times are formatted for delivery.
+    """
+    for event in status_events(status):
+        resource_address = event_address(event)
+        if not resource_address:
+            continue
+        try:
+            last = current_states.get(resource_address)
+            if last is None or last['time'] <= event['time']:
+                current_states[resource_address] = event
+        except Exception as ex:
+            LOG.warning("Failed to record state of {0}: {1}".format(
+                resource_address, str(ex)))
+
+
+class CurrentStateCache(object):
+    """CurrentState responses of the daemons, kept for ttl seconds
+
+    current_states is the table of latest events shared with the
+    notification worker. Responses are returned as copies the caller may
+    modify.
+    """
+
+    MAX_RESPONSES = 64
+
+    def __init__(self, current_states,
+                 ttl=constants.CURRENT_STATE_TTL_SECONDS,
+                 clock=time.monotonic):
+        self.current_states = current_states
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (nodename, resource_address, optional) -> (fetched, status)
+        self._responses = collections.OrderedDict()
+
+    def get(self, nodename, resource_address=None, optional=None):
+        """Return the cached response of a query, or None if stale"""
+        if self.ttl <= 0:
+            return None
+        key = (nodename, resource_address, optional)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is None:
+                return None
+            if self._clock() - cached[0] >= self.ttl:
+                del self._responses[key]
+                return None
+            status = cached[1]
+        if status_events(status):
+            status = self.__refresh(status)
+        return copy.deepcopy(status)
+
+    def put(self, nodename, resource_address, optional, status):
+        if self.ttl <= 0:
+            return
+        key = (nodename, resource_address, optional)
+        with self._lock:
+            self._responses[key] = (self._clock(), copy.deepcopy(status))
+            self._responses.move_to_end(key)
+            if len(self._responses) > self.MAX_RESPONSES:
+                self._responses.popitem(last=False)
+
+    def __refresh(self, status):
+        """Return status with the events pushed since it was fetched"""
+        try:
+            # One round trip to the shared table
+            latest = self.current_states.copy()
+        except Exception as ex:
+            LOG.warning("Failed to read current states: {0}".format(str(ex)))
+            return status
+
+        def newest(event):
+            recorded = latest.get(event_address(event))
+            if recorded is not None and recorded['time'] > event['time']:
+                return recorded
+            return event
+
+        if isinstance(status, list):
+            return [newest(item) if is_event(item) else item
+                    for item in status]
+        if is_event(status):
+            return newest(status)
+        return {name: newest(item) if is_event(item) else item
+                for name, item in status.items()}
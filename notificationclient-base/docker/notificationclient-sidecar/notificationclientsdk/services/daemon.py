@@ -11,7 +11,11 @@ import multiprocessing as mp
 from notificationclientsdk.common.helpers import rpc_helper
 from notificationclientsdk.common.helpers import log_helper
 from notificationclientsdk.model.dto.rpc_endpoint import RpcEndpointInfo
+from notificationclientsdk.client.client_pool import \
+    NotificationServiceClientPool
 from notificationclientsdk.client.locationservice import LocationServiceClient
+from notificationclientsdk.services.current_state_cache import \
+    CurrentStateCache
 from notificationclientsdk.services.notification_worker import \
     NotificationWorker
 
@@ -22,12 +26,14 @@ log_helper.config_logger(LOG)
 def ProcessWorkerDefault(event,
                          subscription_event,
                          daemon_context,
-                         service_nodenames):
+                         service_nodenames,
+                         current_states=None):
     '''Entry point of Default Process Worker'''
     worker = NotificationWorker(event,
                                 subscription_event,
                                 daemon_context,
-                                service_nodenames)
+                                service_nodenames,
+                                current_states)
     worker.run()
 
 
@@ -41,12 +47,17 @@ class DaemonControl(object):
         self.service_nodenames = self.manager.list()
         LOG.debug('Managed (shared) list of nodes id %d contents %s' %
                   (id(self.service_nodenames), self.service_nodenames))
+        # Latest event of each resource address, recorded by the worker
+        self.current_states = self.manager.dict()
+        self.current_state_cache = CurrentStateCache(self.current_states)
         self.registration_endpoint = RpcEndpointInfo(
             daemon_context['REGISTRATION_TRANSPORT_ENDPOINT'])
         self.registration_transport = rpc_helper.get_transport(
             self.registration_endpoint)
         self.locationservice_client = LocationServiceClient(
             self.registration_endpoint.TransportEndpoint)
+        # Clients of the brokers queried for pull status requests
+        self.notificationservice_clients = NotificationServiceClientPool()
 
         if not process_worker:
             process_worker = ProcessWorkerDefault
@@ -55,7 +66,8 @@ class DaemonControl(object):
                                      args=(self.event,
                                            self.subscription_event,
                                            daemon_context,
-                                           self.service_nodenames))
+                                           self.service_nodenames,
+                                           self.current_states))
         self.mpinstance.start()
 
         # initial update
@@ -65,6 +77,9 @@ class DaemonControl(object):
         if self.locationservice_client:
             self.locationservice_client.cleanup()
             self.locationservice_client = None
+        if self.notificationservice_clients:
+            self.notificationservice_clients.cleanup()
+            self.notificationservice_clients = None
 
     def refresh(self):
         self.subscription_event.set()
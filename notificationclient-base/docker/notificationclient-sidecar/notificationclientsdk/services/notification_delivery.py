@@ -0,0 +1,371 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Concurrent delivery of notifications to the subscriber endpoints
+
+NotificationHandler used to post a notification to its subscribers one
+after the other, with a new connection per post, while holding the
+notification lock: a single slow or unreachable endpoint, at up to 3
+attempts of 2 seconds each, held up the delivery to every other subscriber
+and the next notifications. NotificationDelivery queues the notifications
+per subscription and posts them from a pool of DELIVERY_WORKERS threads:
+
+- each endpoint has a requests.Session, so its connections are kept alive
+  between the notifications
+- the queue of a subscription is posted in order by one worker at a time,
+  one notification per turn, so a slow endpoint only ties up the workers of
+  its own subscriptions
+- the events of a notification are queued by resource address, as notify()
+  posts them one by one anyway. An event for a resource address already
+  pending in the queue supersedes the pending one in place, so a subscriber
+  lagging behind gets the latest state rather than every state in between.
+  An event not newer than the one pending or last posted for its resource
+  address is a duplicate and is ignored
+- the queue holds at most DELIVERY_QUEUE_SIZE notifications, beyond that
+  DELIVERY_DROP_POLICY drops the oldest one or the one being queued
+- a failed post is retried with exponential backoff, up to
+  DELIVERY_MAX_ATTEMPTS times, unless superseded meanwhile
+
+Usage:
+    delivery = NotificationDelivery()
+    delivery.deliver(subscription, notification, timestamp, on_delivered)
+    delivery.stats()
+    # {'queues': 1, 'depth': 0, 'max_depth': 0, 'lag': 0.0, 'delivered': 1,
+    #  'coalesced': 0, 'dropped': 0, 'retries': 0}
+    delivery.retain(subscription_ids)
+    delivery.close()
+"""
+
+import collections
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from notificationclientsdk.common.helpers import constants, log_helper
+from notificationclientsdk.common.helpers import subscription_helper
+from notificationclientsdk.services.current_state_cache import \
+    event_address, is_event
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+
+def split_notification(notification, timestamp=None):
+    """Return the (key, notification, time) to queue for a notification
+
+    Events are split out, in the format they come in, under the key of
+    their resource address and ordered by their own time. The times
+    formatted by NotificationHandler compare as the times they format.
+    A v1 notification is keyed by resource type and node, ordered by
+    timestamp. The key of any other notification is None.
+    """
+    if isinstance(notification, list):
+        parts = [([item], item) for item in notification]
+    elif isinstance(notification, dict) and \
+            notification.get('ResourceType', None):
+        # v1 notification
+        return [(('v1', notification['ResourceType'],
+                  notification.get('ResourceQualifier', {}).get(
+                      'NodeName', None)),
+                 notification, timestamp)]
+    elif is_event(notification):
+        parts = [(notification, notification)]
+    elif isinstance(notification, dict):
+        parts = [({name: item}, item) for name, item in notification.items()]
+    else:
+        return [(None, notification, timestamp)]
+    split = []
+    for part, item in parts:
+        address = event_address(item) if is_event(item) else None
+        if address:
+            split.append((address, part, item['time']))
+        else:
+            split.append((None, part, timestamp))
+    return split
+
+
+class _Pending(object):
+    __slots__ = ('notification', 'timestamp', 'on_delivered', 'queued_at',
+                 'attempts')
+
+    def __init__(self, notification, timestamp, on_delivered, queued_at):
+        self.notification = notification
+        self.timestamp = timestamp
+        self.on_delivered = on_delivered
+        # When the resource got pending, kept by the superseding ones
+        self.queued_at = queued_at
+        self.attempts = 0
+
+
+class _SubscriptionQueue(object):
+    __slots__ = ('subscription', 'pending', 'posted', 'scheduled')
+
+    def __init__(self, subscription):
+        self.subscription = subscription
+        # delivery key -> _Pending, in queueing order
+        self.pending = collections.OrderedDict()
+        # delivery key -> time of the last notification posted
+        self.posted = {}
+        # True while a worker has the queue, queued, posting or backing off
+        self.scheduled = False
+
+
+class NotificationDelivery(object):
+    """Notifications to post, queued by subscription
+
+    deliver() may be called from any thread and does not wait for the
+    post. on_delivered is called from the worker once the notification is
+    posted.
+    """
+
+    def __init__(self, workers=constants.DELIVERY_WORKERS,
+                 queue_size=constants.DELIVERY_QUEUE_SIZE,
+                 drop_policy=constants.DELIVERY_DROP_POLICY,
+                 backoff=constants.DELIVERY_BACKOFF_SECONDS,
+                 max_backoff=constants.DELIVERY_BACKOFF_MAX_SECONDS,
+                 max_attempts=constants.DELIVERY_MAX_ATTEMPTS,
+                 clock=time.monotonic):
+        self.workers = workers
+        self.queue_size = max(1, queue_size)
+        if drop_policy not in (constants.DELIVERY_DROP_OLDEST,
+                               constants.DELIVERY_DROP_NEWEST):
+            LOG.warning("Unknown delivery drop policy {0}, using {1}".format(
+                drop_policy, constants.DELIVERY_DROP_OLDEST))
+            drop_policy = constants.DELIVERY_DROP_OLDEST
+        self.drop_policy = drop_policy
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='notification-delivery')
+        self._lock = threading.Lock()
+        self._closed = False
+        # subscriptionid -> _SubscriptionQueue
+        self._queues = {}
+        # endpoint URI -> requests.Session
+        self._sessions = {}
+        self._sequence = itertools.count()
+        self._retry_timers = set()
+        self._counters = {'delivered': 0, 'coalesced': 0, 'dropped': 0,
+                          'retries': 0}
+
+    def deliver(self, subscription, notification, timestamp=None,
+                on_delivered=None):
+        """Queue a notification, superseding the pending state of its resources
+
+        timestamp orders the notifications without events, see
+        split_notification().
+        """
+        parts = split_notification(notification, timestamp)
+        now = self._clock()
+        with self._lock:
+            if self._closed:
+                return
+            queue = self._queues.get(subscription.SubscriptionId)
+            if queue is None:
+                queue = _SubscriptionQueue(subscription)
+                self._queues[subscription.SubscriptionId] = queue
+            queue.subscription = subscription
+            for key, part, part_time in parts:
+                self.__queue(queue, key, part, part_time, on_delivered, now)
+            if queue.scheduled or not queue.pending:
+                return
+            queue.scheduled = True
+        self.__submit(queue)
+
+    def __queue(self, queue, key, notification, timestamp, on_delivered,
+                now):
+        # Called with the lock held
+        if key is None:
+            # Never superseded, nor a duplicate
+            key = ('unkeyed', next(self._sequence))
+            timestamp = None
+        elif timestamp is not None:
+            pending = queue.pending.get(key)
+            latest = pending.timestamp if pending is not None else \
+                queue.posted.get(key)
+            try:
+                if latest is not None and latest >= timestamp:
+                    LOG.debug("Ignore the notification of {0} to {1}, not "
+                              "newer than the one queued".format(
+                                  key, queue.subscription.SubscriptionId))
+                    return
+            except TypeError:
+                # Times of different formats, not comparable
+                pass
+        pending = queue.pending.get(key)
+        if pending is not None:
+            self._counters['coalesced'] += 1
+            queued_at = pending.queued_at
+        elif len(queue.pending) >= self.queue_size:
+            self._counters['dropped'] += 1
+            LOG.warning("Delivery queue of {0} is full, dropped the "
+                        "{1} notification".format(
+                            queue.subscription.SubscriptionId,
+                            'oldest' if self.drop_policy ==
+                            constants.DELIVERY_DROP_OLDEST else 'newest'))
+            if self.drop_policy == constants.DELIVERY_DROP_NEWEST:
+                return
+            queue.pending.popitem(last=False)
+            queued_at = now
+        else:
+            queued_at = now
+        queue.pending[key] = _Pending(
+            notification, timestamp, on_delivered, queued_at)
+
+    def stats(self):
+        """Return the queue depths, the lag and the counters
+
+        lag is how long, in seconds, the oldest pending resource has been
+        waiting for delivery.
+        """
+        now = self._clock()
+        with self._lock:
+            stats = dict(self._counters)
+            depths = [len(queue.pending) for queue in self._queues.values()]
+            oldest = [pending.queued_at
+                      for queue in self._queues.values()
+                      for pending in queue.pending.values()]
+        stats['queues'] = len(depths)
+        stats['depth'] = sum(depths)
+        stats['max_depth'] = max(depths) if depths else 0
+        stats['lag'] = round(now - min(oldest), 3) if oldest else 0.0
+        return stats
+
+    def retain(self, subscription_ids):
+        """Drop the queues of the subscriptions no longer active
+
+        The sessions of the endpoints no one subscribes to anymore are
+        closed.
+        """
+        closing = []
+        with self._lock:
+            for subscriptionid in list(self._queues):
+                if subscriptionid not in subscription_ids:
+                    self._queues.pop(subscriptionid).pending.clear()
+            endpoint_uris = set(queue.subscription.EndpointUri
+                                for queue in self._queues.values())
+            for uri in list(self._sessions):
+                if uri not in endpoint_uris:
+                    closing.append(self._sessions.pop(uri))
+        for session in closing:
+            session.close()
+
+    def close(self):
+        """Stop the workers, dropping the notifications not posted yet"""
+        with self._lock:
+            self._closed = True
+            for queue in self._queues.values():
+                queue.pending.clear()
+            self._queues.clear()
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            timers = list(self._retry_timers)
+            self._retry_timers.clear()
+        for timer in timers:
+            timer.cancel()
+        self._executor.shutdown(wait=False)
+        for session in sessions:
+            session.close()
+
+    def __session(self, uri):
+        # Called with the lock held
+        session = self._sessions.get(uri)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1,
+                                  pool_maxsize=self.workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._sessions[uri] = session
+        return session
+
+    def __submit(self, queue):
+        try:
+            self._executor.submit(self.__post_next, queue)
+        except RuntimeError:
+            # Closed meanwhile
+            pass
+
+    def __retry_later(self, queue, delay):
+        def resubmit():
+            with self._lock:
+                self._retry_timers.discard(timer)
+            self.__submit(queue)
+
+        timer = threading.Timer(delay, resubmit)
+        timer.daemon = True
+        with self._lock:
+            if self._closed:
+                return
+            self._retry_timers.add(timer)
+        timer.start()
+
+    def __post_next(self, queue):
+        with self._lock:
+            if not queue.pending:
+                queue.scheduled = False
+                return
+            # Left in the queue while posted, to be superseded in place
+            key, pending = next(iter(queue.pending.items()))
+            subscription = queue.subscription
+            session = self.__session(subscription.EndpointUri)
+        try:
+            subscription_helper.notify(subscription, pending.notification,
+                                       session=session)
+        except Exception as ex:
+            self.__failed(queue, key, pending, ex)
+            return
+        LOG.info("notification is delivered successfully to {0}".format(
+            subscription.SubscriptionId))
+        if pending.on_delivered:
+            pending.on_delivered()
+        with self._lock:
+            self._counters['delivered'] += 1
+            if pending.timestamp is not None:
+                queue.posted[key] = pending.timestamp
+            if queue.pending.get(key) is pending:
+                del queue.pending[key]
+            if not queue.pending:
+                queue.scheduled = False
+                return
+        # Let the other subscriptions waiting for a worker go first
+        self.__submit(queue)
+
+    def __failed(self, queue, key, pending, ex):
+        subscriptionid = queue.subscription.SubscriptionId
+        with self._lock:
+            pending.attempts += 1
+            if queue.pending.get(key) is not pending:
+                # Superseded, post the newer state right away
+                retry = False
+            elif pending.attempts >= self.max_attempts:
+                del queue.pending[key]
+                self._counters['dropped'] += 1
+                LOG.warning("notification is not delivered to {0} after {1} "
+                            "attempts:{2}".format(
+                                subscriptionid, pending.attempts, str(ex)))
+                if not queue.pending:
+                    queue.scheduled = False
+                    return
+                retry = False
+            else:
+                self._counters['retries'] += 1
+                retry = True
+        if not retry:
+            self.__submit(queue)
+            return
+        delay = min(self.max_backoff,
+                    self.backoff * 2 ** (pending.attempts - 1))
+        LOG.warning("notification is not delivered to {0}, retrying in "
+                    "{1:.1f}s:{2}".format(subscriptionid, delay, str(ex)))
+        self.__retry_later(queue, delay)
@@ -4,7 +4,8 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-import json
+import copy
+import functools
 import logging
 
 import multiprocessing as mp
@@ -12,44 +13,79 @@ import threading
 import time
 from datetime import datetime, timezone
 
-from notificationclientsdk.model.dto.subscription import SubscriptionInfoV1
-from notificationclientsdk.model.dto.subscription import SubscriptionInfoV2
 from notificationclientsdk.model.dto.resourcetype import ResourceType
 
 from notificationclientsdk.repository.subscription_repo import SubscriptionRepo
 
-from notificationclientsdk.common.helpers import subscription_helper
-from notificationclientsdk.common.helpers.nodeinfo_helper import NodeInfoHelper
+from notificationclientsdk.services.current_state_cache import record_events
+from notificationclientsdk.services.notification_delivery import \
+    NotificationDelivery
+from notificationclientsdk.services.subscription_index import \
+    SubscriptionIndex, split_resource_address
 
 from notificationclientsdk.client.notificationservice import NotificationHandlerBase
 
 LOG = logging.getLogger(__name__)
 
-from notificationclientsdk.common.helpers import log_helper
+from notificationclientsdk.common.helpers import constants, log_helper
 
 log_helper.config_logger(LOG)
 
 
 class NotificationHandler(NotificationHandlerBase):
 
-    def __init__(self):
+    def __init__(self, current_states=None):
         self.__supported_resource_types = (ResourceType.TypePTP,)
+        # Latest event of each resource address, read by CurrentState
+        self.current_states = current_states
         self.__init_notification_channel()
         pass
 
     def __init_notification_channel(self):
         self.notification_lock = threading.Lock()
         self.notification_stat = {}
+        # (node_name, subscriptionid) -> time of the latest notification
+        # queued for delivery, delivered or not yet
+        self.notification_queued = {}
+        self.subscription_index = SubscriptionIndex()
+        self.delivery = NotificationDelivery()
+        self.stats_logged_at = time.monotonic()
+
+    def refresh_subscriptions(self, subscriptions_orm):
+        '''Rebuild the subscription index after subscriptions changed'''
+        self.subscription_index.rebuild(subscriptions_orm)
+        subscription_ids = self.subscription_index.subscription_ids()
+        self.delivery.retain(subscription_ids)
+        with self.notification_lock:
+            for key in list(self.notification_queued):
+                if key[1] not in subscription_ids:
+                    del self.notification_queued[key]
+
+    def stop(self):
+        self.delivery.close()
+
+    def __ensure_subscription_index(self):
+        # Notifications may come in before the worker handled the first
+        # subscription event
+        if self.subscription_index.is_built():
+            return
+        subscription_repo = SubscriptionRepo(autocommit=True)
+        try:
+            self.subscription_index.rebuild(
+                subscription_repo.get(Status=1))
+        finally:
+            del subscription_repo
 
     # def handle_notification_delivery(self, notification_info):
     def handle(self, notification_info):
         LOG.debug("start notification delivery")
-        subscription_repo = None
         resource_address = None
         try:
             self.notification_lock.acquire()
             LOG.info("Notification handler notification_info %s", notification_info)
-            subscription_repo = SubscriptionRepo(autocommit=True)
+            if self.current_states is not None:
+                record_events(self.current_states, notification_info)
+            self.__ensure_subscription_index()
             if isinstance(notification_info, dict):
                 resource_type = notification_info.get('ResourceType', None)
                 # Get nodename from resource address
@@ -61,8 +97,8 @@ class NotificationHandler(NotificationHandlerBase):
                         raise Exception(
                             "notification with unsupported resource type:{0}".format(resource_type))
                     this_delivery_time = notification_info['EventTimestamp']
-                    # Get subscriptions from DB to deliver notification to
-                    entries = subscription_repo.get(Status=1, ResourceType=resource_type)
+                    entries = self.subscription_index.match(
+                        node_name, resource_type=resource_type)
                 else:
                     parent_key = list(notification_info.keys())[0]
                     source = notification_info[parent_key].get('source', None)
@@ -71,13 +107,8 @@ class NotificationHandler(NotificationHandlerBase):
                     this_delivery_time = notification_info[parent_key].get('time')
                     if not resource_address:
                         raise Exception("No resource address in notification source".format(source))
-                    _, node_name, _, _, _ = subscription_helper.parse_resource_address(resource_address)
-                    # Get subscriptions from DB to deliver notification to.
-                    # Unable to filter on resource_address here because resource_address may contain
-                    # either an unknown node name (ie. controller-0) or a '/./' resulting in entries
-                    # being missed. Instead, filter these v2 subscriptions in the for loop below once
-                    # the resource path has been obtained.
-                    entries = subscription_repo.get(Status=1)
+                    node_name, resource_path = split_resource_address(resource_address)
+                    entries = self.subscription_index.match(node_name, resource_path)
             elif isinstance(notification_info, list):
                 LOG.debug("Handle list")
                 for item in notification_info:
@@ -87,61 +118,71 @@ class NotificationHandler(NotificationHandlerBase):
                     this_delivery_time = item.get('time')
                     if not resource_address:
                         raise Exception("No resource address in notification source".format(source))
-                    _, node_name, _, _, _ = subscription_helper.parse_resource_address(resource_address)
-                    entries = subscription_repo.get(Status=1)
-
-            for entry in entries:
-                subscriptionid = entry.SubscriptionId
-                if entry.ResourceAddress:
-                    _, entry_node_name, entry_resource_path, _, _ = \
-                            subscription_helper.parse_resource_address(entry.ResourceAddress)
-                    _, _, event_resource_path, _, _ = \
-                            subscription_helper.parse_resource_address(resource_address)
-                    if not event_resource_path.startswith(entry_resource_path):
-                        continue
-                    subscription_dto2 = SubscriptionInfoV2(entry)
-                else:
-                    ResourceQualifierJson = entry.ResourceQualifierJson or '{}'
-                    ResourceQualifier = json.loads(ResourceQualifierJson)
-                    # qualify by NodeName
-                    entry_node_name = ResourceQualifier.get('NodeName', None)
-                    subscription_dto2 = SubscriptionInfoV1(entry)
-                node_name_matched = NodeInfoHelper.match_node_name(entry_node_name, node_name)
-                if not node_name_matched:
-                    continue
+                    node_name, resource_path = split_resource_address(resource_address)
+                    entries = self.subscription_index.match(node_name, resource_path)
 
+            notification_to_send = None
+            for subscriptionid, subscription_dto2 in entries:
                 try:
                     last_delivery_time = self.__get_latest_delivery_timestamp(node_name,
                                                                               subscriptionid)
                     if last_delivery_time and last_delivery_time >= this_delivery_time:
                         # skip this entry since already delivered
                         LOG.debug("Ignore the outdated notification for: {0}".format(
-                            entry.SubscriptionId))
+                            subscriptionid))
+                        continue
+                    # The daemon sends an event to the topic of its source
+                    # and to the one of all sources, only queue it once
+                    queued_time = self.notification_queued.get(
+                        (node_name, subscriptionid))
+                    if queued_time and queued_time >= this_delivery_time:
+                        LOG.debug("Ignore the notification already queued "
+                                  "for: {0}".format(subscriptionid))
                         continue
 
-                    notification_to_send = self.__format_timestamps(notification_info)
-                    LOG.info("Sending notification to subscribers: %s", notification_to_send)
-                    subscription_helper.notify(subscription_dto2, notification_to_send)
-                    LOG.info("notification is delivered successfully to {0}".format(
-                        entry.SubscriptionId))
-                    self.update_delivery_timestamp(node_name, subscriptionid, this_delivery_time)
+                    if notification_to_send is None:
+                        # Formatted once for all the subscribers, the worker
+                        # threads post it after notification_info is reused
+                        notification_to_send = self.__format_timestamps(
+                            copy.deepcopy(notification_info))
+                    LOG.info("Queueing notification to {0}: {1}".format(
+                        subscriptionid, notification_to_send))
+                    self.delivery.deliver(
+                        subscription_dto2, notification_to_send,
+                        this_delivery_time,
+                        functools.partial(self.__delivered, node_name,
+                                          subscriptionid, this_delivery_time))
+                    self.notification_queued[(node_name, subscriptionid)] = \
+                        this_delivery_time
 
                 except Exception as ex:
-                    LOG.warning("notification is not delivered to {0}:{1}".format(
-                        entry.SubscriptionId, str(ex)))
+                    LOG.warning("notification is not queued to {0}:{1}".format(
+                        subscriptionid, str(ex)))
                     # proceed to next entry
                     continue
                 finally:
                     pass
             LOG.debug("Finished notification delivery")
+            self.__log_stats()
             return True
         except Exception as ex:
             LOG.warning("Failed to delivery notification:{0}".format(str(ex)))
             return False
         finally:
             self.notification_lock.release()
-            if not subscription_repo:
-                del subscription_repo
+
+    def __log_stats(self):
+        now = time.monotonic()
+        if now - self.stats_logged_at < constants.STATS_LOG_INTERVAL:
+            return
+        self.stats_logged_at = now
+        LOG.info("Delivery queue stats: %s", self.delivery.stats())
+
+    def __delivered(self, node_name, subscriptionid, this_delivery_time):
+        # Called from the delivery workers
+        with self.notification_lock:
+            self.update_delivery_timestamp(
+                node_name, subscriptionid, this_delivery_time)
 
     def __format_timestamps(self, ptpstatus):
         if isinstance(ptpstatus, list):
@@ -57,7 +57,7 @@ class NotificationWorker:
                 location_info)
 
     def __init__(self, event, subscription_event, daemon_context,
-                 service_nodenames):
+                 service_nodenames, current_states=None):
         self.__alive = True
 
         self.daemon_context = daemon_context
@@ -76,7 +76,7 @@ class NotificationWorker:
 
         self.__locationinfo_handler = \
             NotificationWorker.LocationInfoHandler(self)
-        self.__notification_handler = NotificationHandler()
+        self.__notification_handler = NotificationHandler(current_states)
         self.broker_connection_manager = BrokerConnectionManager(
             self.__locationinfo_handler,
             self.__notification_handler,
@@ -156,6 +156,7 @@ class NotificationWorker:
             continue
 
         self.broker_connection_manager.stop()
+        self.__notification_handler.stop()
 
     def consume_location_event(self):
         nodeinfo_repo = None
@@ -265,6 +266,8 @@ class NotificationWorker:
             nodeinfo_repo = NodeRepo(autocommit=True)
             subs = subscription_repo.get()
             LOG.debug("found {0} subscriptions".format(subs.count()))
+            # keep the notification fan-out in sync with the subscriptions
+            self.__notification_handler.refresh_subscriptions(subs)
             broker_state_changed = \
                 self.broker_state_manager.refresh_by_subscriptions(subs)
             if broker_state_changed:
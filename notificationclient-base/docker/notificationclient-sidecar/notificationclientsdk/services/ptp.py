@@ -12,8 +12,6 @@ from datetime import datetime
 import kombu
 import oslo_messaging
 import requests
-from notificationclientsdk.client.notificationservice import \
-    NotificationServiceClient
 from notificationclientsdk.common.helpers import (constants, log_helper,
                                                   subscription_helper)
 from notificationclientsdk.common.helpers.nodeinfo_helper import NodeInfoHelper
@@ -35,11 +33,16 @@ class PtpService(object):
     def __init__(self, daemon_control):
         self.daemon_control = daemon_control
         self.locationservice_client = daemon_control.locationservice_client
+        self.notificationservice_clients = \
+            daemon_control.notificationservice_clients
+        self.current_state_cache = daemon_control.current_state_cache
         self.subscription_repo = SubscriptionRepo(autocommit=False)
 
     def __del__(self):
         del self.subscription_repo
         self.locationservice_client = None
+        self.notificationservice_clients = None
+        self.current_state_cache = None
 
     def __query_locationinfo(self, broker_name, timeout=5, retry=2):
         try:
@@ -81,6 +84,12 @@ class PtpService(object):
 
     def query(self, broker_name, resource_address=None, optional=None):
         default_node_name = NodeInfoHelper.default_node_name(broker_name)
+        # Answered from memory while the last response is fresh
+        ptpstatus = self.current_state_cache.get(
+            default_node_name, resource_address, optional)
+        if ptpstatus is not None:
+            return ptpstatus
+
         broker_pod_ip, supported_resource_types = self.__get_node_info(
             default_node_name)
 
@@ -95,8 +104,12 @@ class PtpService(object):
             raise client_exception.ResourceNotAvailable(broker_name,
                                                         ResourceType.TypePTP)
 
-        return self._query(default_node_name, broker_pod_ip,
-                           resource_address, optional)
+        ptpstatus = self._query(default_node_name, broker_pod_ip,
+                                resource_address, optional)
+        if ptpstatus:
+            self.current_state_cache.put(
+                default_node_name, resource_address, optional, ptpstatus)
+        return ptpstatus
 
     def _query(self, broker_name, broker_pod_ip, resource_address=None,
                optional=None):
@@ -115,10 +128,12 @@ class PtpService(object):
             self.daemon_control.daemon_context['NOTIFICATION_BROKER_PASS'],
             broker_host,
             self.daemon_control.daemon_context['NOTIFICATION_BROKER_PORT'])
-        notificationservice_client = None
+        # The client of the broker is shared by the requests and kept
+        # connected, unless the request fails. Every request releases it,
+        # the last one closes a failed client
+        notificationservice_client = self.notificationservice_clients.get(
+            broker_name, broker_pod_ip, broker_transport_endpoint)
         try:
-            notificationservice_client = NotificationServiceClient(
-                broker_name, broker_transport_endpoint, broker_pod_ip)
             resource_status = notificationservice_client.query_resource_status(
                 ResourceType.TypePTP, timeout=5, retry=10,
                 resource_address=resource_address, optional=optional)
@@ -126,15 +141,18 @@ class PtpService(object):
         except oslo_messaging.exceptions.MessagingTimeout as ex:
             LOG.warning("ptp status is not available "
                         "@node {0} due to {1}".format(broker_name, str(ex)))
+            self.notificationservice_clients.discard(
+                broker_pod_ip, notificationservice_client)
             raise client_exception.ResourceNotAvailable(broker_name,
                                                         ResourceType.TypePTP)
         except kombu.exceptions.OperationalError:
             LOG.warning("Node {0} is unreachable yet".format(broker_name))
+            self.notificationservice_clients.discard(
+                broker_pod_ip, notificationservice_client)
             raise client_exception.NodeNotAvailable(broker_name)
         finally:
-            if notificationservice_client:
-                notificationservice_client.cleanup()
-                del notificationservice_client
+            self.notificationservice_clients.release(
+                broker_pod_ip, notificationservice_client)
 
     def _match_resource_address(self, resource_address_a, resource_address_b):
 
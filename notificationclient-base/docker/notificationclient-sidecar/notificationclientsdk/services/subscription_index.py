@@ -0,0 +1,160 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+In-memory index of the active subscriptions for notification fan-out
+
+NotificationHandler used to read every active subscription from the
+database for each notification and parse the resource address of each of
+them to find the subscribers. SubscriptionIndex is rebuilt whenever the
+subscriptions change and keeps, per node name, a trie of the resource path
+segments subscribed to. Matching a notification walks the path of its
+resource address, so it costs the same whatever the number of subscriptions.
+
+Usage:
+    index = SubscriptionIndex()
+    index.rebuild(subscription_repo.get())
+    node_name, path = split_resource_address(resource_address)
+    for subscriptionid, subscription in index.match(node_name, path):
+        subscription_helper.notify(subscription, notification)
+"""
+
+import json
+import logging
+
+from notificationclientsdk.common.helpers import constants, log_helper
+from notificationclientsdk.common.helpers.nodeinfo_helper import NodeInfoHelper
+from notificationclientsdk.model.dto.subscription import SubscriptionInfoV1
+from notificationclientsdk.model.dto.subscription import SubscriptionInfoV2
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+
+def split_resource_address(resource_address):
+    """Return the node name and resource path segments of an address
+
+    The format of resource address is:
+    /{clusterName}/{nodeName}(/{instance})/{resource}
+    The instance, if any, is dropped as by parse_resource_address().
+    """
+    parts = resource_address.split('/')
+    segments = tuple(part for part in parts[3:] if part)
+    if len(segments) == 4:
+        segments = segments[1:]
+    return parts[2], segments
+
+
+class _TrieNode(object):
+    __slots__ = ('children', 'subscriptions')
+
+    def __init__(self):
+        self.children = {}
+        # (subscriptionid, SubscriptionInfoV2) subscribed to this path
+        self.subscriptions = []
+
+
+class _Index(object):
+    __slots__ = ('v2', 'v1', 'subscription_ids')
+
+    def __init__(self):
+        # node name or '*' -> _TrieNode of the resource paths
+        self.v2 = {}
+        # node name or '*' -> [(resource type, subscriptionid,
+        #                       SubscriptionInfoV1)]
+        self.v1 = {}
+        self.subscription_ids = set()
+
+
+class SubscriptionIndex(object):
+    """Active subscriptions by node name and resource path
+
+    rebuild() swaps in a new index, so match() may run concurrently from
+    the listener threads without locking.
+    """
+
+    def __init__(self):
+        self._index = None
+
+    def is_built(self):
+        return self._index is not None
+
+    def subscription_ids(self):
+        index = self._index
+        if index is None:
+            return frozenset()
+        return frozenset(index.subscription_ids)
+
+    def rebuild(self, subscriptions_orm):
+        index = _Index()
+        count = 0
+        for entry in subscriptions_orm or []:
+            if entry.Status != 1:
+                continue
+            try:
+                if entry.ResourceAddress:
+                    node_name, path = split_resource_address(
+                        entry.ResourceAddress)
+                    node = index.v2.setdefault(
+                        NodeInfoHelper.expand_node_name(node_name),
+                        _TrieNode())
+                    for segment in path:
+                        node = node.children.setdefault(segment, _TrieNode())
+                    node.subscriptions.append(
+                        (entry.SubscriptionId, SubscriptionInfoV2(entry)))
+                elif entry.ResourceType:
+                    resource_qualifier = json.loads(
+                        entry.ResourceQualifierJson or '{}')
+                    node_name = resource_qualifier.get('NodeName', None)
+                    if not node_name:
+                        continue
+                    index.v1.setdefault(
+                        NodeInfoHelper.expand_node_name(node_name), []).append(
+                            (entry.ResourceType, entry.SubscriptionId,
+                             SubscriptionInfoV1(entry)))
+                else:
+                    continue
+                index.subscription_ids.add(entry.SubscriptionId)
+                count += 1
+            except Exception as ex:
+                LOG.warning("Failed to index subscription {0}: {1}".format(
+                    entry.SubscriptionId, str(ex)))
+        self._index = index
+        LOG.debug("Indexed {0} subscriptions".format(count))
+
+    def match(self, node_name, path=None, resource_type=None):
+        """Return the (subscriptionid, subscription) to notify
+
+        A notification with a resource type only goes to the v1
+        subscriptions of that type. One with a resource path goes to the v2
+        subscriptions of that path or of any parent of it, and to the v1
+        subscriptions of the node.
+        """
+        index = self._index
+        if index is None:
+            return []
+        node_names = (node_name,)
+        if node_name != constants.WILDCARD_ALL_NODES:
+            node_names += (constants.WILDCARD_ALL_NODES,)
+        matched = []
+        for name in node_names:
+            for entry_resource_type, subscriptionid, subscription in \
+                    index.v1.get(name, ()):
+                if resource_type is None or \
+                        entry_resource_type == resource_type:
+                    matched.append((subscriptionid, subscription))
+        if resource_type is not None:
+            return matched
+        for name in node_names:
+            node = index.v2.get(name)
+            if node is None:
+                continue
+            matched.extend(node.subscriptions)
+            for segment in path or ():
+                node = node.children.get(segment)
+                if node is None:
+                    break
+                matched.extend(node.subscriptions)
+        return matched
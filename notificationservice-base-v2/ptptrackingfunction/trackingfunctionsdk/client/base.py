@@ -25,9 +25,12 @@ class BrokerClientBase(object):
         self.listeners = {}
         self.broker_endpoint = RpcEndpointInfo(broker_transport_endpoint)
         self.transport = rpc_helper.get_transport(self.broker_endpoint)
+        self.rpc_clients = rpc_helper.RpcClientCache(
+            self.transport, self.broker_endpoint)
         LOG.debug("Created Broker client:{0}".format(broker_name))
 
     def __del__(self):
+        self.rpc_clients.clear()
         self.transport.cleanup()
         del self.transport
         return
@@ -37,8 +40,7 @@ class BrokerClientBase(object):
             topic=context['topic'],
             server=context['server'])
         endpoints = context['endpoints']
-        server = oslo_messaging.get_rpc_server(
-            self.transport, target, endpoints, executor=None)
+        server = rpc_helper.get_rpc_server(self.transport, target, endpoints)
         return server
 
     def _refresh(self):
@@ -90,6 +92,17 @@ class BrokerClientBase(object):
         context = self.listeners.get(topic,{}).get(server, {})
         return context.get('active', False)
 
+    def listener_stats(self):
+        """Return the request stats of each active listener by topic"""
+        stats = {}
+        for topic, servers in self.listeners.items():
+            for servername, context in servers.items():
+                rpcserver = context.get('rpcserver', None)
+                if rpcserver:
+                    stats['{0}@{1}'.format(topic, servername)] = \
+                        rpcserver.stats()
+        return stats
+
     def any_listener(self):
         for topic, servers in self.listeners.items():
             for servername, context in servers.items():
@@ -99,15 +112,15 @@ class BrokerClientBase(object):
         return False
 
     def call(self, topic, server, api_name, timeout=2, retry=0, **api_kwargs):
-        target = oslo_messaging.Target(
-            topic=topic, server=server, version=self.broker_endpoint.Version,
-            namespace=self.broker_endpoint.Namespace)
-        queryclient = oslo_messaging.get_rpc_client(self.transport, target, timeout = timeout, retry = retry)
+        queryclient = self.rpc_clients.get(
+            topic, server=server, timeout=timeout, retry=retry)
         return queryclient.call({}, api_name, **api_kwargs)
 
-    def cast(self, topic, api_name, **api_kwargs):
-        target = oslo_messaging.Target(
-            topic=topic, fanout=True, version=self.broker_endpoint.Version,
-            namespace=self.broker_endpoint.Namespace)
-        queryclient = oslo_messaging.get_rpc_client(self.transport, target)
+    def get_bound_fanout_topics(self, topics, timeout=2):
+        return rpc_helper.get_bound_fanout_topics(
+            self.broker_endpoint, topics, timeout)
+
+    def cast(self, topic, api_name, retry=None, **api_kwargs):
+        # retry=None keeps retrying until the broker is reachable
+        queryclient = self.rpc_clients.get(topic, fanout=True, retry=retry)
         queryclient.cast({}, api_name, **api_kwargs)
@@ -4,13 +4,17 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import collections
+import contextlib
 import os
 import json
+import threading
 import time
 import oslo_messaging
 from oslo_config import cfg
 
 from trackingfunctionsdk.client.base import BrokerClientBase
+from trackingfunctionsdk.client.publish_outbox import PublishOutbox
 
 import logging
 
@@ -21,6 +25,33 @@ from trackingfunctionsdk.common.helpers import log_helper, constants
 log_helper.config_logger(LOG)
 
 
+def _outbox_key(topic, ptpstatus):
+    """Return the key under which a newer status supersedes ptpstatus
+
+    That is the topic and the resource addresses the status is about, or
+    None if they cannot be told.
+    """
+    if isinstance(ptpstatus, dict) and 'ResourceType' in ptpstatus:
+        return (topic, ptpstatus['ResourceType'],
+                ptpstatus.get('ResourceQualifier', {}).get('NodeName'))
+    if isinstance(ptpstatus, list):
+        events = ptpstatus
+    elif isinstance(ptpstatus, dict):
+        events = list(ptpstatus.values())
+    else:
+        return None
+    addresses = set()
+    for event in events:
+        try:
+            for value in event['data']['values']:
+                addresses.add(value['ResourceAddress'])
+        except (KeyError, TypeError, AttributeError):
+            return None
+    if not addresses:
+        return None
+    return topic, frozenset(addresses)
+
+
 class PtpEventProducer(object):
     class ListenerEndpoint(object):
         target = oslo_messaging.Target(namespace='notification', version='1.0')
@@ -57,6 +88,13 @@ class PtpEventProducer(object):
                 'AllPtpEventProducer', registration_broker_transport_endpoint)
         else:
             self.registration_broker_client = None
+        self._batch = threading.local()
+        self.local_outbox = None
+        self.registration_outbox = None
+        if constants.PUBLISH_MODE == constants.PUBLISH_ASYNC:
+            self.local_outbox = PublishOutbox('local', self.__cast_local)
+            self.registration_outbox = PublishOutbox(
+                'registration', self.__cast_all)
         return
 
     def __del__(self):
@@ -76,10 +114,110 @@ class PtpEventProducer(object):
                                           retry) if self.registration_broker_client else result
         return result1, result2
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Send the status published within the block as one batch
+
+        Nothing is cast until the block exits. Standard format
+        notifications of one source published to the same topic are then
+        merged into a single list, oldest first, and an event published
+        twice to a topic is only sent once. Any other status is sent as
+        is, in the order it was published.
+        """
+        if getattr(self._batch, 'pending', None) is not None:
+            # Nested batches are sent with the outermost one
+            yield
+            return
+        self._batch.pending = []
+        try:
+            yield
+        finally:
+            pending = self._batch.pending
+            self._batch.pending = None
+            self.__send_batch(pending)
+
+    def __queue(self, send, topic, ptpstatus, retry):
+        pending = getattr(self._batch, 'pending', None)
+        if pending is None:
+            return False
+        pending.append((send, topic, ptpstatus, retry))
+        return True
+
+    def __send_batch(self, pending):
+        messages = collections.OrderedDict()
+        for send, topic, ptpstatus, retry in pending:
+            sources = {event.get('source') for event in ptpstatus} \
+                if isinstance(ptpstatus, list) else set()
+            if len(sources) != 1:
+                messages[(len(messages),)] = (send, topic, ptpstatus, retry)
+                continue
+            key = (send, topic, sources.pop())
+            if key not in messages:
+                messages[key] = (send, topic, list(ptpstatus), retry)
+                continue
+            events = messages[key][2]
+            ids = {event.get('id') for event in events}
+            events.extend(event for event in ptpstatus
+                          if event.get('id') not in ids)
+        for key, (send, topic, ptpstatus, retry) in messages.items():
+            if len(key) == 3:
+                # The newest event goes last, clients take its timestamp
+                # as the delivery time of the whole list
+                ptpstatus.sort(key=lambda event: event.get('time') or 0)
+            send(topic, ptpstatus, retry)
+        if len(pending) != len(messages):
+            LOG.debug("Published %d status in %d messages",
+                      len(pending), len(messages))
+
     def publish_status_local(self, ptpstatus, source, retry=3):
         if not self.local_broker_client:
             return False
         topic = '{0}-Event-v2-{1}'.format(source, self.node_name)
+        if self.__queue(self.__send_local, topic, ptpstatus, retry):
+            return True
+        return self.__send_local(topic, ptpstatus, retry)
+
+    # The outboxes back off and retry themselves, a cast must fail rather
+    # than block their sender until the broker is back
+
+    def __cast_local(self, topic, ptpstatus):
+        self.local_broker_client.cast(
+            topic, 'NotifyStatus', retry=0, notification=ptpstatus)
+
+    def __cast_all(self, topic_all, ptpstatus):
+        self.registration_broker_client.cast(
+            topic_all, 'NotifyStatus', retry=0, notification=ptpstatus)
+
+    def publish_stats(self):
+        """Return the queue depth and counters of the publish outboxes"""
+        stats = {}
+        if self.local_outbox:
+            stats['local'] = self.local_outbox.stats()
+        if self.registration_outbox:
+            stats['registration'] = self.registration_outbox.stats()
+        return stats
+
+    def status_listener_stats(self):
+        """Return the request stats of the status listeners"""
+        stats = {}
+        if self.local_broker_client:
+            stats['local'] = self.local_broker_client.listener_stats()
+        if self.registration_broker_client:
+            stats['registration'] = \
+                self.registration_broker_client.listener_stats()
+        return stats
+
+    def stop_publishing(self):
+        """Send what the publish outboxes still hold and stop them"""
+        for outbox in (self.local_outbox, self.registration_outbox):
+            if outbox:
+                outbox.stop()
+
+    def __send_local(self, topic, ptpstatus, retry):
+        if self.local_outbox:
+            self.local_outbox.put(
+                _outbox_key(topic, ptpstatus), topic, ptpstatus)
+            return True
         server = None
         isretrystopped = False
         while not isretrystopped:
@@ -99,10 +237,31 @@ class PtpEventProducer(object):
                 ptpstatus, topic))
         return isretrystopped == False
 
+    def has_local_subscribers(self, sources, timeout=2):
+        """Return True once a client listens to any of the sources locally
+
+        Raises the broker connection errors while the broker is down.
+        """
+        if not self.local_broker_client:
+            return True
+        topics = ['{0}-Event-v2-{1}'.format(source, self.node_name)
+                  for source in sources]
+        return bool(self.local_broker_client.get_bound_fanout_topics(
+            topics, timeout))
+
     def publish_status_all(self, ptpstatus, retry=3):
         if not self.registration_broker_client:
             return False
         topic_all = 'PTP-Event-v2-*'
+        if self.__queue(self.__send_all, topic_all, ptpstatus, retry):
+            return True
+        return self.__send_all(topic_all, ptpstatus, retry)
+
+    def __send_all(self, topic_all, ptpstatus, retry):
+        if self.registration_outbox:
+            self.registration_outbox.put(
+                _outbox_key(topic_all, ptpstatus), topic_all, ptpstatus)
+            return True
         server = None
         isretrystopped = False
         while not isretrystopped:
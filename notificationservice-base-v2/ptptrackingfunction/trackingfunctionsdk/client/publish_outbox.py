@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Asynchronous status outbox for a broker
+
+PtpEventProducer used to cast every status from the daemon loop and retry
+inline, so a broker that is down stalled sampling of all other sources.
+With PUBLISH_MODE=async the status goes into a PublishOutbox instead and a
+background thread sends it.
+
+The outbox is bounded. A message queued under the key of a message that
+has not been sent yet supersedes it in place, so only the latest state of
+a resource is sent. When the outbox is full the oldest message is dropped.
+Failed sends are retried with exponential backoff, up to
+PUBLISH_MAX_ATTEMPTS times.
+
+Usage:
+    outbox = PublishOutbox('local', send)
+    outbox.put(key, topic, status)  # send(topic, status) raises on failure
+    outbox.stats()
+    # {'depth': 0, 'sent': 1, 'coalesced': 0, 'dropped': 0, 'retries': 0}
+    outbox.stop()
+"""
+
+import collections
+import itertools
+import logging
+import threading
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+
+class PublishOutbox(object):
+    """Bounded queue of status messages sent by a background thread"""
+
+    def __init__(self, name, send, max_size=constants.PUBLISH_QUEUE_SIZE,
+                 backoff=constants.PUBLISH_BACKOFF_SECONDS,
+                 max_backoff=constants.PUBLISH_BACKOFF_MAX_SECONDS,
+                 max_attempts=constants.PUBLISH_MAX_ATTEMPTS):
+        self.name = name
+        self._send = send
+        self.max_size = max(1, max_size)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        # key -> [topic, status, failed attempts]
+        self._messages = collections.OrderedDict()
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._counters = {'sent': 0, 'coalesced': 0, 'dropped': 0,
+                          'retries': 0}
+
+    def put(self, key, topic, status):
+        """Queue a status, superseding the unsent one with the same key
+
+        A key of None never supersedes anything.
+        """
+        with self._cond:
+            if key is None:
+                key = ('unkeyed', next(self._sequence))
+            if key in self._messages:
+                self._counters['coalesced'] += 1
+            elif len(self._messages) >= self.max_size:
+                _, (dropped_topic, _, _) = self._messages.popitem(last=False)
+                self._counters['dropped'] += 1
+                LOG.warning("%s outbox full, dropped status to %s",
+                            self.name, dropped_topic)
+            self._messages[key] = [topic, status, 0]
+            if self._thread is None and not self._stop_event.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name='publish-%s' % self.name,
+                    daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def stats(self):
+        """Return the queue depth and the counters"""
+        with self._cond:
+            stats = dict(self._counters)
+            stats['depth'] = len(self._messages)
+        return stats
+
+    def stop(self, timeout=2):
+        """Send what is queued once more and stop the sender"""
+        with self._cond:
+            self._stop_event.set()
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._messages and not self._stop_event.is_set():
+                    self._cond.wait()
+                if not self._messages:
+                    self._thread = None
+                    return
+                key, (topic, status, attempts) = \
+                    next(iter(self._messages.items()))
+            try:
+                self._send(topic, status)
+            except Exception as ex:
+                self._failed(key, topic, status, attempts, ex)
+                continue
+            with self._cond:
+                self._counters['sent'] += 1
+                # Unless it was superseded while being sent
+                entry = self._messages.get(key)
+                if entry is not None and entry[1] is status:
+                    del self._messages[key]
+
+    def _failed(self, key, topic, status, attempts, ex):
+        attempts += 1
+        with self._cond:
+            entry = self._messages.get(key)
+            superseded = entry is None or entry[1] is not status
+            if superseded:
+                pass
+            elif attempts >= self.max_attempts or \
+                    self._stop_event.is_set():
+                del self._messages[key]
+                self._counters['dropped'] += 1
+                LOG.error("%s outbox gave up on status to %s after %d "
+                          "attempts: %s", self.name, topic, attempts, ex)
+                return
+            else:
+                entry[2] = attempts
+                self._counters['retries'] += 1
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempts - 1))
+        LOG.warning("%s outbox failed to publish to %s, retrying in %.1fs: "
+                    "%s", self.name, topic, delay, ex)
+        self._stop_event.wait(delay)
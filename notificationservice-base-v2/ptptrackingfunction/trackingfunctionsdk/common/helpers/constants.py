@@ -77,11 +77,80 @@ PHC2SYS_DEFAULT_CONFIG = PHC2SYS_CONFIG_PATH + "phc2sys-phc2sys-legacy.conf"
 
 # External paths
 VAR_RUN_PATH = "/var/run"
+HOST_PROC_PATH = "/host/proc"
 
 # Linux PTP tools
 PHC_CTL_PATH = "/usr/sbin/phc_ctl"
 PMC_PATH = "/usr/sbin/pmc"
 
+# Command execution
+COMMAND_TIMEOUT = 5  # seconds
+COMMAND_TIMEOUT_ERRCODE = 124
+COMMAND_NOT_FOUND_ERRCODE = 127
+
+# PMC client selection: 'subprocess' forks pmc for every query, 'native'
+# keeps a management session open on the ptp4l Unix domain socket
+PMC_CLIENT_SUBPROCESS = "subprocess"
+PMC_CLIENT_NATIVE = "native"
+PMC_CLIENT_MODE = os.environ.get("PMC_CLIENT_MODE", PMC_CLIENT_SUBPROCESS)
+PMC_CLIENT_TIMEOUT = 0.5  # seconds to wait for all management responses
+# Push mode: subscribe to ptp4l port state and parent data set events and
+# wake the daemon as soon as they arrive. Requires the native PMC client
+# protocol, polling continues as a safety net.
+PMC_SUBSCRIBE_EVENTS = \
+    os.environ.get("PMC_SUBSCRIBE_EVENTS", "false").lower() == "true"
+PMC_SUBSCRIBE_DURATION = 180  # seconds, renewed at half time
+PMC_SUBSCRIBE_RETRY = 5  # seconds between attempts while ptp4l is down
+
+# PHC to CLOCK_REALTIME comparison: 'subprocess' forks phc_ctl cmp for every
+# poll, 'native' keeps the PHC device open and compares in-process
+PHC_OFFSET_SUBPROCESS = "subprocess"
+PHC_OFFSET_NATIVE = "native"
+PHC_OFFSET_MODE = os.environ.get("PHC_OFFSET_MODE", PHC_OFFSET_SUBPROCESS)
+PHC_OFFSET_SAMPLES = 9  # offset of the tightest sample is used
+
+# Adaptive polling: sources in Holdover or close to their offset threshold
+# are polled every POLL_FAST_SECONDS, sources Locked for longer than
+# POLL_STABLE_SECONDS every POLL_SLOW_SECONDS, all others at their
+# poll_freq_seconds
+POLL_FAST_SECONDS = float(os.environ.get("POLL_FAST_SECONDS", 0.5))
+POLL_SLOW_SECONDS = float(os.environ.get("POLL_SLOW_SECONDS", 10))
+POLL_STABLE_SECONDS = float(os.environ.get("POLL_STABLE_SECONDS", 60))
+# Fraction of the offset threshold above which an offset counts as close
+POLL_NEAR_THRESHOLD_RATIO = 0.5
+
+# The initial status is published as soon as a notification client has
+# bound its fanout queue on the local broker, or after BROKER_READY_TIMEOUT
+# seconds at the latest
+BROKER_READY_TIMEOUT = float(os.environ.get("BROKER_READY_TIMEOUT", 10))
+BROKER_READY_POLL_INTERVAL = 0.5
+# RPC clients kept per broker connection, one per topic and server
+RPC_CLIENT_CACHE_SIZE = 64
+
+# Status publishing: 'sync' casts from the daemon loop and retries inline,
+# 'async' hands the status to a bounded outbox per broker that a background
+# thread sends, retrying with exponential backoff
+PUBLISH_SYNC = "sync"
+PUBLISH_ASYNC = "async"
+PUBLISH_MODE = os.environ.get("PUBLISH_MODE", PUBLISH_SYNC)
+PUBLISH_QUEUE_SIZE = int(os.environ.get("PUBLISH_QUEUE_SIZE", 256))
+PUBLISH_BACKOFF_SECONDS = 0.5  # doubled after every failed attempt
+PUBLISH_BACKOFF_MAX_SECONDS = 30
+PUBLISH_MAX_ATTEMPTS = 8
+
+# Status requests (QueryStatus, TriggerDelivery) are handled by RPC_WORKERS
+# threads per listener. Up to RPC_QUEUE_SIZE more wait for a worker; beyond
+# that the listener handles the request itself and stops reading the queue
+# until it is done
+RPC_WORKERS = int(os.environ.get("RPC_WORKERS", 8))
+RPC_QUEUE_SIZE = int(os.environ.get("RPC_QUEUE_SIZE", 32))
+# TriggerDelivery requests arriving within TRIGGER_COALESCE_SECONDS of the
+# first one are served by a single republish of the sources they asked for
+TRIGGER_COALESCE_SECONDS = float(
+    os.environ.get("TRIGGER_COALESCE_SECONDS", 1))
+# Seconds between logging the publish and status request stats
+STATS_LOG_INTERVAL = float(os.environ.get("STATS_LOG_INTERVAL", 300))
+
 CLOCK_REALTIME = "CLOCK_REALTIME"
 
 PHC2SYS_TOLERANCE_LOW = 36999999000
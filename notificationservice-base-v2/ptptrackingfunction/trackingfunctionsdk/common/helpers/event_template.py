@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Precomputed CloudEvent templates for status notifications
+
+Every status published by the daemon or returned to a pull query is the
+same nested CloudEvent for a given (node, source, instance); only its id,
+time and value change. EventTemplate holds the parts that never change,
+including the formatted resource address, and render() stamps out a
+payload for a new value.
+
+Usage:
+    templates = EventTemplateCache('controller-0')
+    templates.build(daemon_context)
+    template = templates.get(constants.SOURCE_SYNC_PTP_LOCK_STATE, 'ptp1')
+    event = template.render(time.time(), PtpState.Locked)
+"""
+
+import threading
+
+from oslo_utils import uuidutils
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import ptpsync as utils
+
+# Event source to event type mapping
+SOURCE_TYPE = {
+    constants.SOURCE_SYNC_GNSS_SYNC_STATUS:
+        'event.sync.gnss-status.gnss-state-change',
+    constants.SOURCE_SYNC_PTP_CLOCK_CLASS:
+        'event.sync.ptp-status.ptp-clock-class-change',
+    constants.SOURCE_SYNC_PTP_LOCK_STATE:
+        'event.sync.ptp-status.ptp-state-change',
+    constants.SOURCE_SYNC_OS_CLOCK:
+        'event.sync.sync-status.os-clock-sync-state-change',
+    constants.SOURCE_SYNC_SYNC_STATE:
+        'event.sync.sync-status.synchronization-state-change',
+    constants.SOURCE_SYNCE_CLOCK_QUALITY:
+        'event.sync.synce-status.synce-clock-quality-change',
+    constants.SOURCE_SYNCE_LOCK_STATE_EXTENDED:
+        'event.sync.synce-status.synce-state-change-extended',
+    constants.SOURCE_SYNCE_LOCK_STATE:
+        'event.sync.synce-status.synce-state-change',
+}
+
+# Sources reporting a metric rather than a state
+METRIC_SOURCES = (constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
+                  constants.SOURCE_SYNCE_CLOCK_QUALITY)
+
+# Daemon context instance list for each per-instance source
+INSTANCE_SOURCES = {
+    'GNSS_INSTANCES': (constants.SOURCE_SYNC_GNSS_SYNC_STATUS,),
+    'PTP4L_INSTANCES': (constants.SOURCE_SYNC_PTP_LOCK_STATE,
+                        constants.SOURCE_SYNC_PTP_CLOCK_CLASS),
+    'SYNCE_INSTANCES': (constants.SOURCE_SYNCE_LOCK_STATE,
+                        constants.SOURCE_SYNCE_CLOCK_QUALITY),
+}
+
+NODE_SOURCES = (constants.SOURCE_SYNC_OS_CLOCK,
+                constants.SOURCE_SYNC_SYNC_STATE)
+
+
+class EventTemplate(object):
+    """The unchanging part of the status event of a resource"""
+
+    __slots__ = ('source', 'type', 'resource_address', 'data_type',
+                 'value_type')
+
+    def __init__(self, node_name, source, instance=None,
+                 value_type=None):
+        if source in METRIC_SOURCES:
+            self.data_type = constants.DATA_TYPE_METRIC
+            self.value_type = constants.VALUE_TYPE_METRIC
+        else:
+            self.data_type = constants.DATA_TYPE_NOTIFICATION
+            self.value_type = constants.VALUE_TYPE_ENUMERATION
+        if value_type is not None:
+            self.value_type = value_type
+        self.source = source
+        self.type = SOURCE_TYPE[source]
+        self.resource_address = utils.format_resource_address(
+            node_name, source, instance)
+
+    def render(self, event_time, value, data_type=None):
+        """Return a new event reporting value at event_time
+
+        Enumerated values are upper-cased, metrics are sent as given.
+        """
+        if self.value_type == constants.VALUE_TYPE_ENUMERATION:
+            value = value.upper()
+        return {
+            'id': uuidutils.generate_uuid(),
+            'specversion': constants.SPEC_VERSION,
+            'source': self.source,
+            'type': self.type,
+            'time': event_time,
+            'data': {
+                'version': constants.DATA_VERSION,
+                'values': [
+                    {
+                        'data_type': data_type or self.data_type,
+                        'ResourceAddress': self.resource_address,
+                        'value_type': self.value_type,
+                        'value': value
+                    }
+                ]
+            }
+        }
+
+
+class EventTemplateCache(object):
+    """Templates of a daemon, keyed by (node, source, instance)
+
+    Pull queries may name the node differently (e.g. '.'), so templates
+    of other nodes are cached on first use, up to max_size of them.
+    """
+
+    def __init__(self, node_name, max_size=256):
+        self.node_name = node_name
+        self.max_size = max_size
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def build(self, daemon_context):
+        """Build the templates of this node for the configured instances
+
+        Templates of instances no longer configured are dropped.
+        """
+        templates = {}
+        for source in NODE_SOURCES:
+            key = (self.node_name, source, None)
+            templates[key] = EventTemplate(self.node_name, source)
+        for instances_key, sources in INSTANCE_SOURCES.items():
+            for instance in daemon_context.get(instances_key) or []:
+                for source in sources:
+                    key = (self.node_name, source, instance)
+                    templates[key] = EventTemplate(
+                        self.node_name, source, instance)
+        with self._lock:
+            self._templates = templates
+
+    def get(self, source, instance=None, node_name=None):
+        """Return the template of a resource, building it if needed"""
+        key = (node_name or self.node_name, source, instance)
+        template = self._templates.get(key)
+        if template is None:
+            template = EventTemplate(key[0], source, instance)
+            with self._lock:
+                if len(self._templates) < self.max_size:
+                    self._templates[key] = template
+        return template
@@ -5,14 +5,14 @@
 #
 import logging
 import datetime
-import os.path
 import re
 
 from abc import ABC, abstractmethod
 
 from trackingfunctionsdk.common.helpers import constants
 from trackingfunctionsdk.common.helpers import log_helper
-from trackingfunctionsdk.common.helpers import ptpsync as utils
+from trackingfunctionsdk.common.helpers import phc_index
+from trackingfunctionsdk.common.helpers import process_info
 from trackingfunctionsdk.common.helpers.cgu_handler import CguHandler
 from trackingfunctionsdk.common.helpers.instance_config_parser import get_instance_holdover_time
 from trackingfunctionsdk.model.dto.gnssstate import GnssState
@@ -77,12 +77,8 @@ class GnssMonitor(Observer):
             self.gnss_pps_state = self.gnss_cgu_handler.get_pps_status()
 
     def set_ptp_devices(self):
-        ptp_devices = set()
-        phc_interfaces = self._check_config_file_interfaces()
-        for phc_interface in phc_interfaces:
-            ptp_device = utils.get_interface_phc_device(phc_interface)
-            if ptp_device is not None:
-                ptp_devices.add(ptp_device)
+        ptp_devices = phc_index.get_config_ptp_devices(
+            self.config_file, self._check_config_file_interfaces)
         self.ptp_devices = list(ptp_devices)
         LOG.debug("TS2PHC PTP devices are %s", self.ptp_devices)
 
@@ -116,8 +112,7 @@ class GnssMonitor(Observer):
         """Set GNSS Status based on CGU information"""
 
         # Check that ts2phc is running, else Freerun
-        pid_file = f'/var/run/ts2phc-{self.ts2phc_service_name}.pid'
-        if not os.path.isfile(pid_file):
+        if not process_info.is_running(f'ts2phc-{self.ts2phc_service_name}'):
             LOG.warning("TS2PHC instance %s is not running, "
                         "reporting GNSS unlocked.", self.ts2phc_service_name)
             self._state = GnssState.Failure_Nofix
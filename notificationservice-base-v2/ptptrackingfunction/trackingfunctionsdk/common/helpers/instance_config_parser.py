@@ -33,10 +33,14 @@ Functions:
         (OS_CLOCK_HOLDOVER_SECONDS -> config -> default)
     get_overall_holdover_time: Overall holdover (OVERALL_HOLDOVER_SECONDS -> default)
     get_instance_offset_threshold: Get offset threshold for specific instance
+    get_monitoring_config: Parsed snapshot of the whole configuration file,
+        swapped by reload_monitoring_config() when the file changes
 """
 
 import logging
 import os
+import types
+
 from trackingfunctionsdk.common.helpers import constants
 from trackingfunctionsdk.common.helpers import log_helper
 
@@ -145,48 +149,121 @@ def get_instance_offset_threshold(
     return _get_instance_config_value(instance_name, key, default_threshold)
 
 
+class MonitoringConfig:
+    """Immutable parsed snapshot of instance-monitoring.conf
+
+    sections maps each [instance] to its key/value strings. The first
+    value of a key within a section wins.
+    """
+
+    def __init__(self, path, sections, stat_key=None, exists=True):
+        self.path = path
+        self.stat_key = stat_key
+        self.exists = exists
+        self._sections = types.MappingProxyType({
+            name: types.MappingProxyType(values)
+            for name, values in sections.items()})
+
+    def section(self, instance_name):
+        return self._sections.get(instance_name, _EMPTY_SECTION)
+
+    def get(self, instance_name, key):
+        return self.section(instance_name).get(key)
+
+
+_EMPTY_SECTION = types.MappingProxyType({})
+_snapshot = None
+
+
+def _stat_key(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+
+def _parse_monitoring_config(path):
+    """Parse instance-monitoring.conf into a MonitoringConfig"""
+    stat_key = _stat_key(path)
+    if not os.path.exists(path):
+        return MonitoringConfig(path, {}, stat_key, exists=False)
+
+    sections = {}
+    current_section = None
+    with open(path, 'r', encoding='utf-8') as config_file:
+        for line in config_file:
+            line = line.strip()
+
+            # Skip empty lines and comments
+            if not line or line.startswith('#'):
+                continue
+
+            # Parse section headers
+            if line.startswith('[') and line.endswith(']'):
+                current_section = sections.setdefault(line[1:-1], {})
+                continue
+
+            # Parse key-value pairs
+            parts = line.split()
+            if current_section is not None and len(parts) >= 2:
+                current_section.setdefault(parts[0], parts[1])
+    return MonitoringConfig(path, sections, stat_key)
+
+
+def reload_monitoring_config():
+    """Parse instance-monitoring.conf again and swap in the new snapshot
+
+    Called by the config watcher when a config file changes. Raises
+    OSError if the file exists but cannot be read.
+    """
+    global _snapshot
+    _snapshot = _parse_monitoring_config(constants.INSTANCE_CONFIG_PATH)
+    return _snapshot
+
+
+def get_monitoring_config():
+    """Return the current instance-monitoring.conf snapshot
+
+    The snapshot is kept while the file is unchanged, a single stat()
+    catches edits the config watcher has not reported yet.
+    """
+    snapshot = _snapshot
+    path = constants.INSTANCE_CONFIG_PATH
+    if (snapshot is not None and snapshot.path == path and
+            snapshot.stat_key is not None and
+            snapshot.stat_key == _stat_key(path)):
+        return snapshot
+    return reload_monitoring_config()
+
+
 def _get_instance_config_value(instance_name, key, default_value):
     """Get a specific config value for an instance"""
 
-    if not os.path.exists(constants.INSTANCE_CONFIG_PATH):
-        LOG.warning("Instance config file not found: %s, using default %s=%s",
-                    constants.INSTANCE_CONFIG_PATH, key, default_value)
+    try:
+        config = get_monitoring_config()
+    except OSError as file_error:
+        LOG.error("Error reading instance config: %s, using default %s=%s",
+                  file_error, key, default_value)
         return default_value
 
-    try:
-        current_section = None
-        with open(constants.INSTANCE_CONFIG_PATH, 'r', encoding='utf-8') as config_file:
-            for line in config_file:
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-
-                # Parse section headers
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1]
-                    continue
-
-                # Parse key-value pairs in the target section
-                if current_section == instance_name and line.startswith(
-                        key + ' '):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        value = int(parts[1])
-                        LOG.info("Instance %s: Using %s=%s from config",
-                                 instance_name, key, value)
-                        return value
+    if not config.exists:
+        LOG.warning("Instance config file not found: %s, using default %s=%s",
+                    config.path, key, default_value)
+        return default_value
 
+    raw_value = config.get(instance_name, key)
+    if raw_value is None:
         LOG.warning("Instance %s or %s not found in config, using default %s",
                     instance_name, key, default_value)
         return default_value
 
-    except (ValueError, IndexError) as parse_error:
+    try:
+        value = int(raw_value)
+    except ValueError as parse_error:
         LOG.error("Error parsing config value for %s.%s: %s, using default %s",
                   instance_name, key, parse_error, default_value)
         return default_value
-    except OSError as file_error:
-        LOG.error("Error reading instance config: %s, using default %s=%s",
-                  file_error, key, default_value)
-        return default_value
+    LOG.info("Instance %s: Using %s=%s from config",
+             instance_name, key, value)
+    return value
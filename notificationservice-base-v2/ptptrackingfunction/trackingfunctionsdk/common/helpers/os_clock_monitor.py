@@ -9,10 +9,14 @@ import logging
 import os
 import re
 import socket
-import subprocess
+import threading
+import time
 
 from trackingfunctionsdk.common.helpers import log_helper
 from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import phc_clock
+from trackingfunctionsdk.common.helpers import poll_scheduler
+from trackingfunctionsdk.common.helpers import process_info
 from trackingfunctionsdk.model.dto.osclockstate import OsClockState
 from trackingfunctionsdk.common.helpers import ptpsync as utils
 from trackingfunctionsdk.common.helpers.instance_config_parser import (
@@ -23,7 +27,23 @@ LOG = logging.getLogger(__name__)
 log_helper.config_logger(LOG)
 
 
+def next_leap_second_boundary(timestamp):
+    """Return the next 1 January or 1 July 00:00 UTC after timestamp
+
+    Leap seconds are only ever inserted at the end of June or December.
+    """
+    now = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+    if now.month < 7:
+        boundary = now.replace(month=7, day=1, hour=0, minute=0, second=0,
+                               microsecond=0)
+    else:
+        boundary = now.replace(year=now.year + 1, month=1, day=1, hour=0,
+                               minute=0, second=0, microsecond=0)
+    return boundary.timestamp()
+
+
 class OsClockMonitor:
+    _phc_clock = None
 
     def __init__(self, phc2sys_config, init=True, tolerance_threshold=None,
                  holdover_time=30):
@@ -41,6 +61,13 @@ class OsClockMonitor:
 
         self.phc2sys_tolerance_low = constants.PHC2SYS_TOLERANCE_LOW
         self.phc2sys_tolerance_high = constants.PHC2SYS_TOLERANCE_HIGH
+        self.utc_offset_nanoseconds = None
+        self._utc_offset_key = None
+        self._utc_offset_expiry = 0
+        # Bumped by invalidate_utc_offset(), so a refresh running meanwhile
+        # does not keep the offset it read
+        self._utc_offset_generation = 0
+        self._utc_offset_lock = threading.Lock()
         # Either take the tolerance threshold from the config file or use the
         # default value if not provided.
         self.phc2sys_tolerance_threshold = (
@@ -155,6 +182,22 @@ class OsClockMonitor:
         LOG.debug("Phc2sys HA interface: %s ptp_device: %s",
                   self.phc_interface, self.ptp_device)
 
+    def _query_pmc(self, uds_addr, domain_number, command):
+        """Run a pmc GET against ptp4l and return its decoded output
+
+        Returns None if pmc fails, times out or cannot be started.
+        """
+        out, err, errcode, _ = utils.run_command([
+            constants.PMC_PATH, '-s', uds_addr,
+            '-u', '-b', '0', '-d', str(domain_number),
+            command
+        ])
+        if errcode != 0:
+            LOG.warning("Failed to query PMC for %s: %s",
+                        command.split()[-1], err.decode(errors='replace'))
+            return None
+        return out.decode()
+
     def _is_grandmaster(self, uds_addr, domain_number):
         """Determine if this node is a grandmaster.
 
@@ -165,24 +208,14 @@ class OsClockMonitor:
         Returns:
             bool: True if this node is the grandmaster, False otherwise.
         """
-        try:
-            parent_data = subprocess.check_output([
-                constants.PMC_PATH, '-s', uds_addr,
-                '-u', '-b', '0', '-d', domain_number,
-                'GET PARENT_DATA_SET'
-            ]).decode()
-        except subprocess.CalledProcessError as ex:
-            LOG.warning("Failed to query PMC for PARENT_DATA_SET: %s", ex)
+        parent_data = self._query_pmc(uds_addr, domain_number,
+                                      'GET PARENT_DATA_SET')
+        if parent_data is None:
             return False
 
-        try:
-            default_data = subprocess.check_output([
-                constants.PMC_PATH, '-s', uds_addr,
-                '-u', '-b', '0', '-d', domain_number,
-                'GET DEFAULT_DATA_SET'
-            ]).decode()
-        except subprocess.CalledProcessError as ex:
-            LOG.warning("Failed to query PMC for DEFAULT_DATA_SET: %s", ex)
+        default_data = self._query_pmc(uds_addr, domain_number,
+                                       'GET DEFAULT_DATA_SET')
+        if default_data is None:
             return False
 
         gm_identity = None
@@ -213,6 +246,12 @@ class OsClockMonitor:
         return False
 
     def set_utc_offset(self, pidfile_path="/var/run/"):
+        """Determine the UTC offset and the phc2sys tolerance bounds
+
+        Returns False if the offset is only a fallback because ptp4l could
+        not be queried or no leapfile was found, True otherwise.
+        """
+        authoritative = True
         # Check command line options for offset
         utc_offset = self._get_phc2sys_command_line_option(pidfile_path, '-O')
         domain_number = self._get_phc2sys_command_line_option(pidfile_path, '-n')
@@ -252,11 +291,11 @@ class OsClockMonitor:
                 grand_master = self._is_grandmaster(uds_addr, domain_number)
                 # If not a grandmaster, we get UTC Offset from pmc if it's valid
                 if not grand_master:
-                    data = subprocess.check_output([
-                        constants.PMC_PATH, '-s', uds_addr,
-                        '-u', '-b', '0', '-d', domain_number,
-                        'GET TIME_PROPERTIES_DATA_SET'
-                    ]).decode()
+                    data = self._query_pmc(uds_addr, domain_number,
+                                           'GET TIME_PROPERTIES_DATA_SET')
+                    if data is None:
+                        authoritative = False
+                        data = ''
 
                     for line in data.split('\n'):
                         if 'currentUtcOffset ' in line:
@@ -272,6 +311,7 @@ class OsClockMonitor:
                                  utc_offset_valid, utc_offset,
                                  constants.LEAP_FILE_PATH)
                     else:
+                        authoritative = False
                         utc_offset = constants.UTC_OFFSET
                         LOG.warning('currentUtcOffsetValid is %s, and could '
                                     'not read value from leapfile, using the '
@@ -279,6 +319,9 @@ class OsClockMonitor:
                                     utc_offset_valid, utc_offset)
 
         utc_offset_nanoseconds = abs(int(utc_offset)) * 1000000000
+        if utc_offset_nanoseconds == self.utc_offset_nanoseconds:
+            return authoritative
+        self.utc_offset_nanoseconds = utc_offset_nanoseconds
         self.phc2sys_tolerance_low = utc_offset_nanoseconds - \
             self.phc2sys_tolerance_threshold
         self.phc2sys_tolerance_high = utc_offset_nanoseconds + \
@@ -288,6 +331,48 @@ class OsClockMonitor:
                   utc_offset_nanoseconds, self.phc2sys_tolerance_threshold)
         LOG.info('phc2sys_tolerance_low is %s, phc2sys_tolerance_high is %s',
                  self.phc2sys_tolerance_low, self.phc2sys_tolerance_high)
+        return authoritative
+
+    def refresh_utc_offset(self, pidfile_path="/var/run/"):
+        """Run set_utc_offset() only if the offset may have changed
+
+        The UTC offset only moves on a leap second, so the last value is
+        kept until phc2sys restarts, its config file or source interface
+        changes, a leap second boundary passes, or invalidate_utc_offset()
+        is called. Fallback values are never kept.
+        """
+        key = self._utc_offset_cache_key(pidfile_path)
+        now = time.time()
+        with self._utc_offset_lock:
+            if key == self._utc_offset_key and \
+                    now < self._utc_offset_expiry:
+                return
+            generation = self._utc_offset_generation
+        authoritative = self.set_utc_offset(pidfile_path)
+        with self._utc_offset_lock:
+            if authoritative and generation == self._utc_offset_generation:
+                self._utc_offset_key = key
+                self._utc_offset_expiry = next_leap_second_boundary(now)
+            else:
+                self._utc_offset_key = None
+
+    def invalidate_utc_offset(self):
+        """Make the next poll determine the UTC offset again
+
+        May be called while a poll is refreshing the offset.
+        """
+        with self._utc_offset_lock:
+            self._utc_offset_generation += 1
+            self._utc_offset_key = None
+
+    def _utc_offset_cache_key(self, pidfile_path):
+        pid = process_info.get_pid("phc2sys-" + self.phc2sys_instance,
+                                   pidfile_path)
+        try:
+            config_mtime = os.stat(self.phc2sys_config).st_mtime
+        except OSError:
+            config_mtime = None
+        return pid, config_mtime, self.phc_interface
 
     def get_os_clock_time_source(self, pidfile_path="/var/run/"):
         """Determine which PHC is disciplining the OS clock"""
@@ -307,27 +392,13 @@ class OsClockMonitor:
             self.ptp_device = self._get_interface_phc_device()
 
     def _get_phc2sys_command_line_option(self, pidfile_path, flag):
-        pidfile = pidfile_path + "phc2sys-" + self.phc2sys_instance + ".pid"
-        try:
-            with open(pidfile, 'r', encoding='utf-8') as pidfile_handle:
-                pid = pidfile_handle.readline().strip()
-            # Get command line params
-            cmdline_file = "/host/proc/" + pid + "/cmdline"
-            with open(cmdline_file, 'r', encoding='utf-8') as cmdline_handle:
-                cmdline_args = cmdline_handle.readline().strip()
-            cmdline_args = cmdline_args.split("\x00")
-        except OSError as ex:
-            LOG.warning("Cannot open file. %s", ex)
+        service = "phc2sys-" + self.phc2sys_instance
+        info = process_info.get_process_info(service, pidfile_path)
+        if info is None:
+            LOG.warning("Cannot read command line of %s", service)
             return None
 
-        # The option value will be at the index after the flag
-        try:
-            index = cmdline_args.index(flag)
-        except ValueError as ex:
-            LOG.debug("Flag not found in cmdline args. %s", ex)
-            return None
-
-        value = cmdline_args[index + 1]
+        value = info.option(flag)
         LOG.debug("%s value is %s", flag, value)
         return value
 
@@ -365,26 +436,58 @@ class OsClockMonitor:
             LOG.warning("No PTP device. Defaulting offset value to 0.")
             self.offset = "0"
             return
-        try:
-            ptp_device_path = "/dev/" + self.ptp_device
-            offset = subprocess.check_output(
-                [constants.PHC_CTL_PATH, ptp_device_path, 'cmp']
-            ).decode().split()[-1]
-            offset = offset.strip("-ns")
-            LOG.debug("PHC offset is %s", offset)
-            self.offset = offset
-        except (subprocess.CalledProcessError, OSError) as ex:
+        ptp_device_path = "/dev/" + self.ptp_device
+        offset = None
+        if constants.PHC_OFFSET_MODE == constants.PHC_OFFSET_NATIVE:
+            try:
+                offset = self._phc_offset_native(ptp_device_path)
+            except OSError as ex:
+                LOG.warning("In-process offset read of %s failed, falling "
+                            "back to phc_ctl: %s", ptp_device_path, ex)
+        if offset is None:
+            offset = self._phc_offset_subprocess(ptp_device_path)
+        if offset is None:
             # We have seen rare instances where the ptp device cannot be read
             # but then works fine on the next attempt. Setting the offset to 0
             # here will allow the OS clock to move to holdover. If there is a
             # real fault, it will stay in holdover and tranition to freerun but
             # if it was just a single miss, it will return to locked on the
             # next check.
-            LOG.warning("Unable to read device offset for %s due to %s",
-                        ptp_device_path, ex)
             LOG.warning("Check operation of %s. Defaulting offset value to 0.",
                         ptp_device_path)
             self.offset = "0"
+            return
+        LOG.debug("PHC offset is %s", offset)
+        self.offset = offset
+
+    def _phc_offset_native(self, ptp_device_path):
+        if self._phc_clock is None or \
+                self._phc_clock.device_path != ptp_device_path:
+            # The HA source interface moved to another PHC
+            self.close_phc_clock()
+            self._phc_clock = phc_clock.PhcClock(ptp_device_path)
+        measurement = self._phc_clock.compare()
+        LOG.debug("%s offset %sns median %sns delay %sns", ptp_device_path,
+                  measurement.offset, measurement.median, measurement.delay)
+        # Same magnitude phc_ctl cmp reports once its sign is stripped
+        return str(abs(measurement.offset))
+
+    def _phc_offset_subprocess(self, ptp_device_path):
+        out, err, errcode, _ = utils.run_command(
+            [constants.PHC_CTL_PATH, ptp_device_path, 'cmp'])
+        fields = out.decode(errors='replace').split()
+        if errcode != 0 or not fields:
+            LOG.warning("Unable to read device offset for %s due to %s",
+                        ptp_device_path,
+                        err.decode(errors='replace').strip())
+            return None
+        return fields[-1].strip("-ns")
+
+    def close_phc_clock(self):
+        """Close the PHC device kept open for in-process offset reads"""
+        if self._phc_clock is not None:
+            self._phc_clock.close()
+            self._phc_clock = None
 
     def set_os_clock_state(self):
         offset_int = int(self.offset)
@@ -412,6 +515,17 @@ class OsClockMonitor:
     def get_os_clock_state(self):
         return self._state
 
+    def offset_near_threshold(self):
+        """Return True if the last offset is close to the tolerance limits"""
+        try:
+            expected = (self.phc2sys_tolerance_low +
+                        self.phc2sys_tolerance_high) // 2
+            deviation = int(self.offset) - expected
+        except (AttributeError, TypeError, ValueError):
+            return False
+        return poll_scheduler.near_threshold(
+            deviation, self.phc2sys_tolerance_threshold)
+
     def get_source_ptp_device(self):
         # PTP device that is disciplining the OS clock
         # This is also valid in case of HA source devices as
@@ -425,7 +539,7 @@ class OsClockMonitor:
         if previous_sync_state == constants.HOLDOVER_PHC_STATE:
             time_in_holdover = round(current_time - event_time)
 
-        self.set_utc_offset()
+        self.refresh_utc_offset()
         self.get_os_clock_offset()
         self.set_os_clock_state()
 
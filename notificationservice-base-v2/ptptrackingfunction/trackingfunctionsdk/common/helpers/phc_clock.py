@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+In-process comparison of a PTP hardware clock with CLOCK_REALTIME
+
+This replaces forking '/usr/sbin/phc_ctl /dev/ptpN cmp' on every poll. The
+PHC character device is opened once and kept open; each comparison takes N
+samples with the PTP_SYS_OFFSET_EXTENDED ioctl, falling back to
+PTP_SYS_OFFSET and finally to clock_gettime() on the dynamic clock id of
+the open file descriptor when the driver does not support the ioctls.
+
+Offsets follow phc_ctl: CLOCK_REALTIME minus PHC time, in nanoseconds. The
+offset of the sample with the shortest read window is the most accurate
+one and is what phc_ctl reports; the median over all samples is returned
+as well.
+
+Usage:
+    clock = PhcClock('/dev/ptp0')
+    offset, median, delay = clock.compare()
+"""
+
+import collections
+import errno
+import fcntl
+import logging
+import os
+import statistics
+import struct
+import threading
+import time
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+PhcOffset = collections.namedtuple('PhcOffset', ['offset', 'median', 'delay'])
+
+# linux/ptp_clock.h
+_PTP_MAX_SAMPLES = 25
+_PTP_CLOCK_TIME = struct.Struct('=qII')
+_PTP_SYS_OFFSET_HEADER = struct.Struct('=I3I')
+_PTP_SYS_OFFSET_SIZE = (_PTP_SYS_OFFSET_HEADER.size +
+                        (2 * _PTP_MAX_SAMPLES + 1) * _PTP_CLOCK_TIME.size)
+_PTP_SYS_OFFSET_EXTENDED_SIZE = (_PTP_SYS_OFFSET_HEADER.size +
+                                 3 * _PTP_MAX_SAMPLES * _PTP_CLOCK_TIME.size)
+_IOC_WRITE = 1
+_IOC_READ = 2
+_CLOCKFD = 3
+# errno values of drivers that lack a PTP_SYS_OFFSET variant
+_NOT_SUPPORTED = (errno.ENOTTY, errno.EOPNOTSUPP, errno.EINVAL)
+
+
+def _ioc(direction, number, size):
+    return (direction << 30) | (size << 16) | (ord('=') << 8) | number
+
+
+PTP_SYS_OFFSET = _ioc(_IOC_WRITE, 5, _PTP_SYS_OFFSET_SIZE)
+PTP_SYS_OFFSET_EXTENDED = _ioc(_IOC_READ | _IOC_WRITE, 9,
+                               _PTP_SYS_OFFSET_EXTENDED_SIZE)
+
+
+def fd_to_clockid(fd):
+    """Return the dynamic POSIX clock id of an open PHC device"""
+    return (~fd << 3) | _CLOCKFD
+
+
+def estimate_offset(samples):
+    """Reduce (sys_before, phc, sys_after) samples in ns to a PhcOffset"""
+    measured = []
+    for sys_before, phc, sys_after in samples:
+        delay = sys_after - sys_before
+        offset = (sys_before + sys_after) // 2 - phc
+        measured.append((delay, offset))
+    delay, offset = min(measured)
+    median = int(statistics.median(offset for _, offset in measured))
+    return PhcOffset(offset, median, delay)
+
+
+def _clock_time_ns(buffer, index):
+    seconds, nanoseconds, _ = _PTP_CLOCK_TIME.unpack_from(
+        buffer, _PTP_SYS_OFFSET_HEADER.size + index * _PTP_CLOCK_TIME.size)
+    return seconds * 1000000000 + nanoseconds
+
+
+class PhcClock:
+    """Open PTP hardware clock compared against CLOCK_REALTIME"""
+
+    def __init__(self, device_path, samples=None):
+        self.device_path = device_path
+        self.samples = min(samples or constants.PHC_OFFSET_SAMPLES,
+                           _PTP_MAX_SAMPLES)
+        self._fd = None
+        self._methods = [self._sys_offset_extended, self._sys_offset,
+                         self._clock_gettime]
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        fd = getattr(self, '_fd', None)
+        if fd is not None:
+            self._fd = None
+            os.close(fd)
+
+    def compare(self):
+        """Return the PhcOffset of CLOCK_REALTIME against the PHC
+
+        Raises OSError if the device cannot be opened or read; the device
+        is reopened on the next call.
+        """
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(self.device_path, os.O_RDONLY)
+            while True:
+                method = self._methods[0]
+                try:
+                    return estimate_offset(method())
+                except OSError as ex:
+                    if (len(self._methods) > 1 and
+                            ex.errno in _NOT_SUPPORTED):
+                        LOG.debug("%s: %s not supported, falling back",
+                                  self.device_path, method.__name__)
+                        self._methods.pop(0)
+                        continue
+                    self.close()
+                    raise
+
+    def _sys_offset_extended(self):
+        buffer = bytearray(_PTP_SYS_OFFSET_EXTENDED_SIZE)
+        _PTP_SYS_OFFSET_HEADER.pack_into(buffer, 0, self.samples, 0, 0, 0)
+        fcntl.ioctl(self._fd, PTP_SYS_OFFSET_EXTENDED, buffer)
+        return [tuple(_clock_time_ns(buffer, 3 * i + j) for j in range(3))
+                for i in range(self.samples)]
+
+    def _sys_offset(self):
+        buffer = bytearray(_PTP_SYS_OFFSET_SIZE)
+        _PTP_SYS_OFFSET_HEADER.pack_into(buffer, 0, self.samples, 0, 0, 0)
+        fcntl.ioctl(self._fd, PTP_SYS_OFFSET, buffer)
+        return [tuple(_clock_time_ns(buffer, 2 * i + j) for j in range(3))
+                for i in range(self.samples)]
+
+    def _clock_gettime(self):
+        clockid = fd_to_clockid(self._fd)
+        samples = []
+        for _ in range(self.samples):
+            sys_before = time.clock_gettime_ns(time.CLOCK_REALTIME)
+            phc = time.clock_gettime_ns(clockid)
+            sys_after = time.clock_gettime_ns(time.CLOCK_REALTIME)
+            samples.append((sys_before, phc, sys_after))
+        return samples
@@ -0,0 +1,187 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Memoized interface to PHC device resolution
+
+Every overall state evaluation asks each ptp4l and ts2phc monitor for the
+PHC devices of its interfaces. Resolving them used to re-read the instance
+config, re-parse ptp-interfaces.conf once per interface and glob
+/hostsys/class/net/*/device/ptp/* every time. The index is now built once
+and only rebuilt when ptp-interfaces.conf changes, the set of network
+devices in sysfs changes (checked with a single directory scan, recreated
+netdevs get new inode numbers) or invalidate() is called by the config
+watcher.
+
+Usage:
+    ptp_device = phc_index.get_phc_device('ens1f0')
+    devices = phc_index.get_config_ptp_devices(config, read_interfaces)
+"""
+
+import configparser
+import fnmatch
+import logging
+import os
+import threading
+from glob import glob
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+SYSFS_NET_PATH = "/hostsys/class/net"
+
+
+def _stat_key(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+
+def _net_signature():
+    try:
+        with os.scandir(SYSFS_NET_PATH) as entries:
+            return frozenset((entry.name, entry.inode()) for entry in entries)
+    except OSError:
+        return None
+
+
+def _phc_interfaces_file():
+    return f"{constants.PTP_CONFIG_PATH}ptp-interfaces.conf"
+
+
+class PhcIndex:
+    """Interface to PHC index and PHC device maps"""
+
+    def __init__(self):
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._key = None
+        self._phc_indexes = {}
+        self._phc_devices = []
+        self._resolved = {}
+        self._config_devices = {}
+
+    def invalidate(self):
+        """Rebuild the index on the next lookup"""
+        with self._lock:
+            self._key = None
+
+    def _refresh(self):
+        filepath = _phc_interfaces_file()
+        key = (filepath, _stat_key(filepath), _net_signature())
+        if key == self._key:
+            return
+        self._key = key
+        self.generation += 1
+        self._resolved = {}
+        self._config_devices = {}
+
+        self._phc_indexes = {}
+        config = configparser.ConfigParser(delimiters=' ')
+        try:
+            config.read(filepath)
+            for interface in config.sections():
+                self._phc_indexes[interface] = \
+                    config[interface].get('phc_index', '')
+        except (FileNotFoundError, PermissionError,
+                configparser.Error) as err:
+            LOG.error("Failed to get phc index, reason: %s", err)
+
+        self._phc_devices = []
+        for path in glob(constants.PHC_PATH.format('*', '*')):
+            device_dir = os.path.dirname(path)
+            interface = os.path.basename(
+                os.path.dirname(os.path.dirname(device_dir)))
+            self._phc_devices.append((interface, os.path.basename(path)))
+        LOG.debug("PHC index rebuilt: indexes %s, devices %s",
+                  self._phc_indexes, self._phc_devices)
+
+    def get_phc_index(self, phc_interface):
+        with self._lock:
+            self._refresh()
+            return self._phc_indexes.get(phc_interface, '')
+
+    def get_phc_device(self, phc_interface):
+        with self._lock:
+            self._refresh()
+            if phc_interface not in self._resolved:
+                self._resolved[phc_interface] = self._resolve(phc_interface)
+            return self._resolved[phc_interface]
+
+    def _resolve(self, phc_interface):
+        phc_index = self._phc_indexes.get(phc_interface, '')
+        LOG.debug("Interface %s has phc index %s", phc_interface, phc_index)
+        if phc_index != '':
+            iface_pattern = '*'
+            ptp_device_pattern = f"ptp{phc_index}"
+        else:
+            # Use interface name as fallback solution
+            # if phc index is not found.
+            iface_pattern = phc_interface[:-1] + '*'
+            ptp_device_pattern = '*'
+        pattern = constants.PHC_PATH.format(iface_pattern, ptp_device_pattern)
+        ptp_devices = [
+            ptp_device for interface, ptp_device in self._phc_devices
+            if fnmatch.fnmatchcase(interface, iface_pattern)
+            and fnmatch.fnmatchcase(ptp_device, ptp_device_pattern)]
+        if len(ptp_devices) == 0:
+            LOG.info("No ptp device found at %s", pattern)
+        elif len(ptp_devices) > 1:
+            LOG.error("More than one ptp device found at %s", pattern)
+        else:
+            LOG.debug("Found ptp device %s at %s", ptp_devices[0], pattern)
+            return ptp_devices[0]
+        return None
+
+    def get_config_ptp_devices(self, config_file, read_interfaces):
+        """Return the set of PHC devices of the interfaces in config_file
+
+        read_interfaces() parses the interface names out of the config
+        file; it is only called again when the file changed.
+        """
+        key = _stat_key(config_file)
+        with self._lock:
+            self._refresh()
+            generation = self.generation
+            cached = self._config_devices.get(config_file)
+            if key is not None and cached is not None and cached[0] == key:
+                return set(cached[1])
+        devices = set()
+        for phc_interface in read_interfaces():
+            ptp_device = self.get_phc_device(phc_interface)
+            if ptp_device is not None:
+                devices.add(ptp_device)
+        with self._lock:
+            if key is not None and generation == self.generation:
+                self._config_devices[config_file] = (key, frozenset(devices))
+        return devices
+
+
+_phc_index = PhcIndex()
+
+
+def get_phc_index(phc_interface):
+    """Return the phc_index of an interface in ptp-interfaces.conf or ''"""
+    return _phc_index.get_phc_index(phc_interface)
+
+
+def get_phc_device(phc_interface):
+    """Return the PHC device name, e.g. 'ptp0', of an interface or None"""
+    return _phc_index.get_phc_device(phc_interface)
+
+
+def get_config_ptp_devices(config_file, read_interfaces):
+    """Return the PHC devices of an instance config, see PhcIndex"""
+    return _phc_index.get_config_ptp_devices(config_file, read_interfaces)
+
+
+def invalidate():
+    """Rebuild the index on the next lookup, e.g. after a config change"""
+    _phc_index.invalidate()
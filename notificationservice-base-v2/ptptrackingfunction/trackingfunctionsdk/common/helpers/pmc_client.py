@@ -0,0 +1,509 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Native PTP management client for ptp4l
+
+This module speaks the IEEE 1588 management protocol directly over the
+ptp4l Unix domain socket, replacing the '/usr/sbin/pmc -u -b 0' subprocess
+used by the monitors. A single datagram socket is kept open per
+(uds_address, domain_number) and several GET requests are sent in one
+batch, so a poll costs one round trip instead of one fork per dataset.
+
+Responses are decoded into dictionaries using the same field names and
+value formatting that pmc prints, so callers can consume them exactly as
+they consumed the parsed pmc output.
+
+PmcEventListener keeps a SUBSCRIBE_EVENTS_NP subscription alive on its own
+socket and hands every PORT_DATA_SET or PARENT_DATA_SET notification that
+ptp4l pushes to a callback.
+
+Usage:
+    client = get_pmc_client('/var/run/ptp4l-ptp1', 0)
+    responses = client.get(['PORT_DATA_SET', 'DEFAULT_DATA_SET'])
+    # {'PORT_DATA_SET': [{'portState': 'SLAVE', ...}, ...],
+    #  'DEFAULT_DATA_SET': [{'clockIdentity': '...', ...}]}
+
+    listener = PmcEventListener('/var/run/ptp4l-ptp1', 0, on_notification)
+    listener.start()
+"""
+
+import itertools
+import logging
+import os
+import select
+import socket
+import struct
+import threading
+import time
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+# Common message header and management message fields (IEEE 1588-2008,
+# clauses 13.3 and 15.4)
+_HEADER = struct.Struct('>BBHBBHqI8sHHBb')
+_MANAGEMENT = struct.Struct('>8sHBBBB')
+_TLV = struct.Struct('>HHH')
+_MANAGEMENT_ERROR = struct.Struct('>HHHH')
+
+_MESSAGE_TYPE_MANAGEMENT = 0x0d
+_PTP_VERSION = 0x02
+_CONTROL_FIELD_MANAGEMENT = 0x04
+_LOG_MESSAGE_INTERVAL = 0x7f
+_ACTION_GET = 0
+_ACTION_SET = 1
+_ACTION_RESPONSE = 2
+_TLV_MANAGEMENT = 0x0001
+_TLV_MANAGEMENT_ERROR_STATUS = 0x0002
+_ALL_ONES_CLOCK_IDENTITY = b'\xff' * 8
+_ALL_PORTS = 0xffff
+_MAX_MESSAGE_SIZE = 1500
+
+# SUBSCRIBE_EVENTS_NP: duration in seconds followed by a 64 byte event
+# bitmask. Port state and parent data set events are pushed as
+# PORT_DATA_SET and PARENT_DATA_SET responses; ptp4l releases older than
+# 4.0 ignore the parent data set bit.
+_SUBSCRIBE_EVENTS_NP = 0xc003
+_SUBSCRIBE_BITMASK_SIZE = 64
+NOTIFY_PORT_STATE = 0
+NOTIFY_TIME_SYNC = 1
+NOTIFY_PARENT_DATA_SET = 2
+
+# Time properties flags
+_UTC_OFF_VALID = 1 << 2
+_TIME_TRACEABLE = 1 << 4
+_FREQ_TRACEABLE = 1 << 5
+
+_PORT_STATES = {
+    1: 'INITIALIZING',
+    2: 'FAULTY',
+    3: 'DISABLED',
+    4: 'LISTENING',
+    5: 'PRE_MASTER',
+    6: 'MASTER',
+    7: 'PASSIVE',
+    8: 'UNCALIBRATED',
+    9: 'SLAVE',
+}
+
+
+def _parse_subscribe_events_np(data):
+    duration, = struct.unpack_from('>H', data)
+    bitmask = data[2:2 + _SUBSCRIBE_BITMASK_SIZE]
+    return {
+        'duration': str(duration),
+        'events': [event for event in range(len(bitmask) * 8)
+                   if bitmask[event // 8] & (1 << (event % 8))],
+    }
+
+
+def format_clock_identity(clock_identity):
+    """Format an 8 byte clock identity the way pmc prints it"""
+    hex_id = clock_identity.hex()
+    return f"{hex_id[0:6]}.{hex_id[6:10]}.{hex_id[10:16]}"
+
+
+def _parse_default_data_set(data):
+    (flags, _, number_ports, priority1, clock_class, clock_accuracy,
+     variance, priority2, clock_identity, domain_number,
+     _) = struct.unpack_from('>BBHBBBHB8sBB', data)
+    return {
+        'twoStepFlag': str(flags & 0x01),
+        'slaveOnly': str((flags >> 1) & 0x01),
+        'numberPorts': str(number_ports),
+        'priority1': str(priority1),
+        constants.CLOCK_CLASS: str(clock_class),
+        'clockAccuracy': f"0x{clock_accuracy:02x}",
+        'offsetScaledLogVariance': f"0x{variance:04x}",
+        'priority2': str(priority2),
+        constants.CLOCK_IDENTITY: format_clock_identity(clock_identity),
+        'domainNumber': str(domain_number),
+    }
+
+
+def _parse_parent_data_set(data):
+    (parent_clock, parent_port, parent_stats, _, observed_variance,
+     observed_rate, gm_priority1, gm_clock_class, gm_clock_accuracy,
+     gm_variance, gm_priority2,
+     gm_identity) = struct.unpack_from('>8sHBBHiBBBHB8s', data)
+    return {
+        'parentPortIdentity':
+            f"{format_clock_identity(parent_clock)}-{parent_port}",
+        'parentStats': str(parent_stats & 0x01),
+        'observedParentOffsetScaledLogVariance':
+            f"0x{observed_variance:04x}",
+        'observedParentClockPhaseChangeRate':
+            f"0x{observed_rate & 0xffffffff:08x}",
+        'grandmasterPriority1': str(gm_priority1),
+        constants.GM_CLOCK_CLASS: str(gm_clock_class),
+        'gm.ClockAccuracy': f"0x{gm_clock_accuracy:02x}",
+        'gm.OffsetScaledLogVariance': f"0x{gm_variance:04x}",
+        'grandmasterPriority2': str(gm_priority2),
+        constants.GRANDMASTER_IDENTITY: format_clock_identity(gm_identity),
+    }
+
+
+def _parse_time_properties_data_set(data):
+    utc_offset, flags, time_source = struct.unpack_from('>hBB', data)
+    return {
+        'currentUtcOffset': str(utc_offset),
+        'leap61': str(flags & 0x01),
+        'leap59': str((flags >> 1) & 0x01),
+        'currentUtcOffsetValid': str(int(bool(flags & _UTC_OFF_VALID))),
+        'ptpTimescale': str((flags >> 3) & 0x01),
+        constants.TIME_TRACEABLE: str(int(bool(flags & _TIME_TRACEABLE))),
+        'frequencyTraceable': str(int(bool(flags & _FREQ_TRACEABLE))),
+        'timeSource': f"0x{time_source:02x}",
+    }
+
+
+def _parse_port_data_set(data):
+    (clock_identity, port_number, port_state, log_min_delay_req,
+     peer_mean_path_delay, log_announce, announce_timeout, log_sync,
+     delay_mechanism, log_min_pdelay_req,
+     version) = struct.unpack_from('>8sHBbqbBbBbB', data)
+    return {
+        'portIdentity':
+            f"{format_clock_identity(clock_identity)}-{port_number}",
+        constants.PORT_STATE: _PORT_STATES.get(port_state, 'UNKNOWN'),
+        'logMinDelayReqInterval': str(log_min_delay_req),
+        'peerMeanPathDelay': str(peer_mean_path_delay),
+        'logAnnounceInterval': str(log_announce),
+        'announceReceiptTimeout': str(announce_timeout),
+        'logSyncInterval': str(log_sync),
+        'delayMechanism': str(delay_mechanism),
+        'logMinPdelayReqInterval': str(log_min_pdelay_req),
+        'versionNumber': str(version & 0x0f),
+    }
+
+
+def _parse_time_status_np(data):
+    (master_offset, ingress_time, rate_offset, phase_change, time_base,
+     _, _, _, gm_present,
+     gm_identity) = struct.unpack_from('>qqiiHHQHi8s', data)
+    return {
+        constants.MASTER_OFFSET: str(master_offset),
+        'ingress_time': str(ingress_time),
+        'cumulativeScaledRateOffset': f"{rate_offset / 2 ** 41:+.9f}",
+        'scaledLastGmPhaseChange': str(phase_change),
+        'gmTimeBaseIndicator': str(time_base),
+        constants.GM_PRESENT: 'true' if gm_present else 'false',
+        'gmIdentity': format_clock_identity(gm_identity),
+    }
+
+
+# managementId, request data length, response parser
+MANAGEMENT_IDS = {
+    'DEFAULT_DATA_SET': (0x2000, 20, _parse_default_data_set),
+    'PARENT_DATA_SET': (0x2002, 32, _parse_parent_data_set),
+    'TIME_PROPERTIES_DATA_SET': (0x2003, 4, _parse_time_properties_data_set),
+    'PORT_DATA_SET': (0x2004, 26, _parse_port_data_set),
+    'TIME_STATUS_NP': (0xc000, 50, _parse_time_status_np),
+}
+_MANAGEMENT_NAMES = {
+    value[0]: name for name, value in MANAGEMENT_IDS.items()}
+_MANAGEMENT_NAMES[_SUBSCRIBE_EVENTS_NP] = 'SUBSCRIBE_EVENTS_NP'
+_PARSERS = {name: value[2] for name, value in MANAGEMENT_IDS.items()}
+_PARSERS['SUBSCRIBE_EVENTS_NP'] = _parse_subscribe_events_np
+
+
+class PmcClient:
+    """Persistent management session with one ptp4l instance"""
+
+    _sequence = itertools.count()
+
+    def __init__(self, uds_address, domain_number, boundary_hops=0,
+                 timeout=None, local_path=None):
+        self.uds_address = uds_address
+        self.domain_number = int(domain_number)
+        self.boundary_hops = boundary_hops
+        self.timeout = timeout or constants.PMC_CLIENT_TIMEOUT
+        self.local_path = local_path or (
+            f"{constants.VAR_RUN_PATH}/ptptracking-pmc."
+            f"{os.getpid()}.{next(PmcClient._sequence)}")
+        self._socket = None
+        self._sequence_id = 0
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        self.close()
+
+    def connect(self):
+        """Open the local datagram socket and connect it to ptp4l"""
+        self.close()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            if os.path.exists(self.local_path):
+                os.unlink(self.local_path)
+            sock.bind(self.local_path)
+            sock.connect(self.uds_address)
+        except OSError:
+            sock.close()
+            self._unlink_local_path()
+            raise
+        self._socket = sock
+        LOG.debug("PMC client connected to %s (domain %s)",
+                  self.uds_address, self.domain_number)
+
+    def close(self):
+        """Close the socket and remove the local socket file"""
+        sock = getattr(self, '_socket', None)
+        if sock is not None:
+            self._socket = None
+            sock.close()
+            self._unlink_local_path()
+
+    def _unlink_local_path(self):
+        try:
+            os.unlink(self.local_path)
+        except OSError:
+            pass
+
+    def get(self, datasets):
+        """Send one GET per dataset in a single batch and collect responses
+
+        Returns a dict keyed by dataset name. Each value is the list of
+        decoded responses received for it; PORT_DATA_SET yields one entry
+        per port. Datasets that were not answered before the timeout map
+        to an empty list. Raises OSError when ptp4l cannot be reached even
+        after reconnecting.
+        """
+        with self._lock:
+            try:
+                return self._get(datasets)
+            except OSError as ex:
+                # ptp4l recreates its socket on restart, which leaves a
+                # connected datagram socket pointing at a stale inode.
+                LOG.debug("PMC session to %s failed (%s), reconnecting",
+                          self.uds_address, ex)
+                self.connect()
+                return self._get(datasets)
+
+    def _get(self, datasets):
+        if self._socket is None:
+            self.connect()
+        self._drain()
+
+        responses = {dataset: [] for dataset in datasets}
+        pending = {}
+        for dataset in datasets:
+            management_id, datalen, _ = MANAGEMENT_IDS[dataset]
+            sequence_id = self._next_sequence_id()
+            self._socket.send(
+                self._build_get(sequence_id, management_id, datalen))
+            pending[sequence_id] = dataset
+
+        expected_ports = None
+        deadline = time.monotonic() + self.timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select([self._socket], [], [], remaining)
+            if not readable:
+                break
+            message = self._socket.recv(_MAX_MESSAGE_SIZE)
+            sequence_id, dataset, values = self._parse_response(message)
+            if pending.get(sequence_id) != dataset:
+                continue
+            if values is not None:
+                responses[dataset].append(values)
+            if dataset == 'DEFAULT_DATA_SET' and values:
+                expected_ports = int(values['numberPorts'])
+            if dataset != 'PORT_DATA_SET':
+                pending.pop(sequence_id)
+            if ('PORT_DATA_SET' in pending.values()
+                    and expected_ports is not None
+                    and len(responses['PORT_DATA_SET']) >= expected_ports):
+                pending = {seq: name for seq, name in pending.items()
+                           if name != 'PORT_DATA_SET'}
+        return responses
+
+    def subscribe(self, events, duration):
+        """Subscribe this socket to ptp4l event notifications
+
+        events is a list of NOTIFY_* bit numbers, duration the number of
+        seconds ptp4l keeps the subscription. Returns True once ptp4l
+        acknowledges the subscription.
+        """
+        bitmask = bytearray(_SUBSCRIBE_BITMASK_SIZE)
+        for event in events:
+            bitmask[event // 8] |= 1 << (event % 8)
+        data = struct.pack('>H', duration) + bytes(bitmask)
+        with self._lock:
+            if self._socket is None:
+                self.connect()
+            sequence_id = self._next_sequence_id()
+            self._socket.send(self._build_message(
+                sequence_id, _SUBSCRIBE_EVENTS_NP, data, _ACTION_SET))
+            deadline = time.monotonic() + self.timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select(
+                        [self._socket], [], [], remaining)[0]:
+                    return False
+                response_id, dataset, values = self._parse_response(
+                    self._socket.recv(_MAX_MESSAGE_SIZE))
+                if (response_id == sequence_id
+                        and dataset == 'SUBSCRIBE_EVENTS_NP'):
+                    return values is not None
+
+    def receive(self, timeout):
+        """Wait up to timeout seconds for one pushed notification
+
+        Returns (dataset, values) or None if nothing arrived.
+        """
+        with self._lock:
+            if self._socket is None:
+                self.connect()
+            if not select.select([self._socket], [], [], timeout)[0]:
+                return None
+            _, dataset, values = self._parse_response(
+                self._socket.recv(_MAX_MESSAGE_SIZE))
+        if dataset is None or values is None:
+            return None
+        return dataset, values
+
+    def _drain(self):
+        """Discard late responses left over from a previous batch"""
+        while select.select([self._socket], [], [], 0)[0]:
+            self._socket.recv(_MAX_MESSAGE_SIZE)
+
+    def _next_sequence_id(self):
+        self._sequence_id = (self._sequence_id + 1) & 0xffff
+        return self._sequence_id
+
+    def _build_get(self, sequence_id, management_id, datalen):
+        return self._build_message(sequence_id, management_id,
+                                   b'\x00' * datalen, _ACTION_GET)
+
+    def _build_message(self, sequence_id, management_id, data, action):
+        tlv_length = 2 + len(data)
+        message_length = (_HEADER.size + _MANAGEMENT.size +
+                          _TLV.size + len(data))
+        header = _HEADER.pack(
+            _MESSAGE_TYPE_MANAGEMENT, _PTP_VERSION, message_length,
+            self.domain_number, 0, 0, 0, 0,
+            b'\x00' * 8, os.getpid() & 0xffff, sequence_id,
+            _CONTROL_FIELD_MANAGEMENT, _LOG_MESSAGE_INTERVAL)
+        management = _MANAGEMENT.pack(
+            _ALL_ONES_CLOCK_IDENTITY, _ALL_PORTS,
+            self.boundary_hops, self.boundary_hops, action, 0)
+        tlv = _TLV.pack(_TLV_MANAGEMENT, tlv_length, management_id)
+        return header + management + tlv + data
+
+    @staticmethod
+    def _parse_response(message):
+        """Return (sequence_id, dataset, values) for a management response
+
+        values is None for error status responses. Messages that are not
+        management responses yield (None, None, None).
+        """
+        offset = _HEADER.size + _MANAGEMENT.size
+        if len(message) < offset + _TLV.size:
+            return None, None, None
+        header = _HEADER.unpack_from(message)
+        message_type = header[0] & 0x0f
+        sequence_id = header[10]
+        action = _MANAGEMENT.unpack_from(message, _HEADER.size)[4] & 0x0f
+        if (message_type != _MESSAGE_TYPE_MANAGEMENT
+                or action != _ACTION_RESPONSE):
+            return None, None, None
+
+        tlv_type, tlv_length, management_id = _TLV.unpack_from(
+            message, offset)
+        if tlv_type == _TLV_MANAGEMENT_ERROR_STATUS:
+            if len(message) < offset + _MANAGEMENT_ERROR.size:
+                return None, None, None
+            _, _, error_id, management_id = _MANAGEMENT_ERROR.unpack_from(
+                message, offset)
+            dataset = _MANAGEMENT_NAMES.get(management_id)
+            LOG.warning("PMC error 0x%04x for %s", error_id, dataset)
+            return sequence_id, dataset, None
+        if tlv_type != _TLV_MANAGEMENT:
+            return None, None, None
+
+        dataset = _MANAGEMENT_NAMES.get(management_id)
+        if dataset is None:
+            return None, None, None
+        data = message[offset + _TLV.size:offset + _TLV.size + tlv_length - 2]
+        try:
+            return sequence_id, dataset, _PARSERS[dataset](data)
+        except struct.error:
+            LOG.warning("PMC response for %s is truncated", dataset)
+            return sequence_id, dataset, None
+
+
+class PmcEventListener(threading.Thread):
+    """Receive ptp4l event notifications on a dedicated socket
+
+    The subscription is renewed before it lapses and re-established after
+    ptp4l restarts. Every PORT_DATA_SET and PARENT_DATA_SET notification is
+    passed to on_notification(dataset, values) from this thread.
+    """
+
+    def __init__(self, uds_address, domain_number, on_notification,
+                 events=(NOTIFY_PORT_STATE, NOTIFY_PARENT_DATA_SET),
+                 duration=None):
+        super().__init__(daemon=True,
+                         name=f"pmc-events-{os.path.basename(uds_address)}")
+        self.client = PmcClient(uds_address, domain_number)
+        self.on_notification = on_notification
+        self.events = list(events)
+        self.duration = duration or constants.PMC_SUBSCRIBE_DURATION
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        renew_at = 0
+        while not self._stop_event.is_set():
+            try:
+                if time.monotonic() >= renew_at:
+                    if not self.client.subscribe(self.events, self.duration):
+                        raise OSError("subscription not acknowledged")
+                    LOG.debug("Subscribed to %s events for %ss",
+                              self.client.uds_address, self.duration)
+                    # Renew well before ptp4l drops the subscription
+                    renew_at = time.monotonic() + self.duration / 2
+                notification = self.client.receive(
+                    min(1.0, max(0.0, renew_at - time.monotonic())))
+                if notification is not None:
+                    self.on_notification(*notification)
+            except OSError as ex:
+                LOG.debug("PMC event subscription to %s failed (%s), "
+                          "retrying", self.client.uds_address, ex)
+                self.client.close()
+                renew_at = 0
+                self._stop_event.wait(constants.PMC_SUBSCRIBE_RETRY)
+        self.client.close()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_pmc_client(uds_address, domain_number):
+    """Return the shared client for a ptp4l socket and domain"""
+    key = (uds_address, int(domain_number))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = PmcClient(uds_address, domain_number)
+            _clients[key] = client
+        return client
+
+
+def close_pmc_clients():
+    """Close every shared client"""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
@@ -0,0 +1,137 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Per-source poll scheduling for the PTP tracking daemon
+
+Each monitored source (a ptp4l, ts2phc or synce4l instance, or the OS clock)
+is polled on its own cadence. PollScheduler keeps the next poll time of every
+source in a heap so the daemon can sleep until the earliest one is due, and
+next_poll_interval() picks the cadence from the state of the last sample.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+LOCKED_STATES = ('LOCKED', 'SYNCHRONIZED')
+HOLDOVER_STATES = ('HOLDOVER',)
+
+
+def next_poll_interval(sync_state, poll_freq_seconds, stable_seconds=0,
+                       near_threshold=False):
+    """Return the number of seconds until a source should be polled again
+
+    sync_state: state reported by the last sample
+    poll_freq_seconds: nominal cadence of the source
+    stable_seconds: how long the source has been in sync_state
+    near_threshold: the last measured offset is close to its threshold
+    """
+    state = str(sync_state).upper()
+    if state in HOLDOVER_STATES or near_threshold:
+        return min(constants.POLL_FAST_SECONDS, poll_freq_seconds)
+    if state in LOCKED_STATES and \
+            stable_seconds >= constants.POLL_STABLE_SECONDS:
+        return max(constants.POLL_SLOW_SECONDS, poll_freq_seconds)
+    return poll_freq_seconds
+
+
+def near_threshold(offset, threshold,
+                   ratio=constants.POLL_NEAR_THRESHOLD_RATIO):
+    """Return True if abs(offset) is within ratio of reaching threshold"""
+    try:
+        return abs(int(offset)) >= ratio * int(threshold)
+    except (TypeError, ValueError):
+        return False
+
+
+class PollScheduler:
+    """Track when each source is next due for polling
+
+    Sources are identified by any hashable key. A key that has never been
+    scheduled is always due. The heap may hold stale entries for keys that
+    were rescheduled; they are skipped when the heap is inspected.
+
+    wake() may be called from other threads to make a source due at once,
+    for instance when ptp4l pushes a state change.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._due = {}
+        self._woken = {}
+        self._heap = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def is_due(self, key, now=None):
+        if now is None:
+            now = self._clock()
+        with self._lock:
+            due = self._due.get(key)
+            return key in self._woken or due is None or due <= now
+
+    def schedule(self, key, interval, now=None):
+        """Schedule the next poll of key interval seconds after now
+
+        now is the time the sample was started. If the source was woken
+        after that, it stays due so the change is picked up right away.
+        """
+        with self._lock:
+            if now is None:
+                now = self._clock()
+            woken = self._woken.pop(key, None)
+            if woken is not None and woken >= now:
+                self._woken[key] = woken
+                return
+            due = now + interval
+            self._due[key] = due
+            heapq.heappush(self._heap, (due, next(self._counter), key))
+        LOG.debug("Next poll of %s in %.2fs", key, interval)
+
+    def wake(self, key):
+        """Make key due immediately"""
+        with self._lock:
+            self._woken[key] = self._clock()
+
+    def discard(self, key):
+        with self._lock:
+            self._due.pop(key, None)
+            self._woken.pop(key, None)
+
+    def reset(self):
+        """Make every source due immediately"""
+        with self._lock:
+            self._due.clear()
+            self._woken.clear()
+            self._heap = []
+
+    def next_deadline(self):
+        """Return the earliest due time, or None if nothing is scheduled"""
+        with self._lock:
+            if self._woken:
+                return min(self._woken.values())
+            while self._heap:
+                due, _, key = self._heap[0]
+                if self._due.get(key) == due:
+                    return due
+                heapq.heappop(self._heap)
+            return None
+
+    def time_until_next(self, now=None):
+        """Return seconds until the earliest due time, or None"""
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        if now is None:
+            now = self._clock()
+        return max(0.0, deadline - now)
@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Cached command lines of the linuxptp daemons
+
+The monitors look up phc2sys and ts2phc options such as -O, -n, -z and -s
+several times per poll. Each lookup used to read the daemon pidfile and
+/host/proc/<pid>/cmdline again. This module parses the full argv once per
+(service, pid) and answers later lookups from memory. The pidfile is only
+stat'ed to detect a restart: a changed pidfile is read again and the
+command line is only read again if the pid changed.
+
+Usage:
+    interface = process_info.get_option('phc2sys-phc-inst1', '-s')
+    running = process_info.is_running('ts2phc-ts1')
+"""
+
+import collections
+import logging
+import os
+import threading
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
+
+
+class ProcessInfo(collections.namedtuple('ProcessInfo', ['pid', 'argv'])):
+    """pid and argv of a daemon, argv is None until it has been read"""
+    __slots__ = ()
+
+    def option(self, flag):
+        """Return the value following flag or None"""
+        try:
+            return self.argv[self.argv.index(flag) + 1]
+        except (ValueError, IndexError):
+            return None
+
+
+# pidfile path -> (pidfile stat key, ProcessInfo)
+_process_info = {}
+_process_info_lock = threading.Lock()
+
+
+def _pidfile(service, run_path):
+    return os.path.join(run_path, service + '.pid')
+
+
+def _stat_key(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+
+def _read_argv(pid):
+    cmdline_file = os.path.join(constants.HOST_PROC_PATH, pid, 'cmdline')
+    with open(cmdline_file, 'r', encoding='utf-8') as cmdline_handle:
+        cmdline = cmdline_handle.read()
+    return tuple(cmdline.rstrip('\x00').split('\x00'))
+
+
+def _lookup(service, run_path, with_argv):
+    pidfile = _pidfile(service, run_path)
+    key = _stat_key(pidfile)
+    with _process_info_lock:
+        cached_key, info = _process_info.get(pidfile, (None, None))
+    if key is None or key != cached_key:
+        try:
+            with open(pidfile, 'r', encoding='utf-8') as pidfile_handle:
+                pid = pidfile_handle.readline().strip()
+        except OSError as ex:
+            LOG.debug("Cannot read pidfile of %s: %s", service, ex)
+            with _process_info_lock:
+                _process_info.pop(pidfile, None)
+            return None
+        if info is None or info.pid != pid:
+            info = ProcessInfo(pid, None)
+    if with_argv and info.argv is None:
+        try:
+            info = ProcessInfo(info.pid, _read_argv(info.pid))
+        except OSError as ex:
+            LOG.debug("Cannot read command line of %s: %s", service, ex)
+            return None
+    if key is not None:
+        with _process_info_lock:
+            _process_info[pidfile] = (key, info)
+    return info
+
+
+def get_pid(service, run_path=constants.VAR_RUN_PATH):
+    """Return the pid in the daemon pidfile or None if it cannot be read
+
+    service is the pidfile name without extension, e.g. 'ts2phc-ts1'.
+    """
+    info = _lookup(service, run_path, with_argv=False)
+    return info.pid if info is not None else None
+
+
+def get_process_info(service, run_path=constants.VAR_RUN_PATH):
+    """Return the ProcessInfo of a daemon or None if it cannot be read"""
+    return _lookup(service, run_path, with_argv=True)
+
+
+def get_option(service, flag, run_path=constants.VAR_RUN_PATH):
+    """Return the value following flag on the daemon command line"""
+    info = get_process_info(service, run_path)
+    if info is None:
+        return None
+    return info.option(flag)
+
+
+def is_running(service, run_path=constants.VAR_RUN_PATH):
+    """Return True if the daemon pidfile exists"""
+    pidfile = _pidfile(service, run_path)
+    if os.path.isfile(pidfile):
+        return True
+    with _process_info_lock:
+        _process_info.pop(pidfile, None)
+    return False
+
+
+def invalidate(service=None, run_path=constants.VAR_RUN_PATH):
+    """Drop the cached command line of one or all daemons"""
+    with _process_info_lock:
+        if service is None:
+            _process_info.clear()
+        else:
+            _process_info.pop(_pidfile(service, run_path), None)
@@ -19,6 +19,9 @@ import sys
 from trackingfunctionsdk.model.dto.ptpstate import PtpState
 from trackingfunctionsdk.common.helpers import constants
 from trackingfunctionsdk.common.helpers import log_helper
+from trackingfunctionsdk.common.helpers import phc_index
+from trackingfunctionsdk.common.helpers import pmc_client
+from trackingfunctionsdk.common.helpers import poll_scheduler
 from trackingfunctionsdk.common.helpers import ptpsync as utils
 from trackingfunctionsdk.common.helpers.instance_config_parser import (
     get_instance_holdover_time, get_instance_offset_threshold)
@@ -35,6 +38,7 @@ class PtpMonitor:
     _ptp_event_time = None
     _clock_class_event_time = None
     _clock_class_retry = 3
+    _event_listener = None
 
     # Critical resources
     ptp4l_service_name = None
@@ -43,13 +47,13 @@ class PtpMonitor:
 
     ptp_oper_dict = {
         # [pmc cmd, ptp keywords,...]
-        1: ["'GET PORT_DATA_SET'", constants.PORT_STATE],
-        2: ["'GET TIME_STATUS_NP'", constants.GM_PRESENT,
+        1: ["GET PORT_DATA_SET", constants.PORT_STATE],
+        2: ["GET TIME_STATUS_NP", constants.GM_PRESENT,
             constants.MASTER_OFFSET],
-        3: ["'GET PARENT_DATA_SET'", constants.GM_CLOCK_CLASS,
+        3: ["GET PARENT_DATA_SET", constants.GM_CLOCK_CLASS,
             constants.GRANDMASTER_IDENTITY],
-        4: ["'GET TIME_PROPERTIES_DATA_SET'", constants.TIME_TRACEABLE],
-        5: ["'GET DEFAULT_DATA_SET'", constants.CLOCK_IDENTITY,
+        4: ["GET TIME_PROPERTIES_DATA_SET", constants.TIME_TRACEABLE],
+        5: ["GET DEFAULT_DATA_SET", constants.CLOCK_IDENTITY,
             constants.CLOCK_CLASS],
     }
 
@@ -86,12 +90,8 @@ class PtpMonitor:
         self.set_ptp_clock_class()
 
     def set_ptp_devices(self):
-        ptp_devices = set()
-        phc_interfaces = self._check_config_file_interfaces()
-        for phc_interface in phc_interfaces:
-            ptp_device = utils.get_interface_phc_device(phc_interface)
-            if ptp_device is not None:
-                ptp_devices.add(ptp_device)
+        ptp_devices = phc_index.get_config_ptp_devices(
+            self.ptp4l_config, self._check_config_file_interfaces)
         self.ptp_devices = list(ptp_devices)
         LOG.debug("PTP4l PTP devices are %s", self.ptp_devices)
 
@@ -101,6 +101,62 @@ class PtpMonitor:
     def get_ptp_sync_source(self):
         return self.sync_source
 
+    def get_grandmaster_identity(self):
+        return self.pmc_query_results.get(constants.GRANDMASTER_IDENTITY)
+
+    def start_event_listener(self, on_event):
+        """Subscribe to ptp4l notifications and report relevant changes
+
+        on_event(ptp4l_service_name) is called from the listener thread as
+        soon as ptp4l reports a port entering or leaving SLAVE, or a
+        grandmaster clockClass different from the last one polled.
+        """
+        if self._event_listener is not None:
+            return
+        self._on_event = on_event
+        self._notified_port_states = {}
+        self._event_listener = pmc_client.PmcEventListener(
+            self.uds_address, self.domain_number, self._handle_notification)
+        self._event_listener.start()
+        LOG.info("Listening for %s events on %s",
+                 self.ptp4l_service_name, self.uds_address)
+
+    def stop_event_listener(self):
+        if self._event_listener is not None:
+            self._event_listener.stop()
+            self._event_listener = None
+
+    def event_listener_active(self):
+        return self._event_listener is not None
+
+    def _handle_notification(self, dataset, values):
+        if dataset == 'PORT_DATA_SET':
+            port = values['portIdentity']
+            state = values[constants.PORT_STATE]
+            previous = self._notified_port_states.get(port)
+            self._notified_port_states[port] = state
+            # ptp4l only notifies on changes, so the first notification
+            # for a port is a change as well
+            if previous is not None and 'SLAVE' not in (previous, state):
+                return
+            LOG.info("%s port %s state changed to %s",
+                     self.ptp4l_service_name, port, state)
+        elif dataset == 'PARENT_DATA_SET':
+            clock_class = values[constants.GM_CLOCK_CLASS]
+            if clock_class == self._clock_class:
+                return
+            LOG.info("%s grandmaster clockClass changed to %s",
+                     self.ptp4l_service_name, clock_class)
+        else:
+            return
+        self._on_event(self.ptp4l_service_name)
+
+    def offset_near_threshold(self):
+        """Return True if the last master offset is close to the threshold"""
+        return poll_scheduler.near_threshold(
+            self.pmc_query_results.get(constants.MASTER_OFFSET),
+            self.offset_threshold)
+
     def _check_config_file_interfaces(self):
         phc_interfaces = []
         try:
@@ -276,6 +332,46 @@ class PtpMonitor:
         return new_event, sync_state, self._ptp_event_time
 
     def ptpsync(self):
+        if constants.PMC_CLIENT_MODE == constants.PMC_CLIENT_NATIVE:
+            try:
+                return self._ptpsync_native()
+            except OSError as ex:
+                LOG.warning("Native PMC query to %s failed, falling back to "
+                            "pmc subprocess: %s", self.uds_address, ex)
+        return self._ptpsync_subprocess()
+
+    def _ptpsync_native(self):
+        result = {}
+        total_ptp_keywords = 0
+        port_count = 0
+
+        datasets = [self.ptp_oper_dict[key][0].split()[1]
+                    for key in range(1, len(self.ptp_oper_dict) + 1)]
+        client = pmc_client.get_pmc_client(self.uds_address,
+                                           self.domain_number)
+        responses = client.get(datasets)
+
+        for key, dataset in enumerate(datasets, start=1):
+            ptp_keyword = self.ptp_oper_dict[key][1:]
+            total_ptp_keywords += len(ptp_keyword)
+            for values in responses[dataset]:
+                for item in ptp_keyword:
+                    if item not in values:
+                        continue
+                    if item == constants.PORT_STATE:
+                        port_count += 1
+                        result.update(
+                            {constants.PORT.format(port_count): values[item]})
+                    else:
+                        result.update({item: values[item]})
+        # making sure at least one port is available
+        if port_count == 0:
+            port_count = 1
+        # adding the possible ports minus one keyword not used, "portState"
+        total_ptp_keywords = total_ptp_keywords + port_count - 1
+        return result, total_ptp_keywords, port_count
+
+    def _ptpsync_subprocess(self):
         result = {}
         total_ptp_keywords = 0
         port_count = 0
@@ -284,19 +380,18 @@ class PtpMonitor:
         len_dic = len(ptp_dict_to_use)
 
         for key in range(1, len_dic + 1):
-            cmd = ptp_dict_to_use[key][0]
-            cmd = ' '.join([
-                f"{constants.PMC_PATH}",
-                "-b 0 -u",
-                f"-d {self.domain_number}",
-                f"-s {self.uds_address}",
-                cmd
-            ])
+            cmd = [
+                constants.PMC_PATH,
+                '-b', '0', '-u',
+                '-d', str(self.domain_number),
+                '-s', self.uds_address,
+                ptp_dict_to_use[key][0]
+            ]
 
             ptp_keyword = ptp_dict_to_use[key][1:]
             total_ptp_keywords += len(ptp_keyword)
 
-            out, err, errcode = utils.run_shell2('.', None, cmd)
+            out, err, errcode, _ = utils.run_command(cmd)
             if errcode != 0:
                 LOG.warning('pmc command returned unknown result')
                 sys.exit(0)
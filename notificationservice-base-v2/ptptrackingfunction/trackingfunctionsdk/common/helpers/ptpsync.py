@@ -12,15 +12,17 @@
 # Sync status provided as: 'Locked', 'Holdover', 'Freerun'
 #
 #
-import configparser
+import collections
 import os
 import re
+import shlex
 import subprocess
 import logging
 import time
-from glob import glob
 from trackingfunctionsdk.common.helpers import constants
 from trackingfunctionsdk.common.helpers import log_helper
+from trackingfunctionsdk.common.helpers import phc_index
+from trackingfunctionsdk.common.helpers import process_info
 
 LOG = logging.getLogger(__name__)
 log_helper.config_logger(LOG)
@@ -36,18 +38,50 @@ except (ValueError, TypeError):
               ' using the default.')
 
 
-# run subprocess and returns out, err, errcode
-def run_shell2(dir, ctx, args):
-    cwd = os.getcwd()
-    os.chdir(dir)
+CommandResult = collections.namedtuple(
+    'CommandResult', ['out', 'err', 'errcode', 'elapsed'])
+
+
+def run_command(args, timeout=constants.COMMAND_TIMEOUT, cwd=None):
+    """Run a command directly, without a shell, and return a CommandResult
+
+    args is an argv list. The working directory of the calling process is
+    never changed, so this is safe to call from several threads at once.
+    A command that exceeds timeout seconds is killed and reported with
+    errcode COMMAND_TIMEOUT_ERRCODE; a command that cannot be started is
+    reported with errcode COMMAND_NOT_FOUND_ERRCODE, mirroring the shell.
+    elapsed is the wall time of the command in seconds.
+    """
+    start = time.monotonic()
+    try:
+        process = subprocess.run(args, cwd=cwd, timeout=timeout,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE, check=False)
+        out, err, errcode = process.stdout, process.stderr, process.returncode
+    except subprocess.TimeoutExpired as ex:
+        LOG.warning("Command %s timed out after %ss", args[0], timeout)
+        out = ex.stdout or b''
+        err = ex.stderr or b''
+        errcode = constants.COMMAND_TIMEOUT_ERRCODE
+    except OSError as ex:
+        LOG.warning("Unable to run command %s: %s", args[0], ex)
+        out, err = b'', str(ex).encode()
+        errcode = constants.COMMAND_NOT_FOUND_ERRCODE
+    elapsed = time.monotonic() - start
+    LOG.debug("Command '%s' returned %s in %.3fs",
+              ' '.join(args), errcode, elapsed)
+    return CommandResult(out, err, errcode, elapsed)
 
-    process = subprocess.Popen(args, shell=True,
-                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    out, err = process.communicate()
-    errcode = process.returncode
 
-    os.chdir(cwd)
+def run_shell2(dir, ctx, args):
+    """Run a command given as a string and return out, err, errcode
 
+    Kept for callers that still pass a command string; the string is split
+    into argv and run through run_command in the given directory.
+    """
+    if isinstance(args, str):
+        args = shlex.split(args)
+    out, err, errcode, _ = run_command(args, cwd=dir)
     return out, err, errcode
 
 
@@ -59,9 +93,9 @@ def check_critical_resources(ptp4l_service_name, phc2sys_service_name):
 
     if os.path.isfile('/usr/sbin/pmc'):
         pmc = True
-    if os.path.isfile(f'/var/run/ptp4l-{ptp4l_service_name}.pid'):
+    if process_info.is_running(f'ptp4l-{ptp4l_service_name}'):
         ptp4l = True
-    if os.path.isfile(f'/var/run/phc2sys-{phc2sys_service_name}.pid'):
+    if process_info.is_running(f'phc2sys-{phc2sys_service_name}'):
         phc2sys = True
     if os.path.isfile(constants.PTP_CONFIG_PATH +
                       f'ptp4l-{ptp4l_service_name}.conf'):
@@ -149,44 +183,12 @@ def format_resource_address(node_name, resource, instance=None):
 
 def get_phc_index(phc_interface):
     """Determine the phc index"""
-    phc_index = ''
-    filepath = f"{constants.PTP_CONFIG_PATH}ptp-interfaces.conf"
-    config = configparser.ConfigParser(delimiters=' ')
-    try:
-        config.read(filepath)
-        if config.has_section(phc_interface):
-            phc_index = config[phc_interface].get('phc_index', '')
-    except(FileNotFoundError, PermissionError) as err:
-        LOG.error(f"Failed to get phc index, reason: {err}")
-    return phc_index
+    return phc_index.get_phc_index(phc_interface)
 
 
 def get_interface_phc_device(phc_interface):
     """Determine the phc device for the interface"""
-    phc_index = get_phc_index(phc_interface)
-    LOG.debug(f"Interface {phc_interface} has phc index {phc_index}")
-    if phc_index != '':
-        iface_pattern = '*'
-        ptp_device_pattern = f"ptp{phc_index}"
-    else:
-        # Use interface name as fallback solution
-        # if phc index is not found.
-        iface_pattern = phc_interface[:-1]+'*'
-        ptp_device_pattern = '*'
-    pattern = constants.PHC_PATH.format(
-        iface_pattern,
-        ptp_device_pattern
-    )
-    ptp_devices = glob(pattern)
-    if len(ptp_devices) == 0:
-        LOG.info("No ptp device found at %s", pattern)
-    elif len(ptp_devices) > 1:
-        LOG.error("More than one ptp device found at %s", pattern)
-    else:
-        ptp_device = os.path.basename(ptp_devices[0])
-        LOG.debug("Found ptp device %s at %s", ptp_device, pattern)
-        return ptp_device
-    return None
+    return phc_index.get_phc_device(phc_interface)
 
 
 def get_latest_offset_from_leapfile():
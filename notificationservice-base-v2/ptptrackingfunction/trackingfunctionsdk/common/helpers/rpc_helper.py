@@ -5,8 +5,21 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import collections
+import functools
+import logging
+import threading
+import time
+
+import kombu
 import oslo_messaging
 from oslo_config import cfg
+from oslo_messaging.rpc import server as rpc_server
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import log_helper
+
+LOG = logging.getLogger(__name__)
+log_helper.config_logger(LOG)
 
 
 def setup_client(rpc_endpoint_info, topic, server):
@@ -22,3 +35,155 @@ def setup_client(rpc_endpoint_info, topic, server):
 def get_transport(rpc_endpoint_info):
     oslo_messaging.set_transport_defaults(rpc_endpoint_info.Exchange)
     return oslo_messaging.get_rpc_transport(cfg.CONF, url=rpc_endpoint_info.TransportEndpoint)
+
+
+class RpcClientCache(object):
+    """Bounded LRU cache of RPC clients of one transport
+
+    Building a Target and an RPCClient for every message is a significant
+    part of the cost of a cast. Clients are keyed by topic, fanout, server,
+    timeout and retry; the least recently used one is dropped once more
+    than max_size are cached.
+    """
+
+    def __init__(self, transport, rpc_endpoint_info,
+                 max_size=constants.RPC_CLIENT_CACHE_SIZE):
+        self.transport = transport
+        self.rpc_endpoint_info = rpc_endpoint_info
+        self.max_size = max_size
+        self._clients = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, topic, fanout=None, server=None, timeout=None,
+            retry=None):
+        key = (topic, fanout, server, timeout, retry)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+            target = oslo_messaging.Target(
+                topic=topic, fanout=fanout, server=server,
+                version=self.rpc_endpoint_info.Version,
+                namespace=self.rpc_endpoint_info.Namespace)
+            client = oslo_messaging.get_rpc_client(
+                self.transport, target, timeout=timeout, retry=retry)
+            self._clients[key] = client
+            if len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+
+class PooledRpcServer(rpc_server.RPCServer):
+    """RPC server handling requests on a bounded pool of worker threads
+
+    Requests are handed to workers threads; up to queue_size more wait for
+    one. When the backlog is full the listener thread handles the request
+    itself, so it stops taking requests off the broker until it is done
+    instead of queueing them without bound.
+    """
+
+    def __init__(self, transport, target, dispatcher, executor=None,
+                 workers=constants.RPC_WORKERS,
+                 queue_size=constants.RPC_QUEUE_SIZE):
+        super(PooledRpcServer, self).__init__(
+            transport, target, dispatcher, executor)
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self._stats_lock = threading.Lock()
+        self._backlog = 0
+        self._counters = {'handled': 0, 'inline': 0,
+                          'wait_seconds_max': 0.0,
+                          'latency_seconds_total': 0.0,
+                          'latency_seconds_max': 0.0}
+        # start() sizes the executor from the global executor_thread_pool_size
+        self._pool_executor_cls = self._executor_cls
+        self._executor_cls = self._new_executor
+
+    def _new_executor(self, **executor_opts):
+        executor_opts['max_workers'] = self.workers
+        return self._pool_executor_cls(**executor_opts)
+
+    def stats(self):
+        """Return the backlog and the request counters and timings
+
+        wait_seconds_max is the longest a request waited for a worker,
+        latency_seconds_* the time from receiving a request to replying.
+        """
+        with self._stats_lock:
+            stats = dict(self._counters)
+            stats['backlog'] = self._backlog
+        return stats
+
+    def _on_incoming(self, incoming):
+        received = time.monotonic()
+        with self._stats_lock:
+            inline = self._backlog >= self.workers + self.queue_size
+            if inline:
+                self._counters['inline'] += 1
+            self._backlog += 1
+        if inline:
+            LOG.warning("%s RPC backlog full, handling request in the "
+                        "listener", self._target.topic)
+            self._process_timed(incoming, received)
+        else:
+            self._work_executor.submit(
+                self._process_timed, incoming, received)
+
+    def _process_timed(self, incoming, received):
+        started = time.monotonic()
+        try:
+            self._process_incoming(incoming)
+        finally:
+            done = time.monotonic()
+            with self._stats_lock:
+                self._backlog -= 1
+                counters = self._counters
+                counters['handled'] += 1
+                counters['wait_seconds_max'] = max(
+                    counters['wait_seconds_max'], started - received)
+                counters['latency_seconds_total'] += done - received
+                counters['latency_seconds_max'] = max(
+                    counters['latency_seconds_max'], done - received)
+
+
+def get_rpc_server(transport, target, endpoints,
+                   workers=constants.RPC_WORKERS,
+                   queue_size=constants.RPC_QUEUE_SIZE):
+    """Return a PooledRpcServer for the endpoints"""
+    return oslo_messaging.get_rpc_server(
+        transport, target, endpoints,
+        server_cls=functools.partial(
+            PooledRpcServer, workers=workers, queue_size=queue_size))
+
+
+def get_bound_fanout_topics(rpc_endpoint_info, topics, timeout=2):
+    """Return the topics that have a fanout consumer on the broker
+
+    oslo.messaging declares the auto-delete '<topic>_fanout' exchange when
+    the first fanout consumer of a topic binds its queue, so a passive
+    declare tells whether anybody listens to the topic yet. Raises the
+    kombu connection errors if the broker cannot be reached.
+    """
+    url = rpc_endpoint_info.TransportEndpoint.replace(
+        'rabbit://', 'amqp://', 1)
+    bound = []
+    with kombu.Connection(url, connect_timeout=timeout) as connection:
+        connection.ensure_connection(max_retries=1)
+        for topic in topics:
+            # A failed passive declare closes the channel
+            channel = connection.channel()
+            try:
+                channel.exchange_declare(
+                    exchange='%s_fanout' % topic, type='fanout',
+                    passive=True)
+                bound.append(topic)
+            except connection.channel_errors:
+                pass
+            finally:
+                channel.close()
+    return bound
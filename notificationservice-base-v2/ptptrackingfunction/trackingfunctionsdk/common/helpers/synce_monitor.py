@@ -10,6 +10,7 @@ import datetime
 import logging
 
 from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import instance_config_parser
 
 from pynetlink import NetlinkDPLL
 from pynetlink import DeviceType
@@ -83,13 +84,11 @@ class SynceMonitor:
         """
         result = {}
         try:
-            config = configparser.ConfigParser(delimiters=' ')
-            config.read(constants.INSTANCE_CONFIG_PATH)
-            if not config.has_section(instance_name):
-                return result
+            section = instance_config_parser.get_monitoring_config().section(
+                instance_name)
             for key in ('static_ql', 'holdover_ql', 'freerun_ql'):
-                if config.has_option(instance_name, key):
-                    result[key] = int(config[instance_name][key], 0)
+                if key in section:
+                    result[key] = int(section[key], 0)
         except Exception as e:
             LOG.warning("SynceMonitor %s: monitoring config parse failed: %s",
                         instance_name, e)
@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Coalescing of TriggerDelivery requests
+
+Every notification client asks for a full republish when it (re)connects,
+so a rolling restart of many sidecars used to republish every source once
+per sidecar. TriggerCoalescer collects the requests arriving within a short
+window, together with the sources they asked for, and the daemon republishes
+the union of them once when the window closes.
+
+Usage:
+    requests = TriggerCoalescer(constants.TRIGGER_COALESCE_SECONDS)
+    if requests.request(requested_sources(resource_path)):
+        watcher.signal_ptp_event()
+    ...
+    timeout = requests.time_until_due()
+    sources = requests.take()
+"""
+import threading
+import time
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import event_template
+
+# Every source the daemon publishes
+ALL_SOURCES = frozenset(event_template.SOURCE_TYPE)
+
+
+def requested_sources(resource_path=None):
+    """Return the sources a delivery request for resource_path covers
+
+    resource_path is the resource part of a ResourceAddress, optionally
+    prefixed with an instance, e.g. '/ptp1/sync/ptp-status/lock-state'. It
+    covers the sources at or below it, so '/sync' covers every source. A
+    missing or unknown path covers every source, as before coalescing.
+    """
+    if not resource_path:
+        return ALL_SOURCES
+    # Drop the instance, it is republished along with the other instances
+    start = resource_path.find(constants.SOURCE_SYNC_ALL + '/')
+    if start > 0:
+        resource_path = resource_path[start:]
+    sources = frozenset(
+        source for source in ALL_SOURCES
+        if source == resource_path or source.startswith(resource_path + '/'))
+    return sources or ALL_SOURCES
+
+
+class TriggerCoalescer(object):
+    """Delivery requests pending until the end of their window
+
+    The first request opens a window of window seconds; requests arriving
+    before it closes add their sources to the same delivery. request() may
+    be called from any thread, the daemon loop calls take().
+    """
+
+    def __init__(self, window, clock=time.monotonic):
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sources = set()
+        self._due = None
+        self._requests = 0
+        self._deliveries = 0
+
+    def request(self, sources=ALL_SOURCES):
+        """Add a request, return True if it opened a new window"""
+        with self._lock:
+            self._requests += 1
+            self._sources.update(sources)
+            if self._due is not None:
+                return False
+            self._due = self._clock() + self.window
+            return True
+
+    def time_until_due(self, now=None):
+        """Return seconds until the pending delivery is due, or None"""
+        with self._lock:
+            if self._due is None:
+                return None
+            if now is None:
+                now = self._clock()
+            return max(0.0, self._due - now)
+
+    def take(self, now=None):
+        """Return the sources to deliver if due, clearing them
+
+        Returns an empty set while nothing is due.
+        """
+        with self._lock:
+            if now is None:
+                now = self._clock()
+            if self._due is None or self._due > now:
+                return frozenset()
+            return self._take()
+
+    def clear(self):
+        """Drop the pending requests, served by a full republish"""
+        with self._lock:
+            if self._due is not None:
+                self._take()
+
+    def _take(self):
+        sources = frozenset(self._sources)
+        self._sources.clear()
+        self._due = None
+        self._deliveries += 1
+        return sources
+
+    def stats(self):
+        with self._lock:
+            return {'requests': self._requests,
+                    'deliveries': self._deliveries}
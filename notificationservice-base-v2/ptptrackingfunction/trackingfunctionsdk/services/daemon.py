@@ -3,7 +3,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 #
+import collections
+import concurrent.futures
 import datetime
+import functools
 import json
 import logging
 import multiprocessing as mp
@@ -12,21 +15,26 @@ import re
 import threading
 import time
 
-from oslo_utils import uuidutils
 from trackingfunctionsdk.client.ptpeventproducer import PtpEventProducer
 from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import event_template
 from trackingfunctionsdk.common.helpers.gnss_monitor import GnssMonitor
 from trackingfunctionsdk.common.helpers import instance_config_parser
 from trackingfunctionsdk.common.helpers import log_helper
+from trackingfunctionsdk.common.helpers import phc_index
 from trackingfunctionsdk.common.helpers.os_clock_monitor import OsClockMonitor
+from trackingfunctionsdk.common.helpers import poll_scheduler
+from trackingfunctionsdk.common.helpers import process_info
 from trackingfunctionsdk.common.helpers.ptp_monitor import PtpMonitor
 from trackingfunctionsdk.common.helpers import ptpsync as utils
 from trackingfunctionsdk.common.helpers.synce_monitor import SynceMonitor
+from trackingfunctionsdk.common.helpers import trigger_coalescer
 from trackingfunctionsdk.model.dto.gnssstate import GnssState
 from trackingfunctionsdk.model.dto.osclockstate import OsClockState
 from trackingfunctionsdk.model.dto.overallclockstate import OverallClockState
 from trackingfunctionsdk.model.dto.ptpstate import PtpState
 from trackingfunctionsdk.model.dto.rpc_endpoint import RpcEndpointInfo
+from trackingfunctionsdk.services.status_snapshot import StatusSnapshot
 
 LOG = logging.getLogger(__name__)
 log_helper.config_logger(LOG)
@@ -34,37 +42,13 @@ log_helper.config_logger(LOG)
 THIS_NODE_NAME = os.environ.get("THIS_NODE_NAME", 'controller-0')
 
 # Event source to event type mapping
-source_type = {
-    '/sync/gnss-status/gnss-sync-status':
-        'event.sync.gnss-status.gnss-state-change',
-    '/sync/ptp-status/clock-class':
-        'event.sync.ptp-status.ptp-clock-class-change',
-    '/sync/ptp-status/lock-state':
-        'event.sync.ptp-status.ptp-state-change',
-    '/sync/sync-status/os-clock-sync-state':
-        'event.sync.sync-status.os-clock-sync-state-change',
-    '/sync/sync-status/sync-state':
-        'event.sync.sync-status.synchronization-state-change',
-    '/sync/synce-status/clock-quality':
-        'event.sync.synce-status.synce-clock-quality-change',
-    '/sync/synce-status/lock-state-extended':
-        'event.sync.synce-status.synce-state-change-extended',
-    '/sync/synce-status/lock-state':
-        'event.sync.synce-status.synce-state-change',
-}
+source_type = event_template.SOURCE_TYPE
 
 
 def _ts2phc_uses_generic_clock(ts2phc_instance):
     """Return True if the ts2phc instance is running with '-s generic'."""
-    pidfile = '/var/run/ts2phc-%s.pid' % ts2phc_instance
-    try:
-        with open(pidfile, 'r', encoding='utf-8') as f:
-            pid = f.readline().strip()
-        with open('/host/proc/%s/cmdline' % pid, 'r', encoding='utf-8') as f:
-            args = f.readline().strip().split('\x00')
-        return '-s' in args and args[args.index('-s') + 1] == 'generic'
-    except (OSError, ValueError, IndexError):
-        return False
+    return process_info.get_option(
+        'ts2phc-%s' % ts2phc_instance, '-s') == 'generic'
 
 
 def _get_ptp4l_effective_holdover(ptp4l_config, gnss_configs, gnss_instances,
@@ -107,9 +91,9 @@ def _get_ptp4l_effective_holdover(ptp4l_config, gnss_configs, gnss_instances,
     return ptp4l_holdover
 
 
-def _get_ptp_devices_for_config(config_file):
-    """Return set of PHC device paths for interfaces listed in a config file."""
-    devices = set()
+def _read_config_interfaces(config_file):
+    """Return the interface sections of a linuxptp config file."""
+    interfaces = []
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
             for line in f:
@@ -117,21 +101,62 @@ def _get_ptp_devices_for_config(config_file):
                 if (re.match(r'^\[.*\]$', line)
                         and line not in ('[global]',
                                          '[unicast_master_table]')):
-                    iface = line.strip('[]')
-                    dev = utils.get_interface_phc_device(iface)
-                    if dev is not None:
-                        devices.add(dev)
+                    interfaces.append(line.strip('[]'))
     except FileNotFoundError:
         LOG.warning("Config file not found: %s", config_file)
-    return devices
+    return interfaces
+
+
+def _get_ptp_devices_for_config(config_file):
+    """Return set of PHC device paths for interfaces listed in a config file."""
+    return phc_index.get_config_ptp_devices(
+        config_file, functools.partial(_read_config_interfaces, config_file))
+
+
+# A change of any of these needs a new watcher, see __apply_context()
+_RELOAD_RESTART_KEYS = ('THIS_NAMESPACE', 'THIS_NODE_NAME', 'THIS_POD_IP',
+                        'REGISTRATION_TRANSPORT_ENDPOINT',
+                        'NOTIFICATION_TRANSPORT_ENDPOINT',
+                        'PHC2SYS_SERVICE_NAME')
+
+
+def _get_config_fingerprint(config_file):
+    """Return (path, mtime, size) of a config file, size None if missing"""
+    if not config_file:
+        return None
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return config_file, None, None
+    return config_file, stat.st_mtime_ns, stat.st_size
+
+
+def _get_config_fingerprints(daemon_context):
+    """Return the config fingerprint of every instance of a daemon context
+
+    The result is keyed like the poll scheduler: (kind, instance name).
+    """
+    fingerprints = {}
+    for config in daemon_context.get('PTP4L_INSTANCES', []):
+        fingerprints[('ptp', config)] = _get_config_fingerprint(
+            constants.PTP_CONFIG_PATH + 'ptp4l-%s.conf' % config)
+    for idx, config in enumerate(daemon_context.get('GNSS_CONFIGS', [])):
+        fingerprints[('gnss', daemon_context['GNSS_INSTANCES'][idx])] = \
+            _get_config_fingerprint(config)
+    for config in daemon_context.get('SYNCE_INSTANCES', []):
+        fingerprints[('synce', config)] = _get_config_fingerprint(
+            constants.PTP_CONFIG_PATH + 'synce4l-%s.conf' % config)
+    fingerprints[('os_clock', None)] = _get_config_fingerprint(
+        daemon_context.get('PHC2SYS_CONFIG'))
+    return fingerprints
 
 
 def ProcessWorkerDefault(event, sqlalchemy_conf_json,
                          broker_transport_endpoint, holdover_config=None,
-                         reload_requested=None):
+                         reload_requested=None, reload_context=None):
     worker = PtpWatcherDefault(event, sqlalchemy_conf_json,
                                broker_transport_endpoint, holdover_config,
-                               reload_requested)
+                               reload_requested, reload_context)
     worker.run()
 
 
@@ -162,339 +187,170 @@ class PtpWatcherDefault:
     }
 
     class PtpRequestHandlerDefault(object):
+        # Per-instance sources of query_status with the snapshot contexts
+        # they are read from, the value and event time keys, and the
+        # value reported before the first sample
+        INSTANCE_QUERIES = (
+            (constants.SOURCE_SYNC_GNSS_SYNC_STATUS, 'gnss',
+             'sync_state', GnssState.Failure_Nofix, 'last_event_time'),
+            (constants.SOURCE_SYNCE_LOCK_STATE, 'synce',
+             'sync_state', 'Unknown', 'last_event_time'),
+            (constants.SOURCE_SYNCE_CLOCK_QUALITY, 'synce',
+             'clock_quality', 0xff, 'clock_quality_event_time'),
+            (constants.SOURCE_SYNC_PTP_CLOCK_CLASS, 'ptp',
+             'clock_class', '248', 'last_clock_class_event_time'),
+            (constants.SOURCE_SYNC_PTP_LOCK_STATE, 'ptp',
+             'sync_state', PtpState.Freerun, 'last_event_time'),
+        )
+
+        # Rendered responses kept, queries may name arbitrary resources
+        MAX_CACHED_RESPONSES = 64
+
         def __init__(self, watcher, daemon_context):
             self.watcher = watcher
             self.init_time = time.time()
             self.daemon_context = daemon_context
+            # (ResourceAddress, optional) -> (entries, response), least
+            # recently used first
+            self.responses = collections.OrderedDict()
+            self.responses_lock = threading.Lock()
 
         def _build_event_response(
-                self, resource_path, last_event_time, resource_address,
-                sync_state, value_type=constants.VALUE_TYPE_ENUMERATION):
-            if resource_path in [constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
-                                 constants.SOURCE_SYNCE_CLOCK_QUALITY]:
-                data_type = constants.DATA_TYPE_METRIC
-            else:
-                data_type = constants.DATA_TYPE_NOTIFICATION
-            lastStatus = {
-                'id': uuidutils.generate_uuid(),
-                'specversion': constants.SPEC_VERSION,
-                'source': resource_path,
-                'type': source_type[resource_path],
-                'time': last_event_time,
-                'data': {
-                    'version': constants.DATA_VERSION,
-                    'values': [
-                        {
-                            'data_type': data_type,
-                            'ResourceAddress': resource_address,
-                            'value_type': value_type,
-                            'value': sync_state.upper()
-                        }
-                    ]
-                }
-            }
-            return lastStatus
+                self, resource_path, last_event_time, nodename, instance,
+                value):
+            return self.watcher.event_templates.get(
+                resource_path, instance, nodename).render(
+                    last_event_time, value)
 
         def query_status(self, **rpc_kwargs):
-            # Client PULL status requests come through here
-            # Dict is used for legacy notification format
-            lastStatus = {}
-            # List is used for standard notification format
-            newStatus = []
-
+            # Client PULL status requests come through here. They are
+            # answered from the last status snapshot of the watcher without
+            # locking, so they never wait for the sampling loop.
             resource_address = rpc_kwargs.get('ResourceAddress', None)
             optional = rpc_kwargs.get('optional', None)
             if resource_address:
                 _, nodename, resource_path = utils.parse_resource_address(
                     resource_address)
-                if (resource_path == constants.SOURCE_SYNC_GNSS_SYNC_STATUS or
-                        resource_path == constants.SOURCE_SYNC_ALL):
-                    self.watcher.gnsstracker_context_lock.acquire()
-                    if (optional and
-                            self.watcher.gnsstracker_context.get(optional)):
-                        sync_state = (
-                            self.watcher.gnsstracker_context[optional].get(
-                                'sync_state', GnssState.Failure_Nofix))
-                        last_event_time = (
-                            self.watcher.gnsstracker_context[optional].get(
-                                'last_event_time', time.time()))
-                        lastStatus[optional] = self._build_event_response(
-                            constants.SOURCE_SYNC_GNSS_SYNC_STATUS,
-                            last_event_time,
-                            utils.format_resource_address(
-                                nodename,
-                                constants.SOURCE_SYNC_GNSS_SYNC_STATUS,
-                                optional),
-                            sync_state)
-                        newStatus.append(lastStatus[optional])
-                    elif not optional:
-                        for config in self.daemon_context['GNSS_INSTANCES']:
-                            sync_state = (
-                                self.watcher.gnsstracker_context[config].get(
-                                    'sync_state', GnssState.Failure_Nofix))
-                            last_event_time = (
-                                self.watcher.gnsstracker_context[config].get(
-                                    'last_event_time', time.time()))
-                            lastStatus[config] = self._build_event_response(
-                                constants.SOURCE_SYNC_GNSS_SYNC_STATUS,
-                                last_event_time,
-                                utils.format_resource_address(
-                                    nodename,
-                                    constants.SOURCE_SYNC_GNSS_SYNC_STATUS,
-                                    config),
-                                sync_state)
-                            newStatus.append(lastStatus[config])
-                    else:
-                        lastStatus = None
-                    self.watcher.gnsstracker_context_lock.release()
-                if (resource_path == constants.SOURCE_SYNCE_LOCK_STATE or
-                        resource_path == constants.SOURCE_SYNC_ALL):
-                    self.watcher.syncetracker_context_lock.acquire()
-                    try:
-                        if (optional and
-                                self.watcher.syncetracker_context.get(
-                                    optional)):
-                            sync_state = (
-                                self.watcher.syncetracker_context[
-                                    optional].get(
-                                    'sync_state', 'Unknown'))
-                            last_event_time = (
-                                self.watcher.syncetracker_context[
-                                    optional].get(
-                                    'last_event_time', time.time()))
-                            lastStatus[optional] = \
-                                self._build_event_response(
-                                    constants.SOURCE_SYNCE_LOCK_STATE,
-                                    last_event_time,
-                                    utils.format_resource_address(
-                                        nodename,
-                                        constants.SOURCE_SYNCE_LOCK_STATE,
-                                        optional),
-                                    sync_state)
-                            newStatus.append(lastStatus[optional])
-                        elif not optional:
-                            for config in self.daemon_context.get(
-                                    'SYNCE_INSTANCES', []):
-                                sync_state = (
-                                    self.watcher.syncetracker_context[
-                                        config].get(
-                                        'sync_state', 'Unknown'))
-                                last_event_time = (
-                                    self.watcher.syncetracker_context[
-                                        config].get(
-                                        'last_event_time', time.time()))
-                                lastStatus[config] = \
-                                    self._build_event_response(
-                                        constants.SOURCE_SYNCE_LOCK_STATE,
-                                        last_event_time,
-                                        utils.format_resource_address(
-                                            nodename,
-                                            constants.SOURCE_SYNCE_LOCK_STATE,
-                                            config),
-                                        sync_state)
-                                newStatus.append(lastStatus[config])
-                        else:
-                            lastStatus = None
-                    finally:
-                        self.watcher.syncetracker_context_lock.release()
-                if (resource_path == constants.SOURCE_SYNCE_CLOCK_QUALITY or
-                        resource_path == constants.SOURCE_SYNC_ALL):
-                    self.watcher.syncetracker_context_lock.acquire()
-                    try:
-                        if (optional and
-                                self.watcher.syncetracker_context.get(
-                                    optional)):
-                            ql = (
-                                self.watcher.syncetracker_context[
-                                    optional].get(
-                                    'clock_quality', 0xff))
-                            last_event_time = (
-                                self.watcher.syncetracker_context[
-                                    optional].get(
-                                    'clock_quality_event_time',
-                                    time.time()))
-                            lastStatus[optional] = \
-                                self._build_event_response(
-                                    constants.SOURCE_SYNCE_CLOCK_QUALITY,
-                                    last_event_time,
-                                    utils.format_resource_address(
-                                        nodename,
-                                        constants.SOURCE_SYNCE_CLOCK_QUALITY,
-                                        optional),
-                                    str(ql),
-                                    constants.VALUE_TYPE_METRIC)
-                            newStatus.append(lastStatus[optional])
-                        elif not optional:
-                            for config in self.daemon_context.get(
-                                    'SYNCE_INSTANCES', []):
-                                ql = (
-                                    self.watcher.syncetracker_context[
-                                        config].get(
-                                        'clock_quality', 0xff))
-                                last_event_time = (
-                                    self.watcher.syncetracker_context[
-                                        config].get(
-                                        'clock_quality_event_time',
-                                        time.time()))
-                                lastStatus[config] = \
-                                    self._build_event_response(
-                                        constants.SOURCE_SYNCE_CLOCK_QUALITY,
-                                        last_event_time,
-                                        utils.format_resource_address(
-                                            nodename,
-                                            constants.SOURCE_SYNCE_CLOCK_QUALITY,
-                                            config),
-                                        str(ql),
-                                        constants.VALUE_TYPE_METRIC)
-                                newStatus.append(lastStatus[config])
-                        else:
-                            lastStatus = None
-                    finally:
-                        self.watcher.syncetracker_context_lock.release()
-                if (resource_path == constants.SOURCE_SYNC_PTP_CLOCK_CLASS or
-                        resource_path == constants.SOURCE_SYNC_ALL):
-                    self.watcher.ptptracker_context_lock.acquire()
-                    if optional and self.watcher.ptptracker_context.get(
-                            optional):
-                        clock_class = \
-                            self.watcher.ptptracker_context[optional].get(
-                                'clock_class', '248')
-                        last_clock_class_event_time = \
-                            self.watcher.ptptracker_context[optional].get(
-                                'last_clock_class_event_time', time.time())
-                        lastStatus[optional] = self._build_event_response(
-                            constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
-                            last_clock_class_event_time,
-                            utils.format_resource_address(
-                                nodename,
-                                constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
-                                optional),
-                            clock_class,
-                            constants.VALUE_TYPE_METRIC)
-                        newStatus.append(lastStatus[optional])
-                    elif not optional:
-                        for config in self.daemon_context['PTP4L_INSTANCES']:
-                            clock_class = \
-                                self.watcher.ptptracker_context[config].get(
-                                    'clock_class', '248')
-                            last_clock_class_event_time = \
-                                self.watcher.ptptracker_context[config].get(
-                                    'last_clock_class_event_time',
-                                    time.time())
-                            lastStatus[config] = self._build_event_response(
-                                constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
-                                last_clock_class_event_time,
-                                utils.format_resource_address(
-                                    nodename,
-                                    constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
-                                    config),
-                                clock_class,
-                                constants.VALUE_TYPE_METRIC)
-                            newStatus.append(lastStatus[config])
-                    else:
-                        lastStatus = None
-                    self.watcher.ptptracker_context_lock.release()
-                if resource_path == constants.SOURCE_SYNC_PTP_LOCK_STATE or \
-                   resource_path == constants.SOURCE_SYNC_ALL:
-                    self.watcher.ptptracker_context_lock.acquire()
-                    if optional and self.watcher.ptptracker_context.get(
-                            optional):
-                        sync_state = \
-                            self.watcher.ptptracker_context[optional].get(
-                                'sync_state', PtpState.Freerun)
-                        last_event_time = \
-                            self.watcher.ptptracker_context[optional].get(
-                                'last_event_time', time.time())
-                        lastStatus[optional] = self._build_event_response(
-                            constants.SOURCE_SYNC_PTP_LOCK_STATE,
-                            last_event_time,
-                            utils.format_resource_address(
-                                nodename,
-                                constants.SOURCE_SYNC_PTP_LOCK_STATE,
-                                optional),
-                            sync_state)
-                        newStatus.append(lastStatus[optional])
-                    elif not optional:
-                        for config in self.daemon_context['PTP4L_INSTANCES']:
-                            sync_state = \
-                                self.watcher.ptptracker_context[config].get(
-                                    'sync_state', PtpState.Freerun)
-                            last_event_time = \
-                                self.watcher.ptptracker_context[config].get(
-                                    'last_event_time', time.time())
-                            lastStatus[config] = self._build_event_response(
-                                constants.SOURCE_SYNC_PTP_LOCK_STATE,
-                                last_event_time,
-                                utils.format_resource_address(
-                                    nodename,
-                                    constants.SOURCE_SYNC_PTP_LOCK_STATE,
-                                    config),
-                                sync_state)
-                            newStatus.append(lastStatus[config])
-                    else:
-                        lastStatus = None
-                    self.watcher.ptptracker_context_lock.release()
-
-                if resource_path == constants.SOURCE_SYNC_OS_CLOCK or \
-                   resource_path == constants.SOURCE_SYNC_ALL:
-                    self.watcher.osclocktracker_context_lock.acquire()
-                    sync_state = \
-                        self.watcher.osclocktracker_context.get(
-                            'sync_state', OsClockState.Freerun)
-                    last_event_time = \
-                        self.watcher.osclocktracker_context.get(
-                            'last_event_time', time.time())
-                    self.watcher.osclocktracker_context_lock.release()
-                    lastStatus['os_clock_status'] = (
-                        self._build_event_response(
-                            constants.SOURCE_SYNC_OS_CLOCK,
-                            last_event_time,
-                            utils.format_resource_address(
-                                nodename,
-                                constants.SOURCE_SYNC_OS_CLOCK),
-                            sync_state))
-                    newStatus.append(lastStatus['os_clock_status'])
-                if resource_path == constants.SOURCE_SYNC_SYNC_STATE or \
-                   resource_path == constants.SOURCE_SYNC_ALL:
-                    self.watcher.overalltracker_context_lock.acquire()
-                    sync_state = self.watcher.overalltracker_context.get(
-                        'sync_state', OverallClockState.Freerun)
-                    last_event_time = self.watcher.overalltracker_context.get(
-                        'last_event_time', time.time())
-                    self.watcher.overalltracker_context_lock.release()
-                    lastStatus['overall_sync_status'] = (
-                        self._build_event_response(
-                            constants.SOURCE_SYNC_SYNC_STATE,
-                            last_event_time,
-                            utils.format_resource_address(
-                                nodename,
-                                constants.SOURCE_SYNC_SYNC_STATE),
-                            sync_state))
-                    if resource_path == constants.SOURCE_SYNC_ALL:
-                        newStatus.append(lastStatus['overall_sync_status'])
-                    else:
-                        # Special handling for overall_sync_status
-                        # There will only ever be a single response from
-                        # SOURCE_SYNC_SYNC_STATE.
-                        # Return a dict rather than a list
-                        newStatus = lastStatus['overall_sync_status']
+                entries = self._get_entries(
+                    self.watcher.status_snapshot, resource_path, optional)
+            else:
+                nodename = resource_path = None
+                entries = ((), True)
+
+            # The response is rendered again only when a state or event
+            # time it reports changed
+            key = (resource_address, optional)
+            with self.responses_lock:
+                cached = self.responses.get(key)
+                if cached is not None:
+                    self.responses.move_to_end(key)
+            if cached is not None and cached[0] == entries:
+                status = cached[1]
+            else:
+                status = self._render_status(
+                    nodename, resource_path, *entries)
+                with self.responses_lock:
+                    self.responses[key] = (entries, status)
+                    self.responses.move_to_end(key)
+                    if len(self.responses) > self.MAX_CACHED_RESPONSES:
+                        self.responses.popitem(last=False)
+            LOG.info("PULL status returning: %s", status)
+            return status
+
+        def _get_entries(self, snapshot, resource_path, optional):
+            """Return the states a query reports and if all were found
+
+            Each entry is (name, source, instance, value, event_time), the
+            event time being None before the first event of the source.
+            Not found means the optional instance is not configured for a
+            per-instance source.
+            """
+            entries = []
+            found = True
+            for (source, contexts, value_key, default,
+                 time_key) in self.INSTANCE_QUERIES:
+                if resource_path not in (source, constants.SOURCE_SYNC_ALL):
+                    continue
+                contexts = getattr(snapshot, contexts)
+                if optional and contexts.get(optional):
+                    instances = [optional]
+                elif not optional:
+                    instances = contexts
+                else:
+                    found = False
+                    continue
+                for instance in instances:
+                    context = contexts[instance]
+                    entries.append((
+                        instance, source, instance,
+                        str(context.get(value_key, default)),
+                        context.get(time_key)))
+
+            if resource_path in (constants.SOURCE_SYNC_OS_CLOCK,
+                                 constants.SOURCE_SYNC_ALL):
+                entries.append((
+                    'os_clock_status', constants.SOURCE_SYNC_OS_CLOCK, None,
+                    snapshot.os_clock.get(
+                        'sync_state', OsClockState.Freerun),
+                    snapshot.os_clock.get('last_event_time')))
+            if resource_path in (constants.SOURCE_SYNC_SYNC_STATE,
+                                 constants.SOURCE_SYNC_ALL):
+                entries.append((
+                    'overall_sync_status', constants.SOURCE_SYNC_SYNC_STATE,
+                    None,
+                    snapshot.overall.get(
+                        'sync_state', OverallClockState.Freerun),
+                    snapshot.overall.get('last_event_time')))
+            return tuple(entries), found
+
+        def _render_status(self, nodename, resource_path, entries, found):
+            # Dict is used for legacy notification format
+            lastStatus = {}
+            # List is used for standard notification format
+            newStatus = []
+
+            now = time.time()
+            for name, source, instance, value, event_time in entries:
+                lastStatus[name] = self._build_event_response(
+                    source, now if event_time is None else event_time,
+                    nodename, instance, value)
+                newStatus.append(lastStatus[name])
+
+            if resource_path == constants.SOURCE_SYNC_SYNC_STATE:
+                # Special handling for overall_sync_status
+                # There will only ever be a single response from
+                # SOURCE_SYNC_SYNC_STATE.
+                # Return a dict rather than a list
+                newStatus = lastStatus['overall_sync_status']
 
             if constants.NOTIFICATION_FORMAT == 'standard':
-                LOG.info("PULL status returning: %s", newStatus)
                 return newStatus
+            elif not found:
+                return None
             else:
-                LOG.info("PULL status returning: {}".format(lastStatus))
                 return lastStatus
 
         def trigger_delivery(self, **rpc_kwargs):
-            self.watcher.forced_publishing = True
-            self.watcher.signal_ptp_event()
+            # Requests arriving within TRIGGER_COALESCE_SECONDS are served
+            # by a single republish of the sources they asked for
+            resource_address = rpc_kwargs.get('ResourceAddress', None)
+            resource_path = None
+            if resource_address:
+                _, _, resource_path = utils.parse_resource_address(
+                    resource_address)
+            sources = trigger_coalescer.requested_sources(resource_path)
+            if self.watcher.delivery_requests.request(sources):
+                self.watcher.signal_ptp_event()
 
     def __init__(self, event, sqlalchemy_conf_json, daemon_context_json,
-                 holdover_config=None, reload_requested=None):
+                 holdover_config=None, reload_requested=None,
+                 reload_context=None):
         self.sqlalchemy_conf = json.loads(sqlalchemy_conf_json)
         self.event = event
         self.reload_requested = reload_requested
+        # Clears reload_requested and returns the daemon context to reload
+        # with, or None if the watcher has to be restarted
+        self.reload_context = reload_context
         self.init_time = time.time()
         # Holdover config now comes from instance-monitoring.conf per instance
 
@@ -502,23 +358,11 @@ class PtpWatcherDefault:
 
         # PTP Context
         self.ptptracker_context = {}
-        gnss_configs = self.daemon_context.get('GNSS_CONFIGS', [])
-        gnss_instances = self.daemon_context.get('GNSS_INSTANCES', [])
         os_clock_holdover = instance_config_parser.get_instance_osclock_holdover_time(
             self.daemon_context.get('PHC2SYS_SERVICE_NAME', 'phc2sys'))
         for config in self.daemon_context['PTP4L_INSTANCES']:
             self.ptptracker_context[config] = \
-                PtpWatcherDefault.DEFAULT_PTPTRACKER_CONTEXT.copy()
-            self.ptptracker_context[config]['sync_state'] = PtpState.Freerun
-            self.ptptracker_context[config]['last_event_time'] = self.init_time
-            ptp4l_config = constants.PTP_CONFIG_PATH + 'ptp4l-%s.conf' % config
-            ptp4l_holdover = instance_config_parser.get_instance_holdover_time(
-                config)
-            self.ptptracker_context[config]['holdover_seconds'] = \
-                _get_ptp4l_effective_holdover(
-                    ptp4l_config, gnss_configs, gnss_instances, ptp4l_holdover)
-            # Default poll frequency
-            self.ptptracker_context[config]['poll_freq_seconds'] = 2
+                self.__new_ptptracker_context(config, self.init_time)
         self.ptp_device_simulated = \
             os.environ.get('PTP_DEVICE_SIMULATED', 'false').lower() == 'true'
         self.ptptracker_context_lock = threading.Lock()
@@ -528,15 +372,7 @@ class PtpWatcherDefault:
         self.gnsstracker_context = {}
         for config in self.daemon_context['GNSS_INSTANCES']:
             self.gnsstracker_context[config] = \
-                PtpWatcherDefault.DEFAULT_GNSSTRACKER_CONTEXT.copy()
-            self.gnsstracker_context[config]['sync_state'] = \
-                GnssState.Failure_Nofix
-            self.gnsstracker_context[config]['last_event_time'] = \
-                self.init_time
-            self.gnsstracker_context[config]['holdover_seconds'] = \
-                instance_config_parser.get_instance_gnss_holdover_time(config)
-            # Default poll frequency
-            self.gnsstracker_context[config]['poll_freq_seconds'] = 2
+                self.__new_gnsstracker_context(config, self.init_time)
         self.gnsstracker_context_lock = threading.Lock()
         LOG.debug("gnsstracker_context: %s" % self.gnsstracker_context)
 
@@ -544,13 +380,7 @@ class PtpWatcherDefault:
         self.syncetracker_context = {}
         for config in self.daemon_context.get('SYNCE_INSTANCES', []):
             self.syncetracker_context[config] = \
-                PtpWatcherDefault.DEFAULT_SYNCETRACKER_CONTEXT.copy()
-            self.syncetracker_context[config]['sync_state'] = 'Unknown'
-            self.syncetracker_context[config]['last_event_time'] = \
-                self.init_time
-            self.syncetracker_context[config]['holdover_seconds'] = \
-                instance_config_parser.get_instance_holdover_time(config)
-            self.syncetracker_context[config]['poll_freq_seconds'] = 2
+                self.__new_syncetracker_context(config, self.init_time)
         self.syncetracker_context_lock = threading.Lock()
 
         # OS Clock Context
@@ -577,6 +407,14 @@ class PtpWatcherDefault:
         self.overalltracker_context_lock = threading.Lock()
 
         self.event_timeout = float(os.environ.get('CONTROL_TIMEOUT', 2))
+        # Upper bound on the number of sources sampled concurrently
+        self.poll_workers = max(1, int(os.environ.get('POLL_WORKERS', 8)))
+        self.poll_executor = None
+        self.poll_scheduler = poll_scheduler.PollScheduler()
+        self.delivery_requests = trigger_coalescer.TriggerCoalescer(
+            constants.TRIGGER_COALESCE_SECONDS)
+        self.grandmaster_identities = {}
+        self.stats_logged_at = time.monotonic()
 
         self.node_name = self.daemon_context['THIS_NODE_NAME']
 
@@ -597,6 +435,11 @@ class PtpWatcherDefault:
             self.broker_endpoint.TransportEndpoint,
             self.registration_broker_endpoint.TransportEndpoint)
 
+        # CloudEvent templates of every published resource
+        self.event_templates = event_template.EventTemplateCache(
+            self.node_name)
+        self.event_templates.build(self.daemon_context)
+
         self.__ptprequest_handler = \
             PtpWatcherDefault.PtpRequestHandlerDefault(
                 self, self.daemon_context)
@@ -606,30 +449,88 @@ class PtpWatcherDefault:
         self.forced_publishing = True
 
         self.observer_list = [
-            GnssMonitor(
-                i,
-                holdover_time=self.gnsstracker_context[
-                    self.daemon_context['GNSS_INSTANCES'][idx]]['holdover_seconds'])
-            for idx, i in enumerate(self.daemon_context['GNSS_CONFIGS'])]
+            self.__new_gnss_monitor(config, instance)
+            for config, instance in zip(
+                self.daemon_context['GNSS_CONFIGS'],
+                self.daemon_context['GNSS_INSTANCES'])]
 
-        self.os_clock_monitor = OsClockMonitor(
-            phc2sys_config=self.daemon_context['PHC2SYS_CONFIG'],
-            tolerance_threshold=30,
-            holdover_time=self.osclocktracker_context['holdover_seconds'])
+        self.os_clock_monitor = self.__new_os_clock_monitor()
 
         self.ptp_monitor_list = [
-            PtpMonitor(config,
-                       self.ptptracker_context[config]['holdover_seconds'],
-                       self.daemon_context['PHC2SYS_SERVICE_NAME'],
-                       offset_threshold=1000000)
+            self.__new_ptp_monitor(config)
             for config in self.daemon_context['PTP4L_INSTANCES']]
 
         self.synce_monitor_list = [
-            SynceMonitor(config,
-                         holdover_time=self.syncetracker_context[config][
-                             'holdover_seconds'])
+            self.__new_synce_monitor(config)
             for config in self.daemon_context.get('SYNCE_INSTANCES', [])]
 
+        # Config file fingerprints of every instance, see __apply_context()
+        self.config_fingerprints = _get_config_fingerprints(
+            self.daemon_context)
+
+        # Tracker contexts served to pull queries, see __update_snapshot()
+        self.status_snapshot = None
+        self.__update_snapshot()
+
+    def __new_ptptracker_context(self, config, event_time):
+        context = PtpWatcherDefault.DEFAULT_PTPTRACKER_CONTEXT.copy()
+        context['sync_state'] = PtpState.Freerun
+        context['last_event_time'] = event_time
+        context['holdover_seconds'] = self.__get_ptp4l_holdover(config)
+        # Default poll frequency
+        context['poll_freq_seconds'] = 2
+        return context
+
+    def __get_ptp4l_holdover(self, config):
+        ptp4l_config = constants.PTP_CONFIG_PATH + 'ptp4l-%s.conf' % config
+        ptp4l_holdover = instance_config_parser.get_instance_holdover_time(
+            config)
+        return _get_ptp4l_effective_holdover(
+            ptp4l_config, self.daemon_context.get('GNSS_CONFIGS', []),
+            self.daemon_context.get('GNSS_INSTANCES', []), ptp4l_holdover)
+
+    def __new_gnsstracker_context(self, config, event_time):
+        context = PtpWatcherDefault.DEFAULT_GNSSTRACKER_CONTEXT.copy()
+        context['sync_state'] = GnssState.Failure_Nofix
+        context['last_event_time'] = event_time
+        context['holdover_seconds'] = \
+            instance_config_parser.get_instance_gnss_holdover_time(config)
+        # Default poll frequency
+        context['poll_freq_seconds'] = 2
+        return context
+
+    def __new_syncetracker_context(self, config, event_time):
+        context = PtpWatcherDefault.DEFAULT_SYNCETRACKER_CONTEXT.copy()
+        context['sync_state'] = 'Unknown'
+        context['last_event_time'] = event_time
+        context['holdover_seconds'] = \
+            instance_config_parser.get_instance_holdover_time(config)
+        context['poll_freq_seconds'] = 2
+        return context
+
+    def __new_gnss_monitor(self, config, instance):
+        return GnssMonitor(
+            config,
+            holdover_time=self.gnsstracker_context[instance][
+                'holdover_seconds'])
+
+    def __new_os_clock_monitor(self):
+        return OsClockMonitor(
+            phc2sys_config=self.daemon_context['PHC2SYS_CONFIG'],
+            tolerance_threshold=30,
+            holdover_time=self.osclocktracker_context['holdover_seconds'])
+
+    def __new_ptp_monitor(self, config):
+        return PtpMonitor(config,
+                          self.ptptracker_context[config]['holdover_seconds'],
+                          self.daemon_context['PHC2SYS_SERVICE_NAME'],
+                          offset_threshold=1000000)
+
+    def __new_synce_monitor(self, config):
+        return SynceMonitor(config,
+                            holdover_time=self.syncetracker_context[config][
+                                'holdover_seconds'])
+
     def signal_ptp_event(self):
         if self.event:
             self.event.set()
@@ -639,42 +540,435 @@ class PtpWatcherDefault:
     def run(self):
         # start location listener
         self.__start_listener()
+        if constants.PMC_SUBSCRIBE_EVENTS:
+            for ptp_monitor in self.ptp_monitor_list:
+                ptp_monitor.start_event_listener(self.__on_ptp_event)
 
-        # Need to give the notificationclient sidecar pods
-        # a few seconds to re-connect to the newly started
-        # RabbitMQ. If we don't wait here, the initial
-        # status delivieries can be sent before the clients
-        # are connected and they will never receive the
-        # notification
-        # This approach can probably be improved by
-        # checking the RabbitMQ endpoint
-        time.sleep(10)
+        self.__wait_for_subscribers()
 
         while True:
             # Check for reload request
             if self.reload_requested and self.reload_requested.is_set():
-                LOG.info("Reload requested, exiting daemon loop")
-                break
+                context_json = \
+                    self.reload_context() if self.reload_context else None
+                if (context_json is None or
+                        not self.__apply_context(json.loads(context_json))):
+                    LOG.info("Reload requested, exiting daemon loop")
+                    break
 
             # announce the location
             forced = self.forced_publishing
             self.forced_publishing = False
-            if self.ptptracker_context:
-                self.__publish_ptpstatus(forced)
-            if self.gnsstracker_context:
-                self.__publish_gnss_status(forced)
-            if self.syncetracker_context:
-                self.__publish_synce_status(forced)
-                self.__publish_synce_clock_quality(forced)
-            self.__publish_os_clock_status(forced)
-            self.__publish_overall_sync_status(forced)
-            if self.event.wait(self.event_timeout):
+            if forced:
+                self.delivery_requests.clear()
+            else:
+                # Republish only the sources requested by TriggerDelivery
+                forced = self.delivery_requests.take()
+                self.__wake_sources(forced)
+            samples = self.__sample_sources(forced is True)
+            # Everything published in one iteration goes out together,
+            # one message per topic and source
+            with self.ptpeventproducer.batch():
+                if samples['ptp']:
+                    self.__publish_ptpstatus(forced, samples['ptp'])
+                if samples['gnss']:
+                    self.__publish_gnss_status(forced, samples['gnss'])
+                if samples['synce']:
+                    self.__publish_synce_status(forced, samples['synce'])
+                    self.__publish_synce_clock_quality(
+                        forced, samples['synce_clock_quality'])
+                if samples['os_clock']:
+                    self.__publish_os_clock_status(
+                        forced, samples['os_clock'])
+                if any(samples.values()) or self.__forces(
+                        forced, constants.SOURCE_SYNC_SYNC_STATE):
+                    self.__publish_overall_sync_status(forced)
+            self.__update_snapshot()
+            self.__log_stats()
+            # Sleep until the next source is due or the daemon is signalled
+            timeout = self.poll_scheduler.time_until_next()
+            if timeout is None:
+                timeout = self.event_timeout
+            delivery = self.delivery_requests.time_until_due()
+            if delivery is not None:
+                timeout = min(timeout, delivery)
+            if self.event.wait(timeout):
                 LOG.debug("daemon control event is asserted")
                 self.event.clear()
             else:
                 LOG.debug("daemon control event is timeout")
             continue
         self.__stop_listener()
+        self.ptpeventproducer.stop_publishing()
+        for ptp_monitor in self.ptp_monitor_list:
+            ptp_monitor.stop_event_listener()
+        if self.poll_executor:
+            self.poll_executor.shutdown(wait=True)
+            self.poll_executor = None
+        self.os_clock_monitor.close_phc_clock()
+
+    def __log_stats(self):
+        """Log the publish and status request stats every interval"""
+        now = time.monotonic()
+        if now - self.stats_logged_at < constants.STATS_LOG_INTERVAL:
+            return
+        self.stats_logged_at = now
+        LOG.info("Publish stats: %s, status request stats: %s, "
+                 "delivery request stats: %s",
+                 self.ptpeventproducer.publish_stats(),
+                 self.ptpeventproducer.status_listener_stats(),
+                 self.delivery_requests.stats())
+
+    # Poll scheduler kind sampling each source
+    SOURCE_KIND = {
+        constants.SOURCE_SYNC_PTP_LOCK_STATE: 'ptp',
+        constants.SOURCE_SYNC_PTP_CLOCK_CLASS: 'ptp',
+        constants.SOURCE_SYNC_GNSS_SYNC_STATUS: 'gnss',
+        constants.SOURCE_SYNCE_LOCK_STATE: 'synce',
+        constants.SOURCE_SYNCE_CLOCK_QUALITY: 'synce',
+        constants.SOURCE_SYNC_OS_CLOCK: 'os_clock',
+    }
+
+    @staticmethod
+    def __forces(forced, source):
+        """Return True if source has to be published without a new event
+
+        forced is True to republish every source, or the set of sources
+        to republish.
+        """
+        if isinstance(forced, bool):
+            return forced
+        return source in forced
+
+    def __wake_sources(self, sources):
+        """Make the instances sampling sources due for polling"""
+        kinds = {self.SOURCE_KIND.get(source) for source in sources}
+        keys = []
+        if 'ptp' in kinds:
+            keys += [('ptp', monitor.ptp4l_service_name)
+                     for monitor in self.ptp_monitor_list]
+        if 'gnss' in kinds:
+            keys += [('gnss', gnss.ts2phc_service_name)
+                     for gnss in self.observer_list]
+        if 'synce' in kinds:
+            keys += [('synce', monitor.synce4l_service_name)
+                     for monitor in self.synce_monitor_list]
+        if 'os_clock' in kinds:
+            keys.append(('os_clock', None))
+        for key in keys:
+            self.poll_scheduler.wake(key)
+
+    def __update_snapshot(self):
+        """Swap in a snapshot of the tracker contexts if a state changed
+
+        Pull queries read the snapshot without locks, so they neither wait
+        for nor hold up the sampling loop.
+        """
+        # The contexts are copied under their locks, the snapshot keeps
+        # the copies
+        with self.gnsstracker_context_lock:
+            gnss = {config: dict(self.gnsstracker_context[config])
+                    for config in self.daemon_context['GNSS_INSTANCES']}
+        with self.ptptracker_context_lock:
+            ptp = {config: dict(self.ptptracker_context[config])
+                   for config in self.daemon_context['PTP4L_INSTANCES']}
+        with self.syncetracker_context_lock:
+            synce = {config: dict(self.syncetracker_context[config])
+                     for config in self.daemon_context.get(
+                         'SYNCE_INSTANCES', [])}
+        with self.osclocktracker_context_lock:
+            os_clock = dict(self.osclocktracker_context)
+        with self.overalltracker_context_lock:
+            overall = dict(self.overalltracker_context)
+        snapshot = StatusSnapshot(gnss, ptp, synce, os_clock, overall)
+        if snapshot != self.status_snapshot:
+            self.status_snapshot = snapshot
+
+    def __sample_sources(self, forced=False):
+        """Sample the monitored sources that are due for polling
+
+        Each PTP, GNSS, SyncE and OS clock monitor is polled on a bounded
+        worker pool so that one loop takes as long as the slowest source
+        rather than the sum of all of them. Only sources whose next poll
+        time has been reached are sampled, unless forced. Returns once
+        every sample is in, keyed by source kind and then by instance name.
+        """
+        if forced:
+            self.poll_scheduler.reset()
+        now = time.monotonic()
+        jobs = []
+        for ptp_monitor in self.ptp_monitor_list:
+            jobs.append(('ptp', ptp_monitor.ptp4l_service_name, ptp_monitor,
+                         functools.partial(self.__sample_ptp_status,
+                                           ptp_monitor)))
+        if self.gnsstracker_context:
+            for gnss in self.observer_list:
+                jobs.append(('gnss', gnss.ts2phc_service_name, gnss,
+                             functools.partial(self.__sample_gnss_status,
+                                               gnss)))
+        if self.syncetracker_context:
+            for synce_monitor in self.synce_monitor_list:
+                jobs.append(('synce', synce_monitor.synce4l_service_name,
+                             synce_monitor,
+                             functools.partial(self.__sample_synce_status,
+                                               synce_monitor)))
+        jobs.append(('os_clock', None, self.os_clock_monitor,
+                     self.__sample_os_clock_status))
+        jobs = [job for job in jobs
+                if self.poll_scheduler.is_due(job[:2], now)]
+
+        samples = {'ptp': {}, 'gnss': {}, 'synce': {},
+                   'synce_clock_quality': {}, 'os_clock': None}
+        if not jobs:
+            return samples
+
+        if self.poll_executor is None:
+            self.poll_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.poll_workers,
+                thread_name_prefix='ptp-poll')
+        futures = [(kind, name, monitor, self.poll_executor.submit(func))
+                   for kind, name, monitor, func in jobs]
+        for kind, name, monitor, future in futures:
+            # result() re-raises anything the monitor raised, including
+            # SystemExit, exactly as the serial loop would have
+            sample = future.result()
+            if kind == 'os_clock':
+                samples[kind] = sample
+            elif kind == 'synce':
+                samples['synce'][name], \
+                    samples['synce_clock_quality'][name] = sample
+            else:
+                samples[kind][name] = sample
+            if kind == 'ptp':
+                self.__track_grandmaster(monitor)
+            self.poll_scheduler.schedule(
+                (kind, name), self.__poll_interval(kind, monitor, sample),
+                now)
+        LOG.debug("Sampled %d sources in %.3fs",
+                  len(jobs), time.monotonic() - now)
+        return samples
+
+    def __track_grandmaster(self, ptp_monitor):
+        # A new grandmaster may announce a different UTC offset
+        gm_identity = ptp_monitor.get_grandmaster_identity()
+        previous = self.grandmaster_identities.get(
+            ptp_monitor.ptp4l_service_name)
+        self.grandmaster_identities[ptp_monitor.ptp4l_service_name] = \
+            gm_identity
+        if previous is not None and gm_identity != previous:
+            LOG.info("%s grandmaster changed from %s to %s",
+                     ptp_monitor.ptp4l_service_name, previous, gm_identity)
+            self.os_clock_monitor.invalidate_utc_offset()
+
+    def __poll_interval(self, kind, monitor, sample):
+        """Return the delay before the next poll of a sampled source"""
+        near_threshold = False
+        stable_seconds = None
+        if kind == 'ptp':
+            context = self.ptptracker_context[monitor.ptp4l_service_name]
+            near_threshold = monitor.offset_near_threshold()
+            if monitor.event_listener_active():
+                # ptp4l pushes port state and clockClass changes, so once
+                # locked the poll is only a safety net
+                stable_seconds = constants.POLL_STABLE_SECONDS
+        elif kind == 'gnss':
+            context = self.gnsstracker_context[monitor.ts2phc_service_name]
+        elif kind == 'synce':
+            context = self.syncetracker_context[
+                monitor.synce4l_service_name]
+            sample = sample[0]
+        else:
+            context = self.osclocktracker_context
+            near_threshold = monitor.offset_near_threshold()
+        _, sync_state, event_time = sample[:3]
+        if stable_seconds is None:
+            try:
+                stable_seconds = time.time() - float(event_time)
+            except (TypeError, ValueError):
+                stable_seconds = 0
+        return poll_scheduler.next_poll_interval(
+            sync_state, float(context['poll_freq_seconds']),
+            stable_seconds, near_threshold)
+
+    def __on_ptp_event(self, ptp4l_service_name):
+        # Called from a PmcEventListener thread
+        self.poll_scheduler.wake(('ptp', ptp4l_service_name))
+        self.signal_ptp_event()
+
+    def __wait_for_subscribers(self):
+        """Wait for the notification clients to bind to the local broker
+
+        The notificationclient sidecars need a moment to re-connect to
+        the newly started RabbitMQ. Status published before their fanout
+        queues are bound is never delivered to them, so the initial
+        publish waits until one of them is bound, for at most
+        BROKER_READY_TIMEOUT seconds.
+        """
+        sources = list(source_type) + [constants.SOURCE_SYNC_ALL]
+        start = time.monotonic()
+        deadline = start + constants.BROKER_READY_TIMEOUT
+        while True:
+            try:
+                if self.ptpeventproducer.has_local_subscribers(sources):
+                    LOG.info("Notification clients bound after %.1fs",
+                             time.monotonic() - start)
+                    return
+            except Exception as ex:
+                LOG.debug("Broker not ready: %s", ex)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                LOG.info("No notification client bound after %ss, "
+                         "publishing anyway",
+                         constants.BROKER_READY_TIMEOUT)
+                return
+            if self.reload_requested and self.reload_requested.is_set():
+                return
+            time.sleep(min(constants.BROKER_READY_POLL_INTERVAL, remaining))
+
+    def __apply_context(self, daemon_context):
+        """Apply a new daemon context without restarting the watcher
+
+        Only the instances that were added or removed, or whose config file
+        changed, get their monitor and tracker context rebuilt. The others
+        keep their state, holdover timers and the broker connections; their
+        holdover time is re-read in case instance-monitoring.conf changed.
+        Returns False if the change needs a new watcher instead.
+        """
+        for key in _RELOAD_RESTART_KEYS:
+            if daemon_context.get(key) != self.daemon_context.get(key):
+                LOG.info("%s changed, restarting the daemon", key)
+                return False
+
+        fingerprints = _get_config_fingerprints(daemon_context)
+        changed = {
+            key for key in set(fingerprints) | set(self.config_fingerprints)
+            if fingerprints.get(key) != self.config_fingerprints.get(key)}
+        LOG.info("Reloading daemon context, changed sources: %s",
+                 sorted(changed, key=str))
+        now = time.time()
+
+        removed_ptp = [monitor for monitor in self.ptp_monitor_list
+                       if ('ptp', monitor.ptp4l_service_name) in changed]
+        for ptp_monitor in removed_ptp:
+            ptp_monitor.stop_event_listener()
+            self.grandmaster_identities.pop(
+                ptp_monitor.ptp4l_service_name, None)
+        for key in changed:
+            self.poll_scheduler.discard(key)
+
+        # The request handler reads the instance lists of daemon_context
+        # under the tracker context locks, so both change together
+        with self.gnsstracker_context_lock:
+            self.daemon_context['GNSS_CONFIGS'] = \
+                daemon_context['GNSS_CONFIGS']
+            self.daemon_context['GNSS_INSTANCES'] = \
+                daemon_context['GNSS_INSTANCES']
+            self.gnsstracker_context = {
+                config: (self.__new_gnsstracker_context(config, now)
+                         if ('gnss', config) in changed
+                         else self.gnsstracker_context[config])
+                for config in self.daemon_context['GNSS_INSTANCES']}
+        # The effective ptp4l holdover depends on the GNSS instances
+        with self.ptptracker_context_lock:
+            self.daemon_context['PTP4L_CONFIGS'] = \
+                daemon_context.get('PTP4L_CONFIGS', [])
+            self.daemon_context['PTP4L_INSTANCES'] = \
+                daemon_context['PTP4L_INSTANCES']
+            self.ptptracker_context = {
+                config: (self.__new_ptptracker_context(config, now)
+                         if ('ptp', config) in changed
+                         else self.ptptracker_context[config])
+                for config in self.daemon_context['PTP4L_INSTANCES']}
+        with self.syncetracker_context_lock:
+            self.daemon_context['SYNCE_INSTANCES'] = \
+                daemon_context.get('SYNCE_INSTANCES', [])
+            self.syncetracker_context = {
+                config: (self.__new_syncetracker_context(config, now)
+                         if ('synce', config) in changed
+                         else self.syncetracker_context[config])
+                for config in self.daemon_context['SYNCE_INSTANCES']}
+        with self.osclocktracker_context_lock:
+            self.daemon_context['PHC2SYS_CONFIG'] = \
+                daemon_context['PHC2SYS_CONFIG']
+            self.osclocktracker_context['holdover_seconds'] = \
+                instance_config_parser.get_instance_osclock_holdover_time(
+                    self.daemon_context.get('PHC2SYS_SERVICE_NAME',
+                                            'phc2sys'))
+        self.__refresh_holdover(changed)
+        self.event_templates.build(self.daemon_context)
+
+        ptp_monitors = {monitor.ptp4l_service_name: monitor
+                        for monitor in self.ptp_monitor_list}
+        self.ptp_monitor_list = [
+            self.__new_ptp_monitor(config) if ('ptp', config) in changed
+            else ptp_monitors[config]
+            for config in self.daemon_context['PTP4L_INSTANCES']]
+        if constants.PMC_SUBSCRIBE_EVENTS:
+            for ptp_monitor in self.ptp_monitor_list:
+                ptp_monitor.start_event_listener(self.__on_ptp_event)
+
+        gnss_monitors = {monitor.ts2phc_service_name: monitor
+                         for monitor in self.observer_list}
+        self.observer_list = [
+            self.__new_gnss_monitor(config, instance)
+            if ('gnss', instance) in changed else gnss_monitors[instance]
+            for config, instance in zip(
+                self.daemon_context['GNSS_CONFIGS'],
+                self.daemon_context['GNSS_INSTANCES'])]
+
+        synce_monitors = {monitor.synce4l_service_name: monitor
+                          for monitor in self.synce_monitor_list}
+        self.synce_monitor_list = [
+            self.__new_synce_monitor(config) if ('synce', config) in changed
+            else synce_monitors[config]
+            for config in self.daemon_context['SYNCE_INSTANCES']]
+
+        if ('os_clock', None) in changed:
+            self.os_clock_monitor.close_phc_clock()
+            self.os_clock_monitor = self.__new_os_clock_monitor()
+
+        self.config_fingerprints = fingerprints
+        if changed:
+            # Publish the initial state of the rebuilt sources
+            self.forced_publishing = True
+        return True
+
+    def __refresh_holdover(self, changed):
+        """Re-read the holdover time of the sources kept over a reload"""
+        for ptp_monitor in self.ptp_monitor_list:
+            name = ptp_monitor.ptp4l_service_name
+            if ('ptp', name) in changed or \
+                    name not in self.ptptracker_context:
+                continue
+            holdover = self.__get_ptp4l_holdover(name)
+            self.ptptracker_context[name]['holdover_seconds'] = holdover
+            ptp_monitor.holdover_time = \
+                instance_config_parser.get_instance_holdover_time(
+                    name, int(holdover))
+        for gnss_monitor in self.observer_list:
+            name = gnss_monitor.ts2phc_service_name
+            if ('gnss', name) in changed or \
+                    name not in self.gnsstracker_context:
+                continue
+            holdover = \
+                instance_config_parser.get_instance_gnss_holdover_time(name)
+            self.gnsstracker_context[name]['holdover_seconds'] = holdover
+            gnss_monitor.holdover_time = \
+                instance_config_parser.get_instance_holdover_time(
+                    name, holdover)
+        for synce_monitor in self.synce_monitor_list:
+            name = synce_monitor.synce4l_service_name
+            if ('synce', name) in changed or \
+                    name not in self.syncetracker_context:
+                continue
+            holdover = instance_config_parser.get_instance_holdover_time(name)
+            self.syncetracker_context[name]['holdover_seconds'] = holdover
+            synce_monitor.holdover_time = holdover
+        if ('os_clock', None) not in changed:
+            self.os_clock_monitor.holdover_time = \
+                instance_config_parser.get_instance_osclock_holdover_time(
+                    self.os_clock_monitor.phc2sys_instance,
+                    self.osclocktracker_context['holdover_seconds'])
 
     '''Start listener to answer querying from clients'''
 
@@ -1001,20 +1295,26 @@ class PtpWatcherDefault:
 
     '''announce location'''
 
-    def __publish_os_clock_status(self, forced=False):
+    def __sample_os_clock_status(self):
         holdover_time = float(self.osclocktracker_context['holdover_seconds'])
         freq = float(self.osclocktracker_context['poll_freq_seconds'])
         sync_state = self.osclocktracker_context.get('sync_state', 'Unknown')
         last_event_time = self.osclocktracker_context.get('last_event_time',
                                                           time.time())
+
+        return self.__get_os_clock_status(
+            holdover_time, freq, sync_state, last_event_time)
+
+    def __publish_os_clock_status(self, forced=False, sample=None):
         lastStatus = {}
         newStatus = []
 
-        new_event, sync_state, new_event_time = self.__get_os_clock_status(
-            holdover_time, freq, sync_state, last_event_time)
+        if sample is None:
+            sample = self.__sample_os_clock_status()
+        new_event, sync_state, new_event_time = sample
         LOG.info("os_clock_status: state is %s, new_event is %s "
                  % (sync_state, new_event))
-        if new_event or forced:
+        if new_event or self.__forces(forced, constants.SOURCE_SYNC_OS_CLOCK):
             self.osclocktracker_context_lock.acquire()
             self.osclocktracker_context['sync_state'] = sync_state
             self.osclocktracker_context['last_event_time'] = new_event_time
@@ -1022,26 +1322,10 @@ class PtpWatcherDefault:
 
             LOG.debug("Publish OS Clock Status")
             # publish new event in API version v2 format
-            resource_address = utils.format_resource_address(
-                self.node_name, constants.SOURCE_SYNC_OS_CLOCK)
-            lastStatus['os_clock_status'] = {
-                'id': uuidutils.generate_uuid(),
-                'specversion': constants.SPEC_VERSION,
-                'source': constants.SOURCE_SYNC_OS_CLOCK,
-                'type': source_type[constants.SOURCE_SYNC_OS_CLOCK],
-                'time': new_event_time,
-                'data': {
-                    'version': constants.DATA_VERSION,
-                    'values': [
-                        {
-                            'data_type': constants.DATA_TYPE_NOTIFICATION,
-                            'ResourceAddress': resource_address,
-                            'value_type': constants.VALUE_TYPE_ENUMERATION,
-                            'value': sync_state.upper()
-                        }
-                    ]
-                }
-            }
+            template = self.event_templates.get(
+                constants.SOURCE_SYNC_OS_CLOCK)
+            lastStatus['os_clock_status'] = \
+                template.render(new_event_time, sync_state)
 
             newStatus.append(lastStatus['os_clock_status'])
 
@@ -1070,7 +1354,8 @@ class PtpWatcherDefault:
         LOG.info("overall_sync_state: state is %s, new_event is %s "
                  % (sync_state, new_event))
 
-        if new_event or forced:
+        if new_event or self.__forces(
+                forced, constants.SOURCE_SYNC_SYNC_STATE):
             # Update context
             self.overalltracker_context_lock.acquire()
             self.overalltracker_context['sync_state'] = sync_state
@@ -1078,26 +1363,10 @@ class PtpWatcherDefault:
             self.overalltracker_context_lock.release()
 
             LOG.debug("Publish overall sync status.")
-            resource_address = utils.format_resource_address(
-                self.node_name, constants.SOURCE_SYNC_SYNC_STATE)
-            lastStatus['overall_sync_status'] = {
-                'id': uuidutils.generate_uuid(),
-                'specversion': constants.SPEC_VERSION,
-                'source': constants.SOURCE_SYNC_SYNC_STATE,
-                'type': source_type[constants.SOURCE_SYNC_SYNC_STATE],
-                'time': new_event_time,
-                'data': {
-                    'version': constants.DATA_VERSION,
-                    'values': [
-                        {
-                            'data_type': constants.DATA_TYPE_NOTIFICATION,
-                            'ResourceAddress': resource_address,
-                            'value_type': constants.VALUE_TYPE_ENUMERATION,
-                            'value': sync_state.upper()
-                        }
-                    ]
-                }
-            }
+            template = self.event_templates.get(
+                constants.SOURCE_SYNC_SYNC_STATE)
+            lastStatus['overall_sync_status'] = \
+                template.render(new_event_time, sync_state)
             newStatus.append(lastStatus['overall_sync_status'])
             if constants.NOTIFICATION_FORMAT == 'standard':
                 self.ptpeventproducer.publish_status(
@@ -1110,25 +1379,39 @@ class PtpWatcherDefault:
                 self.ptpeventproducer.publish_status(
                     lastStatus, constants.SOURCE_SYNC_ALL)
 
-    def __publish_gnss_status(self, forced=False):
+    def __sample_gnss_status(self, gnss):
+        sync_state = \
+            self.gnsstracker_context[gnss.ts2phc_service_name].get(
+                'sync_state', 'Unknown')
+        last_event_time = \
+            self.gnsstracker_context[gnss.ts2phc_service_name].get(
+                'last_event_time', time.time())
+
+        return self.__get_gnss_status(sync_state, last_event_time, gnss)
+
+    def __sample_synce_status(self, synce_monitor):
+        # The clock quality is derived from the state just read
+        return synce_monitor.get_synce_status(), \
+            synce_monitor.get_clock_quality()
+
+    def __publish_gnss_status(self, forced=False, samples=None):
 
         for gnss in self.observer_list:
             # Ensure that status structs are cleared between each iteration
             lastStatus = {}
             newStatus = []
-            sync_state = \
-                self.gnsstracker_context[gnss.ts2phc_service_name].get(
-                    'sync_state', 'Unknown')
-            last_event_time = \
-                self.gnsstracker_context[gnss.ts2phc_service_name].get(
-                    'last_event_time', time.time())
-
-            new_event, sync_state, new_event_time = self.__get_gnss_status(
-                sync_state, last_event_time, gnss)
+            if samples is None:
+                sample = self.__sample_gnss_status(gnss)
+            elif gnss.ts2phc_service_name in samples:
+                sample = samples[gnss.ts2phc_service_name]
+            else:
+                continue
+            new_event, sync_state, new_event_time = sample
             LOG.info("%s gnss_status: state is %s, new_event is %s"
                      % (gnss.ts2phc_service_name, sync_state, new_event))
 
-            if new_event or forced:
+            if new_event or self.__forces(
+                    forced, constants.SOURCE_SYNC_GNSS_SYNC_STATUS):
                 # update context
                 self.gnsstracker_context_lock.acquire()
                 self.gnsstracker_context[
@@ -1140,29 +1423,11 @@ class PtpWatcherDefault:
                 LOG.debug("Publish GNSS status.")
 
                 # publish new event in API version v2 format
-                resource_address = utils.format_resource_address(
-                    self.node_name,
+                template = self.event_templates.get(
                     constants.SOURCE_SYNC_GNSS_SYNC_STATUS,
                     gnss.ts2phc_service_name)
-                lastStatus[gnss.ts2phc_service_name] = {
-                    'id': uuidutils.generate_uuid(),
-                    'specversion': constants.SPEC_VERSION,
-                    'source': constants.SOURCE_SYNC_GNSS_SYNC_STATUS,
-                    'type': source_type[
-                        constants.SOURCE_SYNC_GNSS_SYNC_STATUS],
-                    'time': new_event_time,
-                    'data': {
-                        'version': constants.DATA_VERSION,
-                        'values': [
-                            {
-                                'data_type': constants.DATA_TYPE_NOTIFICATION,
-                                'ResourceAddress': resource_address,
-                                'value_type': constants.VALUE_TYPE_ENUMERATION,
-                                'value': sync_state.upper()
-                            }
-                        ]
-                    }
-                }
+                lastStatus[gnss.ts2phc_service_name] = \
+                    template.render(new_event_time, sync_state)
                 newStatus.append(lastStatus[gnss.ts2phc_service_name])
                 if constants.NOTIFICATION_FORMAT == 'standard':
                     self.ptpeventproducer.publish_status(
@@ -1175,14 +1440,21 @@ class PtpWatcherDefault:
                     self.ptpeventproducer.publish_status(
                         newStatus, constants.SOURCE_SYNC_ALL)
 
-    def __publish_synce_status(self, forced=False):
+    def __publish_synce_status(self, forced=False, samples=None):
         for synce_monitor in self.synce_monitor_list:
             instance = synce_monitor.synce4l_service_name
-            new_event, sync_state, event_time = synce_monitor.get_synce_status()
+            if samples is None:
+                sample = synce_monitor.get_synce_status()
+            elif instance in samples:
+                sample = samples[instance]
+            else:
+                continue
+            new_event, sync_state, event_time = sample
             LOG.info("%s synce_status: state is %s, new_event is %s",
                      instance, sync_state, new_event)
 
-            if new_event or forced:
+            if new_event or self.__forces(
+                    forced, constants.SOURCE_SYNCE_LOCK_STATE):
                 self.syncetracker_context_lock.acquire()
                 try:
                     self.syncetracker_context[instance][
@@ -1192,33 +1464,10 @@ class PtpWatcherDefault:
                 finally:
                     self.syncetracker_context_lock.release()
 
-                resource_address = utils.format_resource_address(
-                    self.node_name,
-                    constants.SOURCE_SYNCE_LOCK_STATE,
-                    instance)
+                template = self.event_templates.get(
+                    constants.SOURCE_SYNCE_LOCK_STATE, instance)
                 lastStatus = {
-                    instance: {
-                        'id': uuidutils.generate_uuid(),
-                        'specversion': constants.SPEC_VERSION,
-                        'source': constants.SOURCE_SYNCE_LOCK_STATE,
-                        'type': source_type[
-                            constants.SOURCE_SYNCE_LOCK_STATE],
-                        'time': event_time,
-                        'data': {
-                            'version': constants.DATA_VERSION,
-                            'values': [
-                                {
-                                    'data_type':
-                                        constants.DATA_TYPE_NOTIFICATION,
-                                    'ResourceAddress': resource_address,
-                                    'value_type':
-                                        constants.VALUE_TYPE_ENUMERATION,
-                                    'value': sync_state.upper()
-                                }
-                            ]
-                        }
-                    }
-                }
+                    instance: template.render(event_time, sync_state)}
                 newStatus = [lastStatus[instance]]
                 if constants.NOTIFICATION_FORMAT == 'standard':
                     self.ptpeventproducer.publish_status(
@@ -1231,10 +1480,16 @@ class PtpWatcherDefault:
                     self.ptpeventproducer.publish_status(
                         lastStatus, constants.SOURCE_SYNC_ALL)
 
-    def __publish_synce_clock_quality(self, forced=False):
+    def __publish_synce_clock_quality(self, forced=False, samples=None):
         for synce_monitor in self.synce_monitor_list:
             instance = synce_monitor.synce4l_service_name
-            new_event, ql, event_time = synce_monitor.get_clock_quality()
+            if samples is None:
+                sample = synce_monitor.get_clock_quality()
+            elif instance in samples:
+                sample = samples[instance]
+            else:
+                continue
+            new_event, ql, event_time = sample
 
             # Cache QL in context for pull-mode CurrentState queries
             self.syncetracker_context_lock.acquire()
@@ -1245,33 +1500,11 @@ class PtpWatcherDefault:
             finally:
                 self.syncetracker_context_lock.release()
 
-            if new_event or forced:
-                resource_address = utils.format_resource_address(
-                    self.node_name,
-                    constants.SOURCE_SYNCE_CLOCK_QUALITY,
-                    instance)
-                lastStatus = {
-                    instance: {
-                        'id': uuidutils.generate_uuid(),
-                        'specversion': constants.SPEC_VERSION,
-                        'source': constants.SOURCE_SYNCE_CLOCK_QUALITY,
-                        'type': source_type[
-                            constants.SOURCE_SYNCE_CLOCK_QUALITY],
-                        'time': event_time,
-                        'data': {
-                            'version': constants.DATA_VERSION,
-                            'values': [
-                                {
-                                    'data_type': constants.DATA_TYPE_METRIC,
-                                    'ResourceAddress': resource_address,
-                                    'value_type':
-                                        constants.VALUE_TYPE_METRIC,
-                                    'value': ql
-                                }
-                            ]
-                        }
-                    }
-                }
+            if new_event or self.__forces(
+                    forced, constants.SOURCE_SYNCE_CLOCK_QUALITY):
+                template = self.event_templates.get(
+                    constants.SOURCE_SYNCE_CLOCK_QUALITY, instance)
+                lastStatus = {instance: template.render(event_time, ql)}
                 newStatus = [lastStatus[instance]]
                 if constants.NOTIFICATION_FORMAT == 'standard':
                     self.ptpeventproducer.publish_status(
@@ -1280,7 +1513,25 @@ class PtpWatcherDefault:
                     self.ptpeventproducer.publish_status(
                         lastStatus, constants.SOURCE_SYNCE_CLOCK_QUALITY)
 
-    def __publish_ptpstatus(self, forced=False):
+    def __sample_ptp_status(self, ptp_monitor):
+        holdover_time = float(self.ptptracker_context[
+            ptp_monitor.ptp4l_service_name]['holdover_seconds'])
+        freq = float(self.ptptracker_context[
+            ptp_monitor.ptp4l_service_name]['poll_freq_seconds'])
+        sync_state = \
+            self.ptptracker_context[ptp_monitor.ptp4l_service_name].get(
+                'sync_state', 'Unknown')
+        last_event_time = \
+            self.ptptracker_context[ptp_monitor.ptp4l_service_name].get(
+                'last_event_time', time.time())
+
+        # The clock class is read from the pmc results gathered while
+        # getting the sync state, so both stay in the same sample
+        return self.__get_ptp_status(
+            holdover_time, freq, sync_state, last_event_time,
+            ptp_monitor) + ptp_monitor.get_ptp_clock_class()
+
+    def __publish_ptpstatus(self, forced=False, samples=None):
 
         for ptp_monitor in self.ptp_monitor_list:
             # Ensure that status structs are cleared between each iteration
@@ -1289,28 +1540,23 @@ class PtpWatcherDefault:
             lastStatus = {}
             lastClockClassStatus = {}
 
-            holdover_time = float(self.ptptracker_context[
-                ptp_monitor.ptp4l_service_name]['holdover_seconds'])
-            freq = float(self.ptptracker_context[
-                ptp_monitor.ptp4l_service_name]['poll_freq_seconds'])
-            sync_state = \
-                self.ptptracker_context[ptp_monitor.ptp4l_service_name].get(
-                    'sync_state', 'Unknown')
-            last_event_time = \
-                self.ptptracker_context[ptp_monitor.ptp4l_service_name].get(
-                    'last_event_time', time.time())
-
-            new_event, sync_state, new_event_time = self.__get_ptp_status(
-                holdover_time, freq, sync_state, last_event_time, ptp_monitor)
+            if samples is None:
+                sample = self.__sample_ptp_status(ptp_monitor)
+            elif ptp_monitor.ptp4l_service_name in samples:
+                sample = samples[ptp_monitor.ptp4l_service_name]
+            else:
+                continue
+            (new_event, sync_state, new_event_time,
+             new_clock_class_event, clock_class,
+             clock_class_event_time) = sample
             LOG.info("%s PTP sync state: state is %s, new_event is %s" % (
                 ptp_monitor.ptp4l_service_name, sync_state, new_event))
 
-            new_clock_class_event, clock_class, clock_class_event_time = \
-                ptp_monitor.get_ptp_clock_class()
             LOG.info("%s PTP clock class: clockClass is %s, new_event is %s"
                      % (ptp_monitor.ptp4l_service_name, clock_class,
                         new_clock_class_event))
-            if new_event or forced:
+            if new_event or self.__forces(
+                    forced, constants.SOURCE_SYNC_PTP_LOCK_STATE):
                 # update context
                 self.ptptracker_context_lock.acquire()
                 self.ptptracker_context[ptp_monitor.ptp4l_service_name][
@@ -1333,28 +1579,11 @@ class PtpWatcherDefault:
                 self.ptpeventproducer.publish_status(lastStatus, 'PTP')
                 lastStatus = {}
                 # publish new event in API version v2 format
-                resource_address = utils.format_resource_address(
-                    self.node_name,
+                template = self.event_templates.get(
                     constants.SOURCE_SYNC_PTP_LOCK_STATE,
                     ptp_monitor.ptp4l_service_name)
-                lastStatus[ptp_monitor.ptp4l_service_name] = {
-                    'id': uuidutils.generate_uuid(),
-                    'specversion': constants.SPEC_VERSION,
-                    'source': constants.SOURCE_SYNC_PTP_LOCK_STATE,
-                    'type': source_type[constants.SOURCE_SYNC_PTP_LOCK_STATE],
-                    'time': new_event_time,
-                    'data': {
-                        'version': constants.DATA_VERSION,
-                        'values': [
-                            {
-                                'data_type': constants.DATA_TYPE_NOTIFICATION,
-                                'ResourceAddress': resource_address,
-                                'value_type': constants.VALUE_TYPE_ENUMERATION,
-                                'value': sync_state.upper()
-                            }
-                        ]
-                    }
-                }
+                lastStatus[ptp_monitor.ptp4l_service_name] = \
+                    template.render(new_event_time, sync_state)
                 self.ptptracker_context_lock.release()
                 newStatus.append(lastStatus[ptp_monitor.ptp4l_service_name])
 
@@ -1369,7 +1598,8 @@ class PtpWatcherDefault:
                     self.ptpeventproducer.publish_status(
                         lastStatus, constants.SOURCE_SYNC_ALL)
 
-            if new_clock_class_event or forced:
+            if new_clock_class_event or self.__forces(
+                    forced, constants.SOURCE_SYNC_PTP_CLOCK_CLASS):
                 # update context
                 self.ptptracker_context_lock.acquire()
                 self.ptptracker_context[ptp_monitor.ptp4l_service_name][
@@ -1378,29 +1608,14 @@ class PtpWatcherDefault:
                     'last_clock_class_event_time'] \
                     = clock_class_event_time
 
-                resource_address = utils.format_resource_address(
-                    self.node_name,
+                template = self.event_templates.get(
                     constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
                     ptp_monitor.ptp4l_service_name)
-
-                lastClockClassStatus[ptp_monitor.ptp4l_service_name] = {
-                    'id': uuidutils.generate_uuid(),
-                    'specversion': constants.SPEC_VERSION,
-                    'source': constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
-                    'type': source_type[constants.SOURCE_SYNC_PTP_CLOCK_CLASS],
-                    'time': clock_class_event_time,
-                    'data': {
-                        'version': constants.DATA_VERSION,
-                        'values': [
-                            {
-                                'data_type': constants.DATA_TYPE_NOTIFICATION,
-                                'ResourceAddress': resource_address,
-                                'value_type': constants.VALUE_TYPE_METRIC,
-                                'value': clock_class
-                            }
-                        ]
-                    }
-                }
+                # Pushed clock class events have always been typed as
+                # notifications, unlike the pull responses
+                lastClockClassStatus[ptp_monitor.ptp4l_service_name] = \
+                    template.render(clock_class_event_time, clock_class,
+                                    constants.DATA_TYPE_NOTIFICATION)
                 newClockClassStatus.append(
                     lastClockClassStatus[ptp_monitor.ptp4l_service_name])
                 self.ptptracker_context_lock.release()
@@ -1427,6 +1642,8 @@ class DaemonControl(object):
                  process_worker=None):
         self.event = mp.Event()
         self.reload_requested = mp.Event()
+        self.reload_lock = threading.Lock()
+        self.pending_context_json = None
         self.daemon_context = json.loads(daemon_context_json)
         self.node_name = self.daemon_context['THIS_NODE_NAME']
         if not process_worker:
@@ -1439,17 +1656,36 @@ class DaemonControl(object):
     def refresh(self):
         self.process_worker(self.event, self.sqlalchemy_conf_json,
                             self.daemon_context_json, None,
-                            self.reload_requested)
+                            self.reload_requested, self.take_reload_context)
         self.event.set()
 
-    def request_reload(self):
-        """Request daemon to reload configuration"""
+    def request_reload(self, daemon_context_json=None):
+        """Request daemon to reload configuration
+
+        With the new daemon context the running daemon rebuilds only the
+        instances that changed, without it the daemon loop exits.
+        """
         LOG.info("Requesting daemon reload")
-        self.reload_requested.set()
+        with self.reload_lock:
+            self.pending_context_json = daemon_context_json
+            self.reload_requested.set()
         self.event.set()
 
+    def take_reload_context(self):
+        """Clear a reload request and return its daemon context or None"""
+        with self.reload_lock:
+            context_json = self.pending_context_json
+            self.pending_context_json = None
+            self.reload_requested.clear()
+        if context_json is not None:
+            self.daemon_context_json = context_json
+            self.daemon_context = json.loads(context_json)
+        return context_json
+
     def stop(self):
         """Stop daemon gracefully"""
         LOG.debug("Stopping daemon control")
-        self.reload_requested.set()
+        with self.reload_lock:
+            self.pending_context_json = None
+            self.reload_requested.set()
         self.event.set()
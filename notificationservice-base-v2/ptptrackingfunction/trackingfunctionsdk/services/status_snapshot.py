@@ -0,0 +1,59 @@
+#
+# Copyright (c) 2026 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+"""
+Read-only snapshot of the tracker contexts for pull status queries
+
+QueryStatus used to read the tracker contexts of the daemon under the same
+locks the sampling loop holds while publishing, so many sidecars polling
+CurrentState contended with sampling. The daemon now copies the contexts
+into a StatusSnapshot after each sampling round and swaps it in with a
+single assignment; queries read whatever snapshot they got without locks.
+
+Usage:
+    snapshot = StatusSnapshot(gnss={'ts1': {...}}, ptp={'ptp1': {...}},
+                              synce={}, os_clock={...}, overall={...})
+    if snapshot != watcher.status_snapshot:
+        watcher.status_snapshot = snapshot
+    snapshot.ptp['ptp1'].get('sync_state')
+"""
+
+import types
+
+
+def _freeze(contexts):
+    """Return a read-only view of a dict of instance contexts"""
+    return types.MappingProxyType({
+        instance: types.MappingProxyType(context)
+        for instance, context in contexts.items()})
+
+
+class StatusSnapshot(object):
+    """Tracker contexts at the end of a sampling round
+
+    gnss, ptp and synce map each configured instance, in configuration
+    order, to its context; os_clock and overall are single contexts. The
+    snapshot keeps the dicts it is given, pass it copies.
+    """
+
+    __slots__ = ('gnss', 'ptp', 'synce', 'os_clock', 'overall')
+
+    def __init__(self, gnss=None, ptp=None, synce=None, os_clock=None,
+                 overall=None):
+        self.gnss = _freeze(gnss or {})
+        self.ptp = _freeze(ptp or {})
+        self.synce = _freeze(synce or {})
+        self.os_clock = types.MappingProxyType(os_clock or {})
+        self.overall = types.MappingProxyType(overall or {})
+
+    def __eq__(self, other):
+        if not isinstance(other, StatusSnapshot):
+            return NotImplemented
+        return (self.gnss == other.gnss and self.ptp == other.ptp and
+                self.synce == other.synce and
+                self.os_clock == other.os_clock and
+                self.overall == other.overall)
+
+    __hash__ = None
@@ -669,6 +669,8 @@ class TestSynceClockQualityQuery(unittest.TestCase):
         self.worker.syncetracker_context['synce1']['sync_state'] = 'Locked'
         self.worker.syncetracker_context['synce1'][
             'last_event_time'] = 1700000000.0
+        # Queries are answered from the snapshot taken after sampling
+        self.worker._PtpWatcherDefault__update_snapshot()
 
     def _query(self, resource_address, optional=None):
         handler = self.worker._PtpWatcherDefault__ptprequest_handler
@@ -739,6 +741,7 @@ class TestSynceClockQualityQuery(unittest.TestCase):
         del self.worker.syncetracker_context['synce1']['clock_quality']
         del self.worker.syncetracker_context['synce1'][
             'clock_quality_event_time']
+        self.worker._PtpWatcherDefault__update_snapshot()
         result = self._query('/././sync/synce-status/clock-quality')
         if constants.NOTIFICATION_FORMAT == 'standard':
             data = result[0]
@@ -7,6 +7,7 @@ import mock
 import os
 import unittest
 
+from trackingfunctionsdk.common.helpers import phc_index
 from trackingfunctionsdk.common.helpers.gnss_monitor import GnssMonitor
 
 testpath = os.environ.get("TESTPATH", "")
@@ -23,23 +24,24 @@ class GnssMonitorTests(unittest.TestCase):
     def test_set_ptp_devices(self):
         cgu_path = testpath + "test_input_files/mock_cgu_output_logan_beach"
         gnss_config = testpath + "test_input_files/ts2phc_valid.conf"
-        with mock.patch('trackingfunctionsdk.common.helpers.ptpsync.glob',
+        phc_index.invalidate()
+        with mock.patch('trackingfunctionsdk.common.helpers.phc_index.glob',
                 return_value=[]):
             self.gnssmon = GnssMonitor(gnss_config, cgu_path = cgu_path)
         self.assertEqual(self.gnssmon.get_ptp_devices(),[])
 
-        with mock.patch('trackingfunctionsdk.common.helpers.ptpsync.glob',
-                side_effect=[['/hostsys/class/net/ens1f0/device/ptp/ptp0'],
-                             ['/hostsys/class/net/ens2f0/device/ptp/ptp1']
-                             ]):
+        phc_index.invalidate()
+        with mock.patch('trackingfunctionsdk.common.helpers.phc_index.glob',
+                return_value=['/hostsys/class/net/ens1f0/device/ptp/ptp0',
+                              '/hostsys/class/net/ens2f0/device/ptp/ptp1']):
             self.gnssmon.set_ptp_devices()
 
         self.assertEqual(set(self.gnssmon.get_ptp_devices()),set(['ptp0','ptp1']))
 
-        with mock.patch('trackingfunctionsdk.common.helpers.ptpsync.glob',
-                side_effect=[['/hostsys/class/net/ens1f0/device/ptp/ptp0'],
-                             ['/hostsys/class/net/ens2f0/device/ptp/ptp0']
-                             ]):
+        phc_index.invalidate()
+        with mock.patch('trackingfunctionsdk.common.helpers.phc_index.glob',
+                return_value=['/hostsys/class/net/ens1f0/device/ptp/ptp0',
+                              '/hostsys/class/net/ens2f0/device/ptp/ptp0']):
             self.gnssmon.set_ptp_devices()
 
         self.assertEqual(self.gnssmon.get_ptp_devices(),['ptp0'])
@@ -102,7 +102,7 @@ class TestHoldoverLogic(unittest.TestCase):
             os_monitor.holdover_time = self.holdover_time
 
             # Mock methods to simulate freerun state
-            with patch.object(os_monitor, 'set_utc_offset'), \
+            with patch.object(os_monitor, 'refresh_utc_offset'), \
                     patch.object(os_monitor, 'get_os_clock_offset'), \
                     patch.object(os_monitor, 'set_os_clock_state'), \
                     patch.object(os_monitor, 'get_os_clock_state') as mock_get:
@@ -13,6 +13,7 @@ from unittest.mock import mock_open
 from unittest.mock import patch
 
 from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import instance_config_parser
 from trackingfunctionsdk.common.helpers.instance_config_parser import (
     _get_instance_config_value
 )
@@ -224,5 +225,49 @@ offset_threshold_major_nsec 1500000
             os.unlink(temp_path)
 
 
+class TestMonitoringConfigSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'instance-monitoring.conf')
+        self._write("[ptp4l-0]\nholdover_seconds 45\n")
+        self.patcher = patch.object(constants, 'INSTANCE_CONFIG_PATH',
+                                    self.path)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.tmpdir.cleanup()
+
+    def _write(self, content):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def test_snapshot_reused_until_file_changes(self):
+        """Test lookups share one parse until the file changes"""
+        snapshot = instance_config_parser.get_monitoring_config()
+        with patch('builtins.open', side_effect=AssertionError('reparsed')):
+            self.assertIs(instance_config_parser.get_monitoring_config(),
+                          snapshot)
+            self.assertEqual(
+                _get_instance_config_value('ptp4l-0', 'holdover_seconds', 30),
+                45)
+
+        self._write("[ptp4l-0]\nholdover_seconds 90\n# edited\n")
+        self.assertEqual(
+            _get_instance_config_value('ptp4l-0', 'holdover_seconds', 30), 90)
+        # The old snapshot is immutable and unchanged
+        self.assertEqual(snapshot.get('ptp4l-0', 'holdover_seconds'), '45')
+        with self.assertRaises(TypeError):
+            snapshot.section('ptp4l-0')['holdover_seconds'] = '1'
+
+    def test_reload_swaps_snapshot(self):
+        """Test reload_monitoring_config replaces the current snapshot"""
+        old = instance_config_parser.get_monitoring_config()
+        new = instance_config_parser.reload_monitoring_config()
+        self.assertIsNot(old, new)
+        self.assertIs(instance_config_parser.get_monitoring_config(), new)
+
+
 if __name__ == '__main__':
     unittest.main()
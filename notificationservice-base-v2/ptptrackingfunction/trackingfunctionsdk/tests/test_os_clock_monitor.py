@@ -10,6 +10,7 @@ from unittest.mock import mock_open
 import mock
 
 from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import phc_index
 from trackingfunctionsdk.common.helpers.os_clock_monitor import OsClockMonitor
 from trackingfunctionsdk.model.dto.osclockstate import OsClockState
 
@@ -39,7 +40,7 @@ class OsClockMonitorTests(unittest.TestCase):
         self.clockmon.phc2sys_config = testpath + "test_input_files/phc2sys-test.conf"
         self.assertEqual(self.clockmon._check_config_file_interface(), "ens2f0")
 
-    @mock.patch('trackingfunctionsdk.common.helpers.os_clock_monitor.open', new_callable=mock_open,
+    @mock.patch('trackingfunctionsdk.common.helpers.process_info.open', new_callable=mock_open,
                 read_data="101")
     def test_check_command_line_interface(self, mo):
         # Use mock to return the expected readline values
@@ -58,27 +59,30 @@ class OsClockMonitorTests(unittest.TestCase):
         mo.side_effect = handlers
         self.assertEqual(self.clockmon._get_phc2sys_command_line_option("/var/run/", "-s"), None)
 
-    @mock.patch('trackingfunctionsdk.common.helpers.ptpsync.glob',
-                side_effect=[['/hostsys/class/net/ens1f0/device/ptp/ptp0'],
-                             ['/hostsys/class/net/ens1f0/device/ptp/ptp0',
-                              '/hostsys/class/net/ens1f0/device/ptp/ptp1'],
-                             [],
-                             []
-                             ])
-    def test_get_interface_phc_device(self, glob_patched):
+    def test_get_interface_phc_device(self):
         # Success path
         self.clockmon = OsClockMonitor(phc2sys_config=phc2sys_test_config, init=False)
         self.clockmon.phc_interface = "ens1f0"
-        self.assertEqual(self.clockmon._get_interface_phc_device(), 'ptp0')
+        phc_index.invalidate()
+        with mock.patch('trackingfunctionsdk.common.helpers.phc_index.glob',
+                        return_value=['/hostsys/class/net/ens1f0/device/ptp/ptp0']):
+            self.assertEqual(self.clockmon._get_interface_phc_device(), 'ptp0')
 
         # Fail path #1 - multiple devices found
-        self.assertEqual(self.clockmon._get_interface_phc_device(), None)
+        phc_index.invalidate()
+        with mock.patch('trackingfunctionsdk.common.helpers.phc_index.glob',
+                        return_value=['/hostsys/class/net/ens1f0/device/ptp/ptp0',
+                                      '/hostsys/class/net/ens1f0/device/ptp/ptp1']):
+            self.assertEqual(self.clockmon._get_interface_phc_device(), None)
 
         # Fail path #2 - no devices found
-        self.assertEqual(self.clockmon._get_interface_phc_device(), None)
+        phc_index.invalidate()
+        with mock.patch('trackingfunctionsdk.common.helpers.phc_index.glob',
+                        return_value=[]):
+            self.assertEqual(self.clockmon._get_interface_phc_device(), None)
 
-    @mock.patch('trackingfunctionsdk.common.helpers.os_clock_monitor.subprocess.check_output',
-                side_effect=[b'-37000000015ns'])
+    @mock.patch('trackingfunctionsdk.common.helpers.ptpsync.run_command',
+                side_effect=[(b'-37000000015ns', b'', 0, 0.01)])
     def test_get_os_clock_offset(self, subprocess_patched):
         self.clockmon = OsClockMonitor(phc2sys_config=phc2sys_test_config, init=False)
         self.clockmon.ptp_device = 'ptp0'
@@ -5,8 +5,11 @@
 #
 import mock
 import os
+import tempfile
 import unittest
 
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import phc_index
 from trackingfunctionsdk.common.helpers.ptp_monitor import PtpMonitor
 
 testpath = os.environ.get("TESTPATH", "")
@@ -40,29 +43,34 @@ class PtpMonitorTests(unittest.TestCase):
         )
         self.ptpmon.ptp4l_config = testpath + "test_input_files/ptp4l-ptp-inst1.conf"
 
+        phc_index.invalidate()
         with mock.patch(
-            "trackingfunctionsdk.common.helpers.ptpsync.glob", return_value=[]
+            "trackingfunctionsdk.common.helpers.phc_index.glob", return_value=[]
         ):
             self.ptpmon.set_ptp_devices()
         self.assertEqual(self.ptpmon.get_ptp_devices(), [])
 
-        with mock.patch(
-            "trackingfunctionsdk.common.helpers.ptpsync.glob",
-            side_effect=[
-                ["/hostsys/class/net/enp81s0f3/device/ptp/ptp0"],
-                ["/hostsys/class/net/enp81s0f4/device/ptp/ptp1"],
-            ],
-        ):
-            self.ptpmon.set_ptp_devices()
+        # Sibling ports need a phc_index to tell their PHCs apart
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "ptp-interfaces.conf"), "w") as f:
+                f.write("[enp81s0f3]\nphc_index 0\n"
+                        "[enp81s0f4]\nphc_index 1\n")
+            with mock.patch.object(constants, "PTP_CONFIG_PATH",
+                                   tmpdir + "/"), mock.patch(
+                "trackingfunctionsdk.common.helpers.phc_index.glob",
+                return_value=[
+                    "/hostsys/class/net/enp81s0f3/device/ptp/ptp0",
+                    "/hostsys/class/net/enp81s0f4/device/ptp/ptp1",
+                ],
+            ):
+                self.ptpmon.set_ptp_devices()
         self.assertEqual(set(self.ptpmon.get_ptp_devices()),
                          set(["ptp0", "ptp1"]))
 
+        phc_index.invalidate()
         with mock.patch(
-            "trackingfunctionsdk.common.helpers.ptpsync.glob",
-            side_effect=[
-                ["/hostsys/class/net/enp81s0f3/device/ptp/ptp0"],
-                ["/hostsys/class/net/enp81s0f4/device/ptp/ptp0"],
-            ],
+            "trackingfunctionsdk.common.helpers.phc_index.glob",
+            return_value=["/hostsys/class/net/enp81s0f3/device/ptp/ptp0"],
         ):
             self.ptpmon.set_ptp_devices()
 
@@ -6,9 +6,11 @@ ptp-notification-armada-app.
 Copyright (c) 2026 Wind River Systems, Inc.
 SPDX-License-Identifier: Apache-2.0
 """
+import importlib.util
 import os
 import sys
 import tempfile
+from unittest import mock
 
 import pytest
 
@@ -20,8 +22,22 @@ TRACKING_SDK = os.path.join(
     'notificationservice-base-v2',
     'ptptrackingfunction')
 
-if TRACKING_SDK not in sys.path:
-    sys.path.insert(0, TRACKING_SDK)
+NOTIFICATION_CLIENT_SDK = os.path.join(
+    PROJECT_ROOT,
+    'notificationclient-base',
+    'docker',
+    'notificationclient-sidecar')
+
+for sdk_path in (TRACKING_SDK, NOTIFICATION_CLIENT_SDK):
+    if sdk_path not in sys.path:
+        sys.path.insert(0, sdk_path)
+
+# The database repositories of the sidecar need sqlalchemy. The sidecar
+# units under test don't use them, so stand in for them without it.
+if importlib.util.find_spec('sqlalchemy') is None:
+    for repository in ('node_repo', 'subscription_repo'):
+        sys.modules.setdefault(
+            'notificationclientsdk.repository.' + repository, mock.MagicMock())
 
 
 @pytest.fixture
@@ -312,7 +312,7 @@ class TestPtpMonitorExtended(unittest.TestCase):
     """Test ptp_monitor methods not yet covered."""
 
     @mock.patch('trackingfunctionsdk.common.helpers'
-                '.ptpsync.run_shell2')
+                '.ptpsync.run_command')
     def test_ptpsync_parse_error(self, mock_shell):
         """Test ptpsync with error return code exits."""
         from trackingfunctionsdk.common.helpers \
@@ -321,12 +321,12 @@ class TestPtpMonitorExtended(unittest.TestCase):
         monitor.ptp4l_service_name = 'x'
         monitor.domain_number = 0
         monitor.uds_address = '/var/run/ptp4l-x'
-        mock_shell.return_value = (b'', b'error', 1)
+        mock_shell.return_value = (b'', b'error', 1, 0.01)
         with self.assertRaises(SystemExit):
             monitor.ptpsync()
 
     @mock.patch('trackingfunctionsdk.common.helpers'
-                '.ptpsync.run_shell2')
+                '.ptpsync.run_command')
     def test_ptpsync_multi_port(self, mock_shell):
         """Test ptpsync with multiple port results."""
         from trackingfunctionsdk.common.helpers \
@@ -347,7 +347,7 @@ class TestPtpMonitorExtended(unittest.TestCase):
             b"portState master\\n\\t\\t"
             b"gmPresent true"
         )
-        mock_shell.return_value = (pmc_out, b'', 0)
+        mock_shell.return_value = (pmc_out, b'', 0, 0.01)
         result, total, port_count = monitor.ptpsync()
         self.assertIsInstance(result, dict)
         self.assertGreaterEqual(port_count, 1)
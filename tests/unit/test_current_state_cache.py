@@ -0,0 +1,136 @@
+"""
+Unit tests for answering CurrentState from the
+short-lived cache of the sidecar.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import unittest
+
+from notificationclientsdk.services import current_state_cache
+
+LOCK_STATE = '/./controller-0/ptp1/sync/ptp-status/lock-state'
+OS_CLOCK = '/./controller-0/sync/sync-status/os-clock-sync-state'
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _event(resource_address, value, time):
+    return {
+        'id': 'event-' + value,
+        'time': time,
+        'data': {
+            'version': '1.0',
+            'values': [{
+                'ResourceAddress': resource_address,
+                'value_type': 'enumeration',
+                'data_type': 'notification',
+                'value': value,
+            }],
+        },
+    }
+
+
+class TestRecordEvents(unittest.TestCase):
+    """Test record_events."""
+
+    def test_newest_event_kept(self):
+        current_states = {}
+        current_state_cache.record_events(
+            current_states, [_event(LOCK_STATE, 'LOCKED', 2.0),
+                             _event(OS_CLOCK, 'LOCKED', 2.0)])
+        current_state_cache.record_events(
+            current_states, _event(LOCK_STATE, 'FREERUN', 1.0))
+        self.assertEqual(
+            current_states[LOCK_STATE]['data']['values'][0]['value'],
+            'LOCKED')
+        current_state_cache.record_events(
+            current_states, {'ptp1': _event(LOCK_STATE, 'FREERUN', 3.0)})
+        self.assertEqual(
+            current_states[LOCK_STATE]['data']['values'][0]['value'],
+            'FREERUN')
+        self.assertEqual(len(current_states), 2)
+
+    def test_v1_status_ignored(self):
+        current_states = {}
+        current_state_cache.record_events(
+            current_states, {'ResourceType': 'PTP', 'EventData': {}})
+        self.assertEqual(current_states, {})
+
+
+class TestCurrentStateCache(unittest.TestCase):
+    """Test CurrentStateCache."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.current_states = {}
+        self.cache = current_state_cache.CurrentStateCache(
+            self.current_states, ttl=2, clock=self.clock)
+
+    def _value(self, status):
+        return status[0]['data']['values'][0]['value']
+
+    def test_response_expires(self):
+        self.assertIsNone(self.cache.get('controller-0', LOCK_STATE))
+        self.cache.put('controller-0', LOCK_STATE, None,
+                       [_event(LOCK_STATE, 'LOCKED', 1.0)])
+        self.clock.now += 1.5
+        self.assertEqual(
+            self._value(self.cache.get('controller-0', LOCK_STATE)),
+            'LOCKED')
+        self.assertIsNone(self.cache.get('controller-0', LOCK_STATE, 'ptp2'))
+        self.clock.now += 0.5
+        self.assertIsNone(self.cache.get('controller-0', LOCK_STATE))
+
+    def test_zero_ttl_disables_cache(self):
+        cache = current_state_cache.CurrentStateCache(
+            self.current_states, ttl=0, clock=self.clock)
+        cache.put('controller-0', LOCK_STATE, None,
+                  [_event(LOCK_STATE, 'LOCKED', 1.0)])
+        self.assertIsNone(cache.get('controller-0', LOCK_STATE))
+
+    def test_newer_recorded_event_answered(self):
+        self.cache.put('controller-0', LOCK_STATE, None,
+                       [_event(LOCK_STATE, 'LOCKED', 1.0)])
+        current_state_cache.record_events(
+            self.current_states, _event(LOCK_STATE, 'FREERUN', 2.0))
+        self.assertEqual(
+            self._value(self.cache.get('controller-0', LOCK_STATE)),
+            'FREERUN')
+
+        # An older recorded event does not replace the cached one
+        self.cache.put('controller-0', OS_CLOCK, None,
+                       {'os': _event(OS_CLOCK, 'LOCKED', 5.0)})
+        self.current_states[OS_CLOCK] = _event(OS_CLOCK, 'FREERUN', 4.0)
+        status = self.cache.get('controller-0', OS_CLOCK)
+        self.assertEqual(status['os']['data']['values'][0]['value'],
+                         'LOCKED')
+
+    def test_responses_are_copies(self):
+        status = [_event(LOCK_STATE, 'LOCKED', 1.0)]
+        self.cache.put('controller-0', LOCK_STATE, None, status)
+        status[0]['time'] = 'formatted'
+        answered = self.cache.get('controller-0', LOCK_STATE)
+        self.assertEqual(answered[0]['time'], 1.0)
+        answered[0]['time'] = 'formatted'
+        self.assertEqual(
+            self.cache.get('controller-0', LOCK_STATE)[0]['time'], 1.0)
+
+    def test_responses_bounded(self):
+        self.cache.MAX_RESPONSES = 2
+        for node in ('a', 'b', 'c'):
+            self.cache.put(node, None, None, [])
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('c'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -55,9 +55,8 @@ class TestDaemonHelpers(unittest.TestCase):
             config_path = tmp_file.name
         try:
             with mock.patch(
-                    'trackingfunctionsdk.services'
-                    '.daemon.utils'
-                    '.get_interface_phc_device',
+                    'trackingfunctionsdk.common.helpers'
+                    '.phc_index.PhcIndex.get_phc_device',
                     return_value='ptp0'):
                 result = (
                     _get_ptp_devices_for_config(
@@ -430,6 +430,104 @@ class TestDaemonCalculateHoldover(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestDaemonSampleSources(unittest.TestCase):
+    """Test __sample_sources."""
+
+    def _slow_ptp_monitor(self, name, barrier):
+        """Build a PTP monitor mock that waits on a barrier.
+
+        name -- ptp4l instance name
+        barrier -- barrier shared by all monitors
+        """
+        ptp_monitor = mock.MagicMock()
+        ptp_monitor.ptp4l_service_name = name
+
+        def get_ptp_sync_state():
+            barrier.wait(timeout=5)
+            return False, PtpState.Locked, 1.0
+        ptp_monitor.get_ptp_sync_state.side_effect = \
+            get_ptp_sync_state
+        ptp_monitor.get_ptp_clock_class.return_value = (
+            False, '6', 2.0)
+        return ptp_monitor
+
+    def test_sample_sources_concurrently(self):
+        """Test all monitors are sampled at the same time."""
+        watcher = _create_ptp_watcher()
+        watcher.ptp_device_simulated = False
+        barrier = threading.Barrier(2)
+        watcher.ptptracker_context['ptp-inst2'] = dict(
+            watcher.ptptracker_context['ptp-inst1'])
+        watcher.ptp_monitor_list = [
+            self._slow_ptp_monitor('ptp-inst1', barrier),
+            self._slow_ptp_monitor('ptp-inst2', barrier)]
+        watcher.observer_list[0].ts2phc_service_name = 'gnss-inst1'
+        watcher.observer_list[0].get_gnss_status.return_value = (
+            True, GnssState.Synchronized, 3.0)
+        watcher.os_clock_monitor.os_clock_status.return_value = (
+            False, OsClockState.Locked, 4.0)
+        sample = watcher._PtpWatcherDefault__sample_sources
+        try:
+            samples = sample()
+        finally:
+            watcher.poll_executor.shutdown()
+        self.assertEqual(
+            samples['ptp']['ptp-inst2'],
+            (False, PtpState.Locked, 1.0, False, '6', 2.0))
+        self.assertEqual(
+            samples['gnss']['gnss-inst1'],
+            (True, GnssState.Synchronized, 3.0))
+        self.assertEqual(
+            samples['os_clock'],
+            (False, OsClockState.Locked, 4.0))
+
+    def test_sample_sources_propagates_exit(self):
+        """Test a monitor exiting stops the loop like before."""
+        watcher = _create_ptp_watcher()
+        watcher.ptp_device_simulated = False
+        watcher.ptp_monitor_list[0].ptp4l_service_name = 'ptp-inst1'
+        watcher.ptp_monitor_list[0].get_ptp_sync_state \
+            .side_effect = SystemExit(0)
+        sample = watcher._PtpWatcherDefault__sample_sources
+        try:
+            with self.assertRaises(SystemExit):
+                sample()
+        finally:
+            watcher.poll_executor.shutdown()
+
+    def test_sample_sources_skips_sources_not_due(self):
+        """Test a sampled source is not polled again until due."""
+        watcher = _create_ptp_watcher()
+        watcher.ptp_device_simulated = False
+        ptp_monitor = watcher.ptp_monitor_list[0]
+        ptp_monitor.ptp4l_service_name = 'ptp-inst1'
+        ptp_monitor.get_ptp_sync_state.return_value = (
+            False, PtpState.Locked, time.time())
+        ptp_monitor.get_ptp_clock_class.return_value = (
+            False, '6', time.time())
+        ptp_monitor.offset_near_threshold.return_value = False
+        watcher.observer_list[0].ts2phc_service_name = 'gnss-inst1'
+        watcher.observer_list[0].get_gnss_status.return_value = (
+            False, GnssState.Synchronized, time.time())
+        watcher.os_clock_monitor.os_clock_status.return_value = (
+            False, OsClockState.Locked, time.time())
+        watcher.os_clock_monitor.offset_near_threshold \
+            .return_value = False
+        sample = watcher._PtpWatcherDefault__sample_sources
+        try:
+            self.assertIn('ptp-inst1', sample()['ptp'])
+            samples = sample()
+            self.assertEqual(samples['ptp'], {})
+            self.assertIsNone(samples['os_clock'])
+            self.assertEqual(
+                ptp_monitor.get_ptp_sync_state.call_count, 1)
+            self.assertIn('ptp-inst1', sample(forced=True)['ptp'])
+        finally:
+            watcher.poll_executor.shutdown()
+        self.assertGreater(
+            watcher.poll_scheduler.time_until_next(), 1)
+
+
 class TestDaemonStartStopListener(unittest.TestCase):
     """Test __start_listener and __stop_listener."""
 
@@ -466,15 +564,22 @@ class TestDaemonRequestHandler(unittest.TestCase):
             watcher
             ._PtpWatcherDefault__ptprequest_handler)
         resource_address = (
-            '/./' + 'controller-0'
+            '/./' + 'controller-0' + '/ptp1'
             + constants.SOURCE_SYNC_PTP_LOCK_STATE)
         result = handler._build_event_response(
             constants.SOURCE_SYNC_PTP_LOCK_STATE,
             time.time(),
-            resource_address,
+            'controller-0', 'ptp1',
             'Locked')
         self.assertIn('id', result)
         self.assertIn('data', result)
+        self.assertEqual(
+            result['data']['values'][0]
+            ['ResourceAddress'],
+            resource_address)
+        self.assertEqual(
+            result['data']['values'][0]['value'],
+            'LOCKED')
         data_type = (
             result['data']['values'][0]
             ['data_type'])
@@ -488,14 +593,10 @@ class TestDaemonRequestHandler(unittest.TestCase):
         handler = (
             watcher
             ._PtpWatcherDefault__ptprequest_handler)
-        resource_address = (
-            '/./' + 'controller-0'
-            + constants
-            .SOURCE_SYNC_PTP_CLOCK_CLASS)
         result = handler._build_event_response(
             constants.SOURCE_SYNC_PTP_CLOCK_CLASS,
             time.time(),
-            resource_address,
+            'controller-0', 'ptp1',
             '6')
         data_type = (
             result['data']['values'][0]
@@ -187,11 +187,11 @@ class TestPtpMonitorPtpsync(unittest.TestCase):
 
     @mock.patch(
         'trackingfunctionsdk.common.helpers'
-        '.ptpsync.run_shell2')
+        '.ptpsync.run_command')
     def test_ptpsync(self, mock_shell):
         """Test ptpsync parses PMC output.
 
-        mock_shell -- mocked run_shell2 function
+        mock_shell -- mocked run_command function
         """
         from trackingfunctionsdk.common.helpers \
             .ptp_monitor import PtpMonitor
@@ -211,7 +211,7 @@ class TestPtpMonitorPtpsync(unittest.TestCase):
             b"clockClass 6"
         )
         mock_shell.return_value = (
-            pmc_out, b'', 0)
+            pmc_out, b'', 0, 0.01)
         result, total, port_count = (
             monitor.ptpsync())
         self.assertIsInstance(result, dict)
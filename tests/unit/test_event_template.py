@@ -0,0 +1,100 @@
+"""
+Unit tests for the precomputed CloudEvent templates.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import unittest
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers.event_template import (
+    EventTemplateCache)
+
+DAEMON_CONTEXT = {
+    'PTP4L_INSTANCES': ['ptp1'],
+    'GNSS_INSTANCES': ['ts1'],
+    'SYNCE_INSTANCES': ['synce1'],
+}
+
+
+class TestEventTemplate(unittest.TestCase):
+    """Test EventTemplate.render."""
+
+    def setUp(self):
+        self.templates = EventTemplateCache('controller-0')
+        self.templates.build(DAEMON_CONTEXT)
+
+    def test_render_state(self):
+        template = self.templates.get(
+            constants.SOURCE_SYNC_PTP_LOCK_STATE, 'ptp1')
+        event = template.render(1.5, 'Locked')
+        self.assertTrue(event.pop('id'))
+        self.assertEqual(event, {
+            'specversion': constants.SPEC_VERSION,
+            'source': constants.SOURCE_SYNC_PTP_LOCK_STATE,
+            'type': 'event.sync.ptp-status.ptp-state-change',
+            'time': 1.5,
+            'data': {
+                'version': constants.DATA_VERSION,
+                'values': [{
+                    'data_type': constants.DATA_TYPE_NOTIFICATION,
+                    'ResourceAddress':
+                        '/./controller-0/ptp1/sync/ptp-status/lock-state',
+                    'value_type': constants.VALUE_TYPE_ENUMERATION,
+                    'value': 'LOCKED'}]}})
+
+    def test_render_metric(self):
+        template = self.templates.get(
+            constants.SOURCE_SYNCE_CLOCK_QUALITY, 'synce1')
+        value = template.render(1.5, 2)['data']['values'][0]
+        self.assertEqual(value['data_type'], constants.DATA_TYPE_METRIC)
+        self.assertEqual(value['value_type'], constants.VALUE_TYPE_METRIC)
+        self.assertEqual(value['value'], 2)
+
+    def test_events_do_not_share_state(self):
+        template = self.templates.get(constants.SOURCE_SYNC_OS_CLOCK)
+        first = template.render(1.0, 'Locked')
+        second = template.render(2.0, 'Freerun')
+        self.assertNotEqual(first['id'], second['id'])
+        self.assertEqual(first['data']['values'][0]['value'], 'LOCKED')
+        self.assertIsNot(first['data'], second['data'])
+
+
+class TestEventTemplateCache(unittest.TestCase):
+    """Test EventTemplateCache."""
+
+    def setUp(self):
+        self.templates = EventTemplateCache('controller-0', max_size=10)
+        self.templates.build(DAEMON_CONTEXT)
+
+    def test_templates_prebuilt_and_reused(self):
+        template = self.templates.get(
+            constants.SOURCE_SYNC_GNSS_SYNC_STATUS, 'ts1')
+        self.assertIs(self.templates.get(
+            constants.SOURCE_SYNC_GNSS_SYNC_STATUS, 'ts1'), template)
+        # Two node sources and five per-instance sources
+        self.assertEqual(len(self.templates._templates), 7)
+
+    def test_build_drops_removed_instances(self):
+        self.templates.build(dict(DAEMON_CONTEXT, PTP4L_INSTANCES=['ptp2']))
+        keys = {key[2] for key in self.templates._templates}
+        self.assertIn('ptp2', keys)
+        self.assertNotIn('ptp1', keys)
+
+    def test_other_node_names_cached_up_to_max_size(self):
+        template = self.templates.get(
+            constants.SOURCE_SYNC_SYNC_STATE, node_name='.')
+        self.assertEqual(
+            template.render(1.0, 'Locked')['data']['values'][0]
+            ['ResourceAddress'], '/././sync/sync-status/sync-state')
+        self.assertIs(self.templates.get(
+            constants.SOURCE_SYNC_SYNC_STATE, node_name='.'), template)
+        for index in range(5):
+            self.templates.get(constants.SOURCE_SYNC_SYNC_STATE,
+                               node_name='node%d' % index)
+        self.assertEqual(len(self.templates._templates), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -44,9 +44,8 @@ class TestGnssMonitorCoverage(unittest.TestCase):
             '.gnss_monitor.CguHandler')
         phc_patch = mock.patch(
             'trackingfunctionsdk.common.helpers'
-            '.gnss_monitor.utils'
-            '.get_interface_phc_device',
-            return_value='ptp0')
+            '.phc_index.get_config_ptp_devices',
+            return_value={'ptp0'})
         with mock.patch.object(
                 constants,
                 'TS2PHC_CONFIG_PATH',
@@ -0,0 +1,370 @@
+"""
+Unit tests for delivering notifications to the subscribers
+of the sidecar concurrently, over kept-alive sessions.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import copy
+import threading
+import time
+import unittest
+from unittest import mock
+
+from notificationclientsdk.common.helpers import constants
+from notificationclientsdk.common.helpers import subscription_helper
+from notificationclientsdk.common.helpers.nodeinfo_helper import \
+    NodeInfoHelper
+from notificationclientsdk.services import notification_delivery
+from notificationclientsdk.services import notification_handler
+
+LOCK_STATE = '/./controller-0' + constants.SOURCE_SYNC_PTP_LOCK_STATE
+
+
+class Subscription(object):
+    """Stand-in for the subscriptions, as ORM entries and DTOs"""
+
+    def __init__(self, subscription_id, endpoint=None,
+                 resource_address='/./controller-0/sync'):
+        self.SubscriptionId = subscription_id
+        self.UriLocation = '/subscriptions/' + subscription_id
+        self.EndpointUri = 'http://127.0.0.1:9090/' + (
+            endpoint or subscription_id)
+        self.ResourceAddress = resource_address
+        self.ResourceType = None
+        self.ResourceQualifierJson = None
+        self.Status = 1
+
+
+def _event(resource_address, value, time):
+    return {
+        'id': 'event-%s-%s' % (value, time),
+        'source': constants.SOURCE_SYNC_PTP_LOCK_STATE,
+        'type': 'event.sync.ptp-status.ptp-state-change',
+        'time': time,
+        'data': {
+            'version': '1.0',
+            'values': [{
+                'ResourceAddress': resource_address,
+                'value_type': 'enumeration',
+                'data_type': 'notification',
+                'value': value,
+            }],
+        },
+    }
+
+
+class Posts(object):
+    """Records the notifications posted in place of notify()"""
+
+    def __init__(self):
+        self.started = []
+        self.posted = []
+        self.sessions = []
+        self.delays = {}
+        self.failures = {}
+        self._cond = threading.Condition()
+
+    def notify(self, subscription, notification, session=None):
+        with self._cond:
+            self.started.append(subscription.SubscriptionId)
+            self._cond.notify_all()
+        delay = self.delays.get(subscription.SubscriptionId)
+        if delay:
+            delay.wait(5)
+        with self._cond:
+            failures = self.failures.get(subscription.SubscriptionId, 0)
+            if failures:
+                self.failures[subscription.SubscriptionId] = failures - 1
+                raise Exception('endpoint unavailable')
+            self.posted.append((subscription.SubscriptionId,
+                                copy.deepcopy(notification)))
+            self.sessions.append(session)
+            self._cond.notify_all()
+
+    def wait_started(self, count, timeout=5):
+        with self._cond:
+            self._cond.wait_for(lambda: len(self.started) >= count, timeout)
+
+    def wait_for(self, count, timeout=5):
+        with self._cond:
+            self._cond.wait_for(lambda: len(self.posted) >= count, timeout)
+            return list(self.posted)
+
+    def of(self, subscription_id):
+        return [notification for posted_to, notification in self.posted
+                if posted_to == subscription_id]
+
+
+class DeliveryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.posts = Posts()
+        patch = mock.patch.object(
+            subscription_helper, 'notify', side_effect=self.posts.notify)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _delivery(self, **kwargs):
+        delivery = notification_delivery.NotificationDelivery(**kwargs)
+        self.addCleanup(delivery.close)
+        return delivery
+
+    def _wait_idle(self, delivery, timeout=5):
+        deadline = time.monotonic() + timeout
+        while delivery.stats()['depth'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+class TestNotify(unittest.TestCase):
+    """Test notify posting through a session."""
+
+    def test_posts_through_session(self):
+        session = mock.Mock()
+        with mock.patch.object(subscription_helper.requests, 'post') as post:
+            subscription_helper.notify(
+                Subscription('first'), [_event(LOCK_STATE, 'LOCKED', 1.0)],
+                session=session)
+        post.assert_not_called()
+        session.post.assert_called_once()
+        self.assertEqual(session.post.call_args[0][0],
+                         'http://127.0.0.1:9090/first')
+
+
+class TestNotificationDelivery(DeliveryTestCase):
+    """Test NotificationDelivery."""
+
+    def test_posted_in_order_per_subscription(self):
+        delivery = self._delivery(workers=4)
+        subscription = Subscription('first')
+        addresses = ['/./controller-0/ptp%d' % instance +
+                     constants.SOURCE_SYNC_PTP_LOCK_STATE
+                     for instance in range(8)]
+        for address in addresses:
+            delivery.deliver(subscription, _event(address, 'LOCKED', 1.0))
+        self.posts.wait_for(len(addresses))
+        self.assertEqual(
+            [notification['data']['values'][0]['ResourceAddress']
+             for notification in self.posts.of('first')], addresses)
+        # One kept-alive session for the endpoint
+        self.assertEqual(len(set(map(id, self.posts.sessions))), 1)
+
+    def test_slow_endpoint_does_not_block_others(self):
+        delivery = self._delivery(workers=2)
+        slow = threading.Event()
+        self.addCleanup(slow.set)
+        self.posts.delays['slow'] = slow
+        delivery.deliver(Subscription('slow'),
+                         _event(LOCK_STATE, 'LOCKED', 1.0), 1.0)
+        for subscription_id in ('first', 'second', 'third'):
+            delivery.deliver(Subscription(subscription_id),
+                             _event(LOCK_STATE, 'LOCKED', 1.0), 1.0)
+        posted = self.posts.wait_for(3)
+        self.assertEqual(sorted(posted_to for posted_to, _ in posted),
+                         ['first', 'second', 'third'])
+        slow.set()
+        self.posts.wait_for(4)
+        self.assertEqual(len(self.posts.of('slow')), 1)
+
+    def test_on_delivered_called_after_post(self):
+        delivery = self._delivery()
+        delivered = threading.Event()
+        delivery.deliver(Subscription('first'),
+                         _event(LOCK_STATE, 'LOCKED', 1.0), 1.0,
+                         delivered.set)
+        self.assertTrue(delivered.wait(5))
+        self.assertEqual(len(self.posts.of('first')), 1)
+
+
+class TestDeliveryQueues(DeliveryTestCase):
+    """Test coalescing and bounding the queues of the subscriptions."""
+
+    def setUp(self):
+        super(TestDeliveryQueues, self).setUp()
+        self.slow = threading.Event()
+        self.addCleanup(self.slow.set)
+        self.subscription = Subscription('first')
+
+    def _hold(self, delivery):
+        """Keep the subscription busy posting an unrelated notification"""
+        self.posts.delays['first'] = self.slow
+        delivery.deliver(self.subscription,
+                         _event('/./controller-1/sync', 'HELD', 1.0))
+        self.posts.wait_started(1)
+
+    def _release(self, delivery):
+        self.slow.set()
+        self._wait_idle(delivery)
+
+    def _posted(self):
+        posted = []
+        for notification in self.posts.of('first'):
+            for event in (notification if isinstance(notification, list)
+                          else [notification]):
+                values = event['data']['values'][0]
+                if values['value'] != 'HELD':
+                    posted.append((values['ResourceAddress'].split('/')[3],
+                                   event['time']))
+        return posted
+
+    def _deliver(self, delivery, *instances_and_times):
+        delivery.deliver(self.subscription, [
+            _event('/./controller-0/%s' % instance +
+                   constants.SOURCE_SYNC_PTP_LOCK_STATE, 'LOCKED', time)
+            for instance, time in instances_and_times])
+
+    def test_pending_state_superseded_in_place(self):
+        delivery = self._delivery()
+        self._hold(delivery)
+        self._deliver(delivery, ('ptp1', 1.0))
+        self._deliver(delivery, ('ptp2', 1.0))
+        self._deliver(delivery, ('ptp1', 2.0))
+        self.assertEqual(delivery.stats()['depth'], 3)
+        self._release(delivery)
+        self.assertEqual(self._posted(), [('ptp1', 2.0), ('ptp2', 1.0)])
+        self.assertEqual(delivery.stats()['coalesced'], 1)
+
+    def test_batches_coalesced_per_resource_address(self):
+        delivery = self._delivery()
+        self._hold(delivery)
+        self._deliver(delivery, ('ptp1', 1.0), ('ptp2', 1.0))
+        self._deliver(delivery, ('ptp1', 2.0))
+        self._deliver(delivery, ('ptp1', 3.0), ('ptp2', 3.0))
+        self._release(delivery)
+        self.assertEqual(self._posted(), [('ptp1', 3.0), ('ptp2', 3.0)])
+
+    def test_duplicates_ignored(self):
+        delivery = self._delivery()
+        self.posts.delays['first'] = self.slow
+        self._deliver(delivery, ('ptp1', 1.0))
+        self.posts.wait_started(1)
+        # The same event while it is posted
+        self._deliver(delivery, ('ptp1', 1.0))
+        self._release(delivery)
+        # Not newer than the one posted
+        self._deliver(delivery, ('ptp1', 1.0))
+        self._deliver(delivery, ('ptp1', 0.5))
+        self._wait_idle(delivery)
+        self.assertEqual(self._posted(), [('ptp1', 1.0)])
+        self._deliver(delivery, ('ptp1', 2.0))
+        self.posts.wait_for(2)
+        self.assertEqual(self._posted(), [('ptp1', 1.0), ('ptp1', 2.0)])
+
+    def test_full_queue_drops_oldest(self):
+        delivery = self._delivery(queue_size=2)
+        self._hold(delivery)
+        for instance in ('ptp1', 'ptp2', 'ptp3'):
+            self._deliver(delivery, (instance, 1.0))
+        self.assertEqual(delivery.stats()['max_depth'], 2)
+        self._release(delivery)
+        self.assertEqual(self._posted(), [('ptp2', 1.0), ('ptp3', 1.0)])
+        self.assertEqual(delivery.stats()['dropped'], 2)
+
+    def test_full_queue_drops_newest(self):
+        delivery = self._delivery(
+            queue_size=2, drop_policy=constants.DELIVERY_DROP_NEWEST)
+        self._hold(delivery)
+        for instance in ('ptp1', 'ptp2', 'ptp3'):
+            self._deliver(delivery, (instance, 1.0))
+        self._release(delivery)
+        self.assertEqual(self._posted(), [('ptp1', 1.0)])
+        self.assertEqual(delivery.stats()['dropped'], 2)
+
+    def test_failed_post_retried_then_dropped(self):
+        delivery = self._delivery(backoff=0.01, max_attempts=2)
+        delivered = []
+        self.posts.failures['first'] = 1
+        delivery.deliver(self.subscription,
+                         _event(LOCK_STATE, 'LOCKED', 1.0), None,
+                         lambda: delivered.append(True))
+        self.posts.wait_for(1)
+        self._wait_idle(delivery)
+        self.assertEqual(delivered, [True])
+
+        self.posts.failures['first'] = 2
+        delivery.deliver(self.subscription,
+                         _event(LOCK_STATE, 'FREERUN', 2.0))
+        self._wait_idle(delivery)
+        stats = delivery.stats()
+        self.assertEqual((stats['delivered'], stats['retries'],
+                          stats['dropped'], stats['depth']), (1, 2, 1, 0))
+        self.assertEqual(len(self.posts.of('first')), 1)
+
+    def test_stats_report_depth_and_lag(self):
+        clock = mock.Mock(return_value=100.0)
+        delivery = self._delivery(clock=clock)
+        self._hold(delivery)
+        self._deliver(delivery, ('ptp1', 1.0))
+        self.posts.delays['second'] = self.slow
+        delivery.deliver(Subscription('second'),
+                         _event(LOCK_STATE, 'LOCKED', 1.0))
+        self.posts.wait_started(2)
+        clock.return_value = 105.0
+        stats = delivery.stats()
+        self.assertEqual((stats['queues'], stats['depth'],
+                          stats['max_depth'], stats['lag']),
+                         (2, 3, 2, 5.0))
+        self._release(delivery)
+        self.assertEqual(delivery.stats()['lag'], 0.0)
+
+    def test_retain_drops_deleted_subscriptions(self):
+        delivery = self._delivery()
+        self._hold(delivery)
+        self._deliver(delivery, ('ptp1', 1.0))
+        delivery.deliver(Subscription('second'),
+                         _event(LOCK_STATE, 'LOCKED', 1.0))
+        self.posts.wait_for(1)
+        delivery.retain({'second'})
+        self.assertEqual(delivery.stats()['queues'], 1)
+        self._release(delivery)
+        self.assertEqual(self._posted(), [])
+
+
+class TestNotificationHandler(DeliveryTestCase):
+    """Test NotificationHandler queueing deliveries."""
+
+    def setUp(self):
+        super(TestNotificationHandler, self).setUp()
+        residing_node = NodeInfoHelper.residing_node_name
+        self.addCleanup(NodeInfoHelper.set_residing_node, residing_node)
+        NodeInfoHelper.set_residing_node('controller-0')
+        self.handler = notification_handler.NotificationHandler()
+        self.addCleanup(self.handler.stop)
+
+    def test_every_subscriber_notified(self):
+        self.handler.refresh_subscriptions(
+            [Subscription('first'), Subscription('second'),
+             Subscription('third', resource_address=LOCK_STATE)])
+        notification = {'ptp1': _event(LOCK_STATE, 'LOCKED', 1000.0)}
+        self.assertTrue(self.handler.handle(notification))
+        self.posts.wait_for(3)
+        for subscription_id in ('first', 'second', 'third'):
+            posted = self.posts.of(subscription_id)
+            self.assertEqual(len(posted), 1)
+            # Formatted for delivery, once
+            self.assertIsInstance(posted[0]['ptp1']['time'], str)
+        # The notification handled is left as it is
+        self.assertEqual(notification['ptp1']['time'], 1000.0)
+
+    def test_same_event_queued_once(self):
+        self.handler.refresh_subscriptions([Subscription('first')])
+        slow = threading.Event()
+        self.addCleanup(slow.set)
+        self.posts.delays['first'] = slow
+        # The same event, from the topic of its source and of all sources
+        self.handler.handle([_event(LOCK_STATE, 'LOCKED', 1000.0)])
+        self.handler.handle([_event(LOCK_STATE, 'LOCKED', 1000.0)])
+        slow.set()
+        self.posts.wait_for(1)
+        self._wait_idle(self.handler.delivery)
+        self.handler.handle([_event(LOCK_STATE, 'FREERUN', 1001.0)])
+        self.posts.wait_for(2)
+        self._wait_idle(self.handler.delivery)
+        self.assertEqual(
+            [posted[0]['data']['values'][0]['value']
+             for posted in self.posts.of('first')], ['LOCKED', 'FREERUN'])
+
+
+if __name__ == '__main__':
+    unittest.main()
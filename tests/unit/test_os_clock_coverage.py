@@ -143,13 +143,13 @@ class TestOsClockMonitorInit(unittest.TestCase):
         self.assertEqual(monitor.offset, "0")
 
     @mock.patch(
-        'subprocess.check_output',
-        return_value=b'offset 12345ns')
+        'trackingfunctionsdk.common.helpers.ptpsync.run_command',
+        return_value=(b'offset 12345ns', b'', 0, 0.01))
     def test_get_os_clock_offset_success(
             self, mock_subprocess):
         """Test successful offset retrieval.
 
-        mock_subprocess -- mocked check_output
+        mock_subprocess -- mocked run_command
         """
         from trackingfunctionsdk.common.helpers \
             .os_clock_monitor import OsClockMonitor
@@ -160,16 +160,16 @@ class TestOsClockMonitorInit(unittest.TestCase):
         monitor.ptp_device = 'ptp0'
         monitor.phc2sys_ha_enabled = False
         monitor.get_os_clock_offset()
-        self.assertIsNotNone(monitor.offset)
+        self.assertEqual(monitor.offset, "12345")
 
     @mock.patch(
-        'subprocess.check_output',
-        side_effect=OSError("device error"))
+        'trackingfunctionsdk.common.helpers.ptpsync.run_command',
+        return_value=(b'', b'device error', 1, 0.01))
     def test_get_os_clock_offset_error(
             self, mock_subprocess):
         """Test offset retrieval on error.
 
-        mock_subprocess -- mocked check_output
+        mock_subprocess -- mocked run_command
         """
         from trackingfunctionsdk.common.helpers \
             .os_clock_monitor import OsClockMonitor
@@ -425,5 +425,107 @@ class TestOsClockMonitorInit(unittest.TestCase):
             monitor._state, OsClockState.Freerun)
 
 
+class TestOsClockMonitorUtcOffsetCache(unittest.TestCase):
+    """Test caching of the UTC offset between polls."""
+
+    def _monitor(self, tmpdir):
+        """Build a monitor whose phc2sys pidfile lives in tmpdir.
+
+        tmpdir -- directory used as pidfile path
+        """
+        from trackingfunctionsdk.common.helpers \
+            .os_clock_monitor import OsClockMonitor
+        monitor = OsClockMonitor(
+            constants.PHC2SYS_CONFIG_PATH
+            + 'phc2sys-t.conf',
+            init=False)
+        self.pidfile = os.path.join(tmpdir, 'phc2sys-t.pid')
+        self._write_pid('100')
+        return monitor
+
+    def _write_pid(self, pid):
+        """Write pid to the phc2sys pidfile."""
+        with open(self.pidfile, 'w', encoding='utf-8') as f:
+            f.write(pid)
+
+    def test_offset_kept_until_invalidated(self):
+        """Test set_utc_offset runs only when the cache is stale."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor = self._monitor(tmpdir)
+            pidfile_path = tmpdir + '/'
+            with mock.patch.object(
+                    monitor, 'set_utc_offset',
+                    return_value=True) as set_offset:
+                monitor.refresh_utc_offset(pidfile_path)
+                monitor.refresh_utc_offset(pidfile_path)
+                self.assertEqual(set_offset.call_count, 1)
+                self._write_pid('200')
+                monitor.refresh_utc_offset(pidfile_path)
+                self.assertEqual(set_offset.call_count, 2)
+                monitor.invalidate_utc_offset()
+                monitor.refresh_utc_offset(pidfile_path)
+                self.assertEqual(set_offset.call_count, 3)
+
+    def test_invalidated_while_refreshing(self):
+        """Test an invalidation during a refresh is not lost."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor = self._monitor(tmpdir)
+            pidfile_path = tmpdir + '/'
+
+            def read_offset(path):
+                # The grandmaster changes while the old offset is read
+                if set_offset.call_count == 1:
+                    monitor.invalidate_utc_offset()
+                return True
+
+            with mock.patch.object(
+                    monitor, 'set_utc_offset',
+                    side_effect=read_offset) as set_offset:
+                monitor.refresh_utc_offset(pidfile_path)
+                monitor.refresh_utc_offset(pidfile_path)
+                self.assertEqual(set_offset.call_count, 2)
+                monitor.refresh_utc_offset(pidfile_path)
+                self.assertEqual(set_offset.call_count, 2)
+
+    def test_fallback_offset_not_cached(self):
+        """Test a fallback offset is retried on the next poll."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor = self._monitor(tmpdir)
+            pidfile_path = tmpdir + '/'
+            with mock.patch.object(
+                    monitor, 'set_utc_offset',
+                    return_value=False) as set_offset:
+                monitor.refresh_utc_offset(pidfile_path)
+                monitor.refresh_utc_offset(pidfile_path)
+                self.assertEqual(set_offset.call_count, 2)
+
+    def test_offset_expires_at_leap_second_boundary(self):
+        """Test the cache expires at the next 1 Jan or 1 Jul."""
+        from trackingfunctionsdk.common.helpers import os_clock_monitor
+        # 2026-06-30T23:59:59Z and 2026-12-01T00:00:00Z
+        self.assertEqual(
+            os_clock_monitor.next_leap_second_boundary(1782863999),
+            1782864000)
+        self.assertEqual(
+            os_clock_monitor.next_leap_second_boundary(1796083200),
+            1798761600)
+
+    def test_tolerance_recomputed_only_on_change(self):
+        """Test tolerance bounds are kept while the offset is unchanged."""
+        import configparser
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor = self._monitor(tmpdir)
+            monitor.phc_interface = 'ens1f0'
+            monitor.config = configparser.ConfigParser(
+                delimiters=' ')
+            with mock.patch.object(
+                    monitor, '_get_phc2sys_command_line_option',
+                    return_value='37'):
+                self.assertTrue(monitor.set_utc_offset(tmpdir + '/'))
+                monitor.phc2sys_tolerance_low = 1
+                monitor.set_utc_offset(tmpdir + '/')
+                self.assertEqual(monitor.phc2sys_tolerance_low, 1)
+
+
 if __name__ == '__main__':
     unittest.main()
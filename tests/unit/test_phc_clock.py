@@ -0,0 +1,147 @@
+"""
+Unit tests for the in-process PHC to CLOCK_REALTIME comparison.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import errno
+import os
+from unittest import mock
+
+import pytest
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import phc_clock
+from trackingfunctionsdk.common.helpers.os_clock_monitor import OsClockMonitor
+
+# CLOCK_REALTIME is 37 s behind a PHC running TAI
+TAI_OFFSET_NS = 37000000000
+
+
+def _fill_extended(samples):
+    """Return an ioctl side effect writing (sys, phc, sys) triplets."""
+    def ioctl(fd, request, buffer):
+        assert request == phc_clock.PTP_SYS_OFFSET_EXTENDED
+        for index, value in enumerate(v for sample in samples
+                                      for v in sample):
+            phc_clock._PTP_CLOCK_TIME.pack_into(
+                buffer, phc_clock._PTP_SYS_OFFSET_HEADER.size +
+                index * phc_clock._PTP_CLOCK_TIME.size,
+                value // 1000000000, value % 1000000000, 0)
+        return 0
+    return ioctl
+
+
+@pytest.fixture
+def device(tmp_path):
+    path = tmp_path / 'ptp0'
+    path.write_bytes(b'')
+    return str(path)
+
+
+class TestEstimateOffset:
+    """Test reduction of samples to an offset."""
+
+    def test_tightest_sample_wins(self):
+        samples = [(1000, 1000 + TAI_OFFSET_NS + 60, 1200),
+                   (2000, 2000 + TAI_OFFSET_NS + 10, 2020),
+                   (3000, 3000 + TAI_OFFSET_NS + 90, 3100)]
+        result = phc_clock.estimate_offset(samples)
+        assert result.offset == -TAI_OFFSET_NS
+        assert result.delay == 20
+        assert result.median == -TAI_OFFSET_NS
+
+    def test_fd_to_clockid(self):
+        assert phc_clock.fd_to_clockid(3) == -29
+
+
+class TestPhcClock:
+    """Test PhcClock against mocked ioctls."""
+
+    def test_keeps_device_open(self, device):
+        samples = [(10, 10 + TAI_OFFSET_NS, 30)] * 3
+        clock = phc_clock.PhcClock(device, samples=3)
+        with mock.patch.object(phc_clock.fcntl, 'ioctl',
+                               side_effect=_fill_extended(samples)), \
+                mock.patch.object(phc_clock.os, 'open',
+                                  wraps=os.open) as os_open:
+            assert clock.compare().offset == 10 - TAI_OFFSET_NS
+            assert clock.compare().delay == 20
+        os_open.assert_called_once()
+        clock.close()
+        assert clock._fd is None
+
+    def test_unsupported_ioctls_fall_back_to_clock_gettime(self, device):
+        clock = phc_clock.PhcClock(device, samples=2)
+        unsupported = OSError(errno.ENOTTY, 'Inappropriate ioctl')
+        with mock.patch.object(phc_clock.fcntl, 'ioctl',
+                               side_effect=unsupported) as ioctl, \
+                mock.patch.object(phc_clock.time, 'clock_gettime_ns',
+                                  side_effect=[0, TAI_OFFSET_NS, 4] * 4):
+            assert clock.compare().offset == 2 - TAI_OFFSET_NS
+            assert clock.compare().delay == 4
+        # Each ioctl is only tried once
+        assert ioctl.call_count == 2
+        clock.close()
+
+    def test_read_error_closes_device(self, device):
+        clock = phc_clock.PhcClock(device)
+        with mock.patch.object(phc_clock.fcntl, 'ioctl',
+                               side_effect=OSError(errno.ENODEV, 'gone')):
+            with pytest.raises(OSError):
+                clock.compare()
+        assert clock._fd is None
+
+
+class TestOsClockMonitorNativeOffset:
+    """Test OsClockMonitor with the in-process comparison selected."""
+
+    def _monitor(self):
+        monitor = OsClockMonitor(
+            constants.PHC2SYS_CONFIG_PATH + 'phc2sys-t.conf', init=False)
+        monitor.ptp_device = 'ptp0'
+        monitor.phc2sys_ha_enabled = False
+        return monitor
+
+    def test_native_offset_matches_phc_ctl_format(self):
+        monitor = self._monitor()
+        clock = mock.Mock(device_path='/dev/ptp0')
+        clock.compare.return_value = phc_clock.PhcOffset(
+            -TAI_OFFSET_NS - 15, -TAI_OFFSET_NS - 12, 800)
+        with mock.patch.object(constants, 'PHC_OFFSET_MODE',
+                               constants.PHC_OFFSET_NATIVE), \
+                mock.patch.object(phc_clock, 'PhcClock',
+                                  return_value=clock) as factory:
+            monitor.get_os_clock_offset()
+            monitor.get_os_clock_offset()
+        assert monitor.offset == str(TAI_OFFSET_NS + 15)
+        factory.assert_called_once_with('/dev/ptp0')
+
+    def test_device_change_reopens(self):
+        monitor = self._monitor()
+        old = mock.Mock(device_path='/dev/ptp1')
+        monitor._phc_clock = old
+        with mock.patch.object(constants, 'PHC_OFFSET_MODE',
+                               constants.PHC_OFFSET_NATIVE), \
+                mock.patch.object(phc_clock, 'PhcClock') as factory:
+            factory.return_value.compare.return_value = \
+                phc_clock.PhcOffset(-5, -5, 1)
+            monitor.get_os_clock_offset()
+        old.close.assert_called_once()
+        factory.assert_called_once_with('/dev/ptp0')
+        assert monitor.offset == '5'
+
+    @mock.patch('trackingfunctionsdk.common.helpers.ptpsync.run_command',
+                return_value=(b'offset from CLOCK_REALTIME is -37000000020ns',
+                              b'', 0, 0.01))
+    def test_native_failure_falls_back_to_phc_ctl(self, run_command):
+        monitor = self._monitor()
+        with mock.patch.object(constants, 'PHC_OFFSET_MODE',
+                               constants.PHC_OFFSET_NATIVE), \
+                mock.patch.object(phc_clock, 'PhcClock') as factory:
+            factory.return_value.compare.side_effect = \
+                PermissionError(errno.EACCES, 'denied')
+            monitor.get_os_clock_offset()
+        assert monitor.offset == '37000000020'
+        run_command.assert_called_once()
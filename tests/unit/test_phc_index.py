@@ -0,0 +1,84 @@
+"""
+Unit tests for the memoized interface to PHC device index.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import os
+from unittest import mock
+
+import pytest
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import phc_index
+
+SYSFS_TREE = ['/hostsys/class/net/ens1f0/device/ptp/ptp0',
+              '/hostsys/class/net/ens2f0/device/ptp/ptp1']
+
+
+@pytest.fixture
+def index(tmp_path):
+    """A PhcIndex reading ptp-interfaces.conf from tmp_path."""
+    with mock.patch.object(constants, 'PTP_CONFIG_PATH',
+                           str(tmp_path) + '/'), \
+            mock.patch.object(phc_index, 'SYSFS_NET_PATH',
+                              str(tmp_path / 'net')), \
+            mock.patch.object(phc_index, 'glob',
+                              return_value=list(SYSFS_TREE)) as glob:
+        os.makedirs(tmp_path / 'net' / 'ens1f0')
+        os.makedirs(tmp_path / 'net' / 'ens2f0')
+        index = phc_index.PhcIndex()
+        index.glob = glob
+        index.path = tmp_path
+        yield index
+
+
+def _write_interfaces(tmp_path, text):
+    with open(tmp_path / 'ptp-interfaces.conf', 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+class TestPhcIndex:
+    """Test when the index is rebuilt."""
+
+    def test_lookups_share_one_scan(self, index):
+        assert index.get_phc_device('ens1f0') == 'ptp0'
+        assert index.get_phc_device('ens2f0') == 'ptp1'
+        assert index.get_phc_device('ens3f0') is None
+        assert index.get_phc_index('ens1f0') == ''
+        index.glob.assert_called_once()
+
+    def test_interfaces_file_change_rebuilds(self, index):
+        assert index.get_phc_device('ens2f1') == 'ptp1'
+        _write_interfaces(index.path, '[ens2f1]\nphc_index 0\n')
+        assert index.get_phc_index('ens2f1') == '0'
+        assert index.get_phc_device('ens2f1') == 'ptp0'
+        assert index.glob.call_count == 2
+
+    def test_netdev_change_rebuilds(self, index):
+        assert index.get_phc_device('ens1f0') == 'ptp0'
+        os.rmdir(index.path / 'net' / 'ens1f0')
+        index.glob.return_value = SYSFS_TREE[1:]
+        assert index.get_phc_device('ens1f0') is None
+
+    def test_invalidate_rebuilds(self, index):
+        index.get_phc_device('ens1f0')
+        index.invalidate()
+        index.get_phc_device('ens1f0')
+        assert index.glob.call_count == 2
+
+    def test_config_devices_read_once(self, index):
+        config = index.path / 'ptp4l-a.conf'
+        config.write_text('[global]\n[ens1f0]\n[ens2f0]\n')
+        read_interfaces = mock.Mock(return_value=['ens1f0', 'ens2f0'])
+        assert index.get_config_ptp_devices(
+            str(config), read_interfaces) == {'ptp0', 'ptp1'}
+        assert index.get_config_ptp_devices(
+            str(config), read_interfaces) == {'ptp0', 'ptp1'}
+        read_interfaces.assert_called_once()
+
+        config.write_text('[global]\n[ens1f0]\n')
+        read_interfaces.return_value = ['ens1f0']
+        assert index.get_config_ptp_devices(
+            str(config), read_interfaces) == {'ptp0'}
@@ -0,0 +1,289 @@
+"""
+Unit tests for the native PTP management client.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import os
+import socket
+import struct
+import threading
+from unittest import mock
+
+import pytest
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import pmc_client
+from trackingfunctionsdk.common.helpers import ptpsync
+from trackingfunctionsdk.common.helpers.ptp_monitor import PtpMonitor
+
+LOCAL_ID = bytes.fromhex('507c6ffffe0a1b2c')
+GM_ID = bytes.fromhex('0011223344556677')
+
+
+def _dataset_payloads(port_states=(9, 6)):
+    """Return response data per management id for a T-BC slave."""
+    return {
+        0x2000: [struct.pack('>BBHBBBHB8sBB', 1, 0, len(port_states),
+                             128, 248, 0xfe, 0xffff, 128, LOCAL_ID, 0, 0)],
+        0x2002: [struct.pack('>8sHBBHiBBBHB8s', GM_ID, 1, 0, 0, 0xffff,
+                             0x7fffffff, 128, 6, 0x21, 0x4e5d, 128, GM_ID)],
+        0x2003: [struct.pack('>hBB', 37, 0x1c, 0x20)],
+        0x2004: [struct.pack('>8sHBbqbBbBbB', LOCAL_ID, port, state, 0, 0,
+                             1, 3, 0, 1, 0, 2)
+                 for port, state in enumerate(port_states, start=1)],
+        0xc000: [struct.pack('>qqiiHHQHi8s', -12, 0, 0, 0, 0, 0, 0, 0, 1,
+                             GM_ID)],
+    }
+
+
+class FakePtp4l:
+    """Answer management GETs on a Unix datagram socket like ptp4l."""
+
+    def __init__(self, path, payloads):
+        self.payloads = payloads
+        self.requests = []
+        self.subscriber = None
+        self.subscribed = threading.Event()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(path)
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        while True:
+            try:
+                message, address = self.sock.recvfrom(1500)
+            except OSError:
+                return
+            self.requests.append(message)
+            header = bytearray(message[:48])
+            header[46] = 2  # RESPONSE
+            management_id = struct.unpack_from('>H', message, 52)[0]
+            payloads = self.payloads.get(management_id, [])
+            if management_id == 0xc003:
+                # SUBSCRIBE_EVENTS_NP: acknowledge with the request data
+                payloads = [message[54:]]
+                self.subscriber = address
+            for data in payloads:
+                self.sock.sendto(self._response(header, management_id, data),
+                                 address)
+            if management_id == 0xc003:
+                self.subscribed.set()
+
+    @staticmethod
+    def _response(header, management_id, data):
+        tlv = struct.pack('>HHH', 1, 2 + len(data), management_id)
+        response = bytes(header) + tlv + data
+        return (response[:2] + struct.pack('>H', len(response)) +
+                response[4:])
+
+    def push(self, management_id, data):
+        header = bytearray(48)
+        header[0] = 0x0d
+        header[1] = 0x02
+        header[46] = 2  # RESPONSE
+        self.sock.sendto(self._response(header, management_id, data),
+                         self.subscriber)
+
+    def close(self):
+        self.sock.close()
+
+
+@pytest.fixture
+def ptp4l(tmp_config_dir):
+    server = FakePtp4l(os.path.join(tmp_config_dir, 'ptp4l-inst1'),
+                       _dataset_payloads())
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def client(tmp_config_dir, ptp4l):
+    pmc = pmc_client.PmcClient(
+        os.path.join(tmp_config_dir, 'ptp4l-inst1'), 24,
+        local_path=os.path.join(tmp_config_dir, 'pmc'))
+    yield pmc
+    pmc.close()
+
+
+class TestPmcClientGet:
+    """Test batched GET requests against a fake ptp4l."""
+
+    def test_get_decodes_datasets(self, client):
+        responses = client.get(list(pmc_client.MANAGEMENT_IDS))
+        default = responses['DEFAULT_DATA_SET'][0]
+        assert default[constants.CLOCK_IDENTITY] == '507c6f.fffe.0a1b2c'
+        assert default[constants.CLOCK_CLASS] == '248'
+        parent = responses['PARENT_DATA_SET'][0]
+        assert parent[constants.GM_CLOCK_CLASS] == '6'
+        assert parent[constants.GRANDMASTER_IDENTITY] == '001122.3344.556677'
+        properties = responses['TIME_PROPERTIES_DATA_SET'][0]
+        assert properties['currentUtcOffset'] == '37'
+        assert properties['currentUtcOffsetValid'] == '1'
+        assert properties[constants.TIME_TRACEABLE] == '1'
+        status = responses['TIME_STATUS_NP'][0]
+        assert status[constants.MASTER_OFFSET] == '-12'
+        assert status[constants.GM_PRESENT] == 'true'
+        assert [port[constants.PORT_STATE]
+                for port in responses['PORT_DATA_SET']] == ['SLAVE', 'MASTER']
+
+    def test_get_builds_management_requests(self, client, ptp4l):
+        client.get(['DEFAULT_DATA_SET'])
+        request = ptp4l.requests[0]
+        assert request[0] & 0x0f == 0x0d
+        assert request[4] == 24
+        assert struct.unpack_from('>H', request, 2)[0] == len(request)
+        assert request[34:44] == b'\xff' * 10
+        assert request[46] & 0x0f == 0
+        assert struct.unpack_from('>HHH', request, 48) == (1, 22, 0x2000)
+
+    def test_get_reuses_socket(self, client, ptp4l):
+        client.get(['TIME_STATUS_NP'])
+        sock = client._socket
+        client.get(['TIME_STATUS_NP'])
+        assert client._socket is sock
+        assert len(ptp4l.requests) == 2
+
+    def test_get_unanswered_dataset_times_out(self, tmp_config_dir):
+        server = FakePtp4l(os.path.join(tmp_config_dir, 'ptp4l-quiet'), {})
+        pmc = pmc_client.PmcClient(
+            os.path.join(tmp_config_dir, 'ptp4l-quiet'), 0, timeout=0.05,
+            local_path=os.path.join(tmp_config_dir, 'pmc-quiet'))
+        try:
+            assert pmc.get(['TIME_STATUS_NP']) == {'TIME_STATUS_NP': []}
+        finally:
+            pmc.close()
+            server.close()
+
+    def test_get_missing_socket_raises(self, tmp_config_dir):
+        pmc = pmc_client.PmcClient(
+            os.path.join(tmp_config_dir, 'missing'), 0,
+            local_path=os.path.join(tmp_config_dir, 'pmc-missing'))
+        with pytest.raises(OSError):
+            pmc.get(['TIME_STATUS_NP'])
+        assert not os.path.exists(pmc.local_path)
+
+    def test_close_removes_local_socket(self, client):
+        client.get(['TIME_STATUS_NP'])
+        assert os.path.exists(client.local_path)
+        client.close()
+        assert not os.path.exists(client.local_path)
+
+
+class TestPtpMonitorNativePmc:
+    """Test PtpMonitor.ptpsync with the native client selected."""
+
+    def _monitor(self, tmp_config_dir):
+        monitor = PtpMonitor('inst1', 30, 'phc', init=False)
+        monitor.uds_address = os.path.join(tmp_config_dir, 'ptp4l-inst1')
+        monitor.domain_number = 24
+        return monitor
+
+    def test_native_results_match_check_results(self, tmp_config_dir,
+                                                ptp4l, client):
+        monitor = self._monitor(tmp_config_dir)
+        with mock.patch.object(constants, 'PMC_CLIENT_MODE',
+                               constants.PMC_CLIENT_NATIVE), \
+                mock.patch.object(pmc_client, 'get_pmc_client',
+                                  return_value=client):
+            result, total, port_count = monitor.ptpsync()
+        assert port_count == 2
+        assert total == 9
+        assert result[constants.PORT.format(1)] == 'SLAVE'
+        assert result[constants.PORT.format(2)] == 'MASTER'
+        sync_state, sync_source = ptpsync.check_results(
+            result, total, port_count)
+        assert sync_state == constants.LOCKED_PHC_STATE
+        assert sync_source == constants.ClockSourceType.TypePTP
+
+    def test_native_failure_falls_back_to_subprocess(self, tmp_config_dir):
+        monitor = self._monitor(tmp_config_dir)
+        failing = mock.Mock()
+        failing.get.side_effect = ConnectionRefusedError()
+        with mock.patch.object(constants, 'PMC_CLIENT_MODE',
+                               constants.PMC_CLIENT_NATIVE), \
+                mock.patch.object(pmc_client, 'get_pmc_client',
+                                  return_value=failing), \
+                mock.patch.object(monitor, '_ptpsync_subprocess',
+                                  return_value=({}, 8, 1)) as fallback:
+            assert monitor.ptpsync() == ({}, 8, 1)
+        fallback.assert_called_once()
+
+
+class TestPmcEventListener:
+    """Test SUBSCRIBE_EVENTS_NP handling."""
+
+    def test_subscribe_sets_event_bits(self, client, ptp4l):
+        assert client.subscribe([pmc_client.NOTIFY_PORT_STATE,
+                                 pmc_client.NOTIFY_PARENT_DATA_SET], 60)
+        request = ptp4l.requests[-1]
+        assert request[46] & 0x0f == 1  # SET
+        assert struct.unpack_from('>HHHH', request, 48) == (1, 68, 0xc003,
+                                                            60)
+        assert request[56] == 0x05
+
+    def test_listener_delivers_notifications(self, tmp_config_dir, ptp4l):
+        received = []
+        notified = threading.Event()
+
+        def on_notification(dataset, values):
+            received.append((dataset, values))
+            notified.set()
+
+        listener = pmc_client.PmcEventListener(
+            os.path.join(tmp_config_dir, 'ptp4l-inst1'), 24,
+            on_notification)
+        listener.client.local_path = os.path.join(tmp_config_dir, 'events')
+        listener.start()
+        try:
+            assert ptp4l.subscribed.wait(5)
+            ptp4l.push(0x2004, _dataset_payloads(port_states=(7,))[0x2004][0])
+            assert notified.wait(5)
+        finally:
+            listener.stop()
+            listener.join(5)
+        assert received[0][0] == 'PORT_DATA_SET'
+        assert received[0][1][constants.PORT_STATE] == 'PASSIVE'
+        assert not os.path.exists(listener.client.local_path)
+
+
+class TestPtpMonitorNotifications:
+    """Test which ptp4l notifications wake the daemon."""
+
+    def _monitor(self):
+        monitor = PtpMonitor('inst1', 30, 'phc', init=False)
+        monitor.ptp4l_service_name = 'inst1'
+        monitor._on_event = mock.Mock()
+        monitor._notified_port_states = {}
+        monitor._clock_class = '6'
+        return monitor
+
+    def _port(self, state):
+        return {'portIdentity': '507c6f.fffe.0a1b2c-1',
+                constants.PORT_STATE: state}
+
+    def test_port_leaving_slave_wakes(self):
+        monitor = self._monitor()
+        monitor._handle_notification('PORT_DATA_SET', self._port('SLAVE'))
+        monitor._handle_notification('PORT_DATA_SET',
+                                     self._port('LISTENING'))
+        assert monitor._on_event.call_count == 2
+        monitor._on_event.assert_called_with('inst1')
+
+    def test_port_change_without_slave_is_ignored(self):
+        monitor = self._monitor()
+        monitor._handle_notification('PORT_DATA_SET', self._port('MASTER'))
+        monitor._handle_notification('PORT_DATA_SET',
+                                     self._port('PASSIVE'))
+        assert monitor._on_event.call_count == 1
+
+    def test_clock_class_change_wakes(self):
+        monitor = self._monitor()
+        monitor._handle_notification('PARENT_DATA_SET',
+                                     {constants.GM_CLOCK_CLASS: '6'})
+        monitor._on_event.assert_not_called()
+        monitor._handle_notification('PARENT_DATA_SET',
+                                     {constants.GM_CLOCK_CLASS: '7'})
+        monitor._on_event.assert_called_once_with('inst1')
@@ -0,0 +1,129 @@
+"""
+Unit tests for the adaptive poll scheduler.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+from unittest import mock
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import poll_scheduler
+from trackingfunctionsdk.common.helpers.os_clock_monitor import OsClockMonitor
+from trackingfunctionsdk.common.helpers.ptp_monitor import PtpMonitor
+
+
+class TestNextPollInterval:
+    """Test the cadence chosen for a source."""
+
+    def test_holdover_polls_fast(self):
+        assert poll_scheduler.next_poll_interval(
+            'Holdover', 2) == constants.POLL_FAST_SECONDS
+        assert poll_scheduler.next_poll_interval(
+            'HOLDOVER', 2) == constants.POLL_FAST_SECONDS
+
+    def test_near_threshold_polls_fast(self):
+        assert poll_scheduler.next_poll_interval(
+            'Locked', 2, stable_seconds=3600,
+            near_threshold=True) == constants.POLL_FAST_SECONDS
+
+    def test_long_locked_polls_slow(self):
+        stable = constants.POLL_STABLE_SECONDS
+        assert poll_scheduler.next_poll_interval(
+            'Locked', 2, stable) == constants.POLL_SLOW_SECONDS
+        assert poll_scheduler.next_poll_interval(
+            'SYNCHRONIZED', 2, stable) == \
+            constants.POLL_SLOW_SECONDS
+
+    def test_recently_locked_and_freerun_use_poll_freq(self):
+        assert poll_scheduler.next_poll_interval('Locked', 2, 1) == 2
+        assert poll_scheduler.next_poll_interval(
+            'Freerun', 2, 3600) == 2
+
+    def test_poll_freq_bounds_fast_and_slow(self):
+        assert poll_scheduler.next_poll_interval(
+            'Holdover', 0.1) == 0.1
+        assert poll_scheduler.next_poll_interval(
+            'Locked', 30, 3600) == 30
+
+
+class TestNearThreshold:
+    """Test offset proximity checks."""
+
+    def test_near_threshold(self):
+        assert poll_scheduler.near_threshold(-600, 1000)
+        assert not poll_scheduler.near_threshold(100, 1000)
+        assert not poll_scheduler.near_threshold(None, 1000)
+
+    def test_ptp_monitor_offset(self):
+        monitor = PtpMonitor('inst1', 30, 'phc', init=False)
+        monitor.offset_threshold = 1000
+        monitor.pmc_query_results = {constants.MASTER_OFFSET: '-700'}
+        assert monitor.offset_near_threshold()
+        monitor.pmc_query_results = {constants.MASTER_OFFSET: '12'}
+        assert not monitor.offset_near_threshold()
+
+    def test_os_clock_monitor_offset(self):
+        monitor = OsClockMonitor(constants.PHC2SYS_CONFIG_PATH +
+                                 'phc2sys-test.conf', init=False,
+                                 tolerance_threshold=1000)
+        monitor.phc2sys_tolerance_low = 36999999000
+        monitor.phc2sys_tolerance_high = 37000001000
+        monitor.offset = '37000000015'
+        assert not monitor.offset_near_threshold()
+        monitor.offset = '37000000900'
+        assert monitor.offset_near_threshold()
+        monitor.offset = None
+        assert not monitor.offset_near_threshold()
+
+
+class TestPollScheduler:
+    """Test PollScheduler bookkeeping."""
+
+    def test_unknown_key_is_due(self):
+        scheduler = poll_scheduler.PollScheduler()
+        assert scheduler.is_due(('ptp', 'inst1'))
+        assert scheduler.time_until_next() is None
+
+    def test_schedule_and_deadline(self):
+        clock = mock.Mock(return_value=100.0)
+        scheduler = poll_scheduler.PollScheduler(clock=clock)
+        scheduler.schedule('slow', 10)
+        scheduler.schedule('fast', 0.5)
+        assert not scheduler.is_due('fast')
+        assert scheduler.time_until_next() == 0.5
+        clock.return_value = 100.5
+        assert scheduler.is_due('fast')
+        assert not scheduler.is_due('slow')
+
+    def test_reschedule_skips_stale_entries(self):
+        clock = mock.Mock(return_value=0.0)
+        scheduler = poll_scheduler.PollScheduler(clock=clock)
+        scheduler.schedule('src', 0.5)
+        scheduler.schedule('src', 10)
+        assert scheduler.next_deadline() == 10
+
+    def test_reset_makes_everything_due(self):
+        scheduler = poll_scheduler.PollScheduler()
+        scheduler.schedule('src', 60)
+        scheduler.reset()
+        assert scheduler.is_due('src')
+        assert scheduler.next_deadline() is None
+
+    def test_wake_makes_source_due(self):
+        clock = mock.Mock(return_value=0.0)
+        scheduler = poll_scheduler.PollScheduler(clock=clock)
+        scheduler.schedule('src', 10)
+        clock.return_value = 1.0
+        scheduler.wake('src')
+        assert scheduler.is_due('src')
+        assert scheduler.time_until_next() == 0
+        scheduler.schedule('src', 10, now=1.5)
+        assert not scheduler.is_due('src')
+
+    def test_wake_during_sample_keeps_source_due(self):
+        clock = mock.Mock(return_value=5.0)
+        scheduler = poll_scheduler.PollScheduler(clock=clock)
+        scheduler.wake('src')
+        scheduler.schedule('src', 10, now=4.0)
+        assert scheduler.is_due('src')
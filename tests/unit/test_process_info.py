@@ -0,0 +1,96 @@
+"""
+Unit tests for the cached linuxptp daemon command lines.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import os
+from unittest import mock
+
+import pytest
+
+from trackingfunctionsdk.common.helpers import constants
+from trackingfunctionsdk.common.helpers import process_info
+
+
+class FakeHost:
+    """Pidfiles and /proc cmdline files below a temporary directory."""
+
+    def __init__(self, root):
+        self.run_path = str(root / 'run')
+        self.proc_path = str(root / 'proc')
+        os.makedirs(self.run_path)
+
+    def start(self, service, pid, argv, mtime_ns=None):
+        os.makedirs(os.path.join(self.proc_path, pid), exist_ok=True)
+        with open(os.path.join(self.proc_path, pid, 'cmdline'), 'w',
+                  encoding='utf-8') as cmdline:
+            cmdline.write('\x00'.join(argv) + '\x00')
+        pidfile = os.path.join(self.run_path, service + '.pid')
+        with open(pidfile, 'w', encoding='utf-8') as f:
+            f.write(pid + '\n')
+        if mtime_ns is not None:
+            os.utime(pidfile, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def host(tmp_path):
+    process_info.invalidate()
+    with mock.patch.object(constants, 'HOST_PROC_PATH',
+                           str(tmp_path / 'proc')):
+        yield FakeHost(tmp_path)
+    process_info.invalidate()
+
+
+PHC2SYS_ARGV = ['/usr/sbin/phc2sys', '-f', '/etc/phc2sys-a.conf', '-s',
+                'ens1f0', '-O', '-37', '-n', '24', '-z', '/var/run/ptp4l-a']
+
+
+class TestProcessInfo:
+    """Test argv caching per (service, pid)."""
+
+    def test_options_answered_from_memory(self, host):
+        host.start('phc2sys-a', '101', PHC2SYS_ARGV)
+        assert process_info.get_option('phc2sys-a', '-s',
+                                       host.run_path) == 'ens1f0'
+        with mock.patch.object(process_info, 'open',
+                               side_effect=AssertionError('reread')):
+            for flag, value in (('-O', '-37'), ('-n', '24'),
+                                ('-z', '/var/run/ptp4l-a'), ('-w', None)):
+                assert process_info.get_option(
+                    'phc2sys-a', flag, host.run_path) == value
+            assert process_info.get_pid('phc2sys-a', host.run_path) == '101'
+
+    def test_restart_rereads_command_line(self, host):
+        host.start('ts2phc-t', '200', ['ts2phc', '-s', 'nmea'], mtime_ns=1)
+        assert process_info.get_option('ts2phc-t', '-s',
+                                       host.run_path) == 'nmea'
+        host.start('ts2phc-t', '201', ['ts2phc', '-s', 'generic'], mtime_ns=2)
+        assert process_info.get_option('ts2phc-t', '-s',
+                                       host.run_path) == 'generic'
+
+    def test_pidfile_touch_with_same_pid_keeps_argv(self, host):
+        host.start('phc2sys-a', '101', PHC2SYS_ARGV, mtime_ns=1)
+        process_info.get_process_info('phc2sys-a', host.run_path)
+        os.utime(os.path.join(host.run_path, 'phc2sys-a.pid'), ns=(2, 2))
+        with mock.patch.object(process_info, '_read_argv') as read_argv:
+            info = process_info.get_process_info('phc2sys-a', host.run_path)
+        read_argv.assert_not_called()
+        assert info.option('-n') == '24'
+
+    def test_stopped_daemon(self, host):
+        host.start('ptp4l-a', '300', ['ptp4l', '-f', 'a.conf'])
+        assert process_info.is_running('ptp4l-a', host.run_path)
+        assert process_info.get_pid('ptp4l-a', host.run_path) == '300'
+        os.unlink(os.path.join(host.run_path, 'ptp4l-a.pid'))
+        assert not process_info.is_running('ptp4l-a', host.run_path)
+        assert process_info.get_process_info('ptp4l-a',
+                                             host.run_path) is None
+
+    def test_unreadable_command_line(self, host):
+        host.start('phc2sys-a', '101', PHC2SYS_ARGV)
+        os.unlink(os.path.join(host.proc_path, '101', 'cmdline'))
+        assert process_info.get_option('phc2sys-a', '-s',
+                                       host.run_path) is None
+        assert process_info.get_pid('phc2sys-a', host.run_path) == '101'
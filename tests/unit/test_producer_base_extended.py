@@ -408,5 +408,67 @@ class TestBrokerClientBaseExtended(
             client.any_listener())
 
 
+def _event(event_id, source, event_time):
+    """Build a standard format notification event."""
+    return {'id': event_id, 'source': source, 'time': event_time}
+
+
+class TestPtpEventProducerBatch(unittest.TestCase):
+    """Test publishing status in batches."""
+
+    @mock.patch(
+        'trackingfunctionsdk.client'
+        '.ptpeventproducer.BrokerClientBase')
+    def setUp(self, mock_broker):
+        from trackingfunctionsdk.client \
+            .ptpeventproducer import (
+                PtpEventProducer)
+        self.local = mock.MagicMock()
+        self.all = mock.MagicMock()
+        mock_broker.side_effect = [self.local, self.all]
+        self.producer = PtpEventProducer(
+            'node1', BROKER_URL_LOCAL,
+            BROKER_URL_REMOTE)
+
+    def _casts(self, client):
+        return [(call[0][0], call[1]['notification'])
+                for call in client.cast.call_args_list]
+
+    def test_batch_merges_per_topic_and_source(self):
+        lock_a = _event('a', '/sync/ptp-status/lock-state', 2.0)
+        lock_b = _event('b', '/sync/ptp-status/lock-state', 1.0)
+        clock_class = _event('c', '/sync/ptp-status/clock-class', 1.5)
+        v1_status = {'ResourceType': 'PTP'}
+        with self.producer.batch():
+            self.producer.publish_status(v1_status, 'PTP')
+            for event in (lock_a, lock_b):
+                self.producer.publish_status(
+                    [event], '/sync/ptp-status/lock-state')
+                self.producer.publish_status([event], '/sync')
+            self.producer.publish_status([clock_class], '/sync')
+            self.local.cast.assert_not_called()
+
+        self.assertEqual(self._casts(self.local), [
+            ('PTP-Event-v2-node1', v1_status),
+            ('/sync/ptp-status/lock-state-Event-v2-node1',
+             [lock_b, lock_a]),
+            ('/sync-Event-v2-node1', [lock_b, lock_a]),
+            ('/sync-Event-v2-node1', [clock_class]),
+        ])
+        # The registration broker gets each event once
+        self.assertEqual(self._casts(self.all), [
+            ('PTP-Event-v2-*', v1_status),
+            ('PTP-Event-v2-*', [lock_b, lock_a]),
+            ('PTP-Event-v2-*', [clock_class]),
+        ])
+
+    def test_publish_outside_batch_is_sent_at_once(self):
+        event = _event('a', '/sync/ptp-status/lock-state', 1.0)
+        self.producer.publish_status_local(
+            [event], '/sync/ptp-status/lock-state')
+        self.assertEqual(self._casts(self.local), [
+            ('/sync/ptp-status/lock-state-Event-v2-node1', [event])])
+
+
 if __name__ == '__main__':
     unittest.main()
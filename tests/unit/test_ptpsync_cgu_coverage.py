@@ -33,6 +33,31 @@ class TestPtpsyncRunShell:
             assert errcode != 0
 
 
+class TestPtpsyncRunCommand:
+    """Test ptpsync run_command function."""
+
+    def test_run_command_no_shell(self):
+        result = utils.run_command(['echo', 'a;', 'b'])
+        assert result.errcode == 0
+        assert result.out == b'a; b\n'
+        assert result.elapsed >= 0
+
+    def test_run_command_timeout(self):
+        result = utils.run_command(['sleep', '5'], timeout=0.1)
+        assert result.errcode == constants.COMMAND_TIMEOUT_ERRCODE
+
+    def test_run_command_not_found(self):
+        result = utils.run_command(['/nonexistent/pmc'])
+        assert result.errcode == constants.COMMAND_NOT_FOUND_ERRCODE
+
+    def test_run_command_keeps_cwd(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = utils.run_command(['pwd'], cwd=tmpdir)
+            assert result.out.strip() == os.path.realpath(tmpdir).encode()
+        assert os.getcwd() == cwd
+
+
 class TestPtpsyncCheckCriticalResources:
     """Test check_critical_resources function."""
 
@@ -0,0 +1,184 @@
+"""
+Unit tests for the asynchronous status outbox of
+PtpEventProducer.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import threading
+import time
+import unittest
+from unittest import mock
+
+from trackingfunctionsdk.client.publish_outbox import PublishOutbox
+from trackingfunctionsdk.common.helpers import constants
+
+BROKER_URL = 'rabbit://a:a@127.0.0.1:5672/'
+
+
+def _wait_for(condition, timeout=5):
+    """Wait until condition() is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+class TestPublishOutbox(unittest.TestCase):
+    """Test PublishOutbox."""
+
+    def setUp(self):
+        self.sent = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.sending = threading.Event()
+
+    def _send(self, topic, status):
+        self.sending.set()
+        self.gate.wait()
+        self.sent.append((topic, status))
+
+    def _outbox(self, **kwargs):
+        outbox = PublishOutbox('test', self._send, **kwargs)
+        self.addCleanup(outbox.stop)
+        return outbox
+
+    def _hold_sender(self, outbox):
+        """Block the sender on a first message."""
+        self.gate.clear()
+        outbox.put(None, 't0', 'first')
+        self.assertTrue(self.sending.wait(5))
+
+    def test_superseded_status_coalesced(self):
+        outbox = self._outbox()
+        self._hold_sender(outbox)
+        outbox.put('a', 't1', 'a1')
+        outbox.put('b', 't1', 'b1')
+        outbox.put('a', 't1', 'a2')
+        self.assertEqual(outbox.stats()['depth'], 3)
+        self.gate.set()
+        outbox.stop()
+        self.assertEqual(self.sent, [('t0', 'first'), ('t1', 'a2'),
+                                     ('t1', 'b1')])
+        stats = outbox.stats()
+        self.assertEqual(stats['coalesced'], 1)
+        self.assertEqual(stats['sent'], 3)
+        self.assertEqual(stats['depth'], 0)
+
+    def test_oldest_dropped_when_full(self):
+        outbox = self._outbox(max_size=2)
+        self._hold_sender(outbox)
+        outbox.put('a', 't1', 'a1')
+        outbox.put('b', 't1', 'b1')
+        self.assertEqual(outbox.stats()['dropped'], 1)
+        self.gate.set()
+        outbox.stop()
+        self.assertEqual(self.sent[-2:], [('t1', 'a1'), ('t1', 'b1')])
+
+    def test_retry_with_backoff(self):
+        send = mock.Mock(side_effect=[Exception('down'),
+                                      Exception('down'), None])
+        outbox = PublishOutbox('test', send, backoff=0.01)
+        self.addCleanup(outbox.stop)
+        with mock.patch.object(outbox._stop_event, 'wait',
+                               wraps=outbox._stop_event.wait) as wait:
+            outbox.put('a', 't1', 'a1')
+            _wait_for(lambda: outbox.stats()['sent'] == 1)
+        self.assertEqual([call[0][0] for call in wait.call_args_list],
+                         [0.01, 0.02])
+        self.assertEqual(outbox.stats()['retries'], 2)
+
+    def test_gives_up_after_max_attempts(self):
+        send = mock.Mock(side_effect=Exception('down'))
+        outbox = PublishOutbox('test', send, backoff=0, max_attempts=3)
+        self.addCleanup(outbox.stop)
+        outbox.put('a', 't1', 'a1')
+        _wait_for(lambda: outbox.stats()['dropped'] == 1)
+        self.assertEqual(send.call_count, 3)
+        self.assertEqual(outbox.stats()['depth'], 0)
+
+
+class TestPtpEventProducerAsync(unittest.TestCase):
+    """Test publishing through the outbox."""
+
+    @mock.patch.object(constants, 'PUBLISH_MODE', constants.PUBLISH_ASYNC)
+    @mock.patch(
+        'trackingfunctionsdk.client'
+        '.ptpeventproducer.BrokerClientBase')
+    def test_publish_does_not_wait_for_broker(self, mock_broker):
+        from trackingfunctionsdk.client.ptpeventproducer import (
+            PtpEventProducer)
+        producer = PtpEventProducer('node1', BROKER_URL)
+        self.addCleanup(producer.stop_publishing)
+        gate = threading.Event()
+        producer.local_broker_client.cast.side_effect = \
+            lambda *args, **kwargs: gate.wait()
+        event = {'id': '1', 'source': '/sync/ptp-status/lock-state',
+                 'time': 1.0, 'data': {'values': [
+                     {'ResourceAddress': '/./node1/ptp1/sync'}]}}
+
+        self.assertTrue(producer.publish_status_local(
+            [event], '/sync/ptp-status/lock-state'))
+        _wait_for(lambda: producer.local_broker_client.cast.called)
+        # The sender is blocked, later status of the resource supersede
+        # each other
+        self.assertTrue(producer.publish_status_local(
+            [dict(event, id='2')], '/sync/ptp-status/lock-state'))
+        self.assertTrue(producer.publish_status_local(
+            [dict(event, id='3')], '/sync/ptp-status/lock-state'))
+        stats = producer.publish_stats()['local']
+        self.assertEqual(stats['coalesced'], 2)
+
+        gate.set()
+        _wait_for(lambda: producer.publish_stats()['local']['depth'] == 0)
+        notifications = [
+            call[1]['notification'][0]['id']
+            for call in producer.local_broker_client.cast.call_args_list]
+        self.assertEqual(notifications, ['1', '3'])
+
+    @mock.patch.object(constants, 'PUBLISH_MODE', constants.PUBLISH_ASYNC)
+    @mock.patch('trackingfunctionsdk.client.base.rpc_helper.get_transport')
+    def test_unreachable_broker_backed_off(self, mock_transport):
+        import oslo_messaging
+        from trackingfunctionsdk.client.ptpeventproducer import (
+            PtpEventProducer)
+        from trackingfunctionsdk.common.helpers import rpc_helper
+        failures = [2]
+        stuck = threading.Event()
+        self.addCleanup(stuck.set)
+
+        def cast(retry, *args, **kwargs):
+            if retry is None:
+                # oslo.messaging retries forever while the broker is down
+                stuck.wait(5)
+                raise AssertionError("cast blocked the sender")
+            if failures[0]:
+                failures[0] -= 1
+                raise oslo_messaging.MessageDeliveryFailure('broker down')
+
+        def get_rpc_client(transport, target, timeout=None, retry=None):
+            client = mock.Mock()
+            client.cast.side_effect = \
+                lambda *args, **kwargs: cast(retry, *args, **kwargs)
+            return client
+
+        patch = mock.patch.object(rpc_helper.oslo_messaging,
+                                  'get_rpc_client',
+                                  side_effect=get_rpc_client)
+        patch.start()
+        self.addCleanup(patch.stop)
+        producer = PtpEventProducer('node1', BROKER_URL)
+        self.addCleanup(producer.stop_publishing)
+        producer.local_outbox.backoff = 0.01
+
+        self.assertTrue(producer.publish_status_local(
+            [{'id': '1', 'time': 1.0}], '/sync/ptp-status/lock-state'))
+        _wait_for(lambda: producer.publish_stats()['local']['depth'] == 0)
+        stats = producer.publish_stats()['local']
+        self.assertEqual((stats['sent'], stats['retries']), (1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for handling status requests on a bounded pool
+of RPC worker threads.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import threading
+import unittest
+from unittest import mock
+
+import oslo_messaging
+from oslo_config import cfg
+
+from trackingfunctionsdk.common.helpers import rpc_helper
+
+
+class TestPooledRpcServer(unittest.TestCase):
+    """Test PooledRpcServer."""
+
+    def _server(self, workers, queue_size):
+        transport = oslo_messaging.get_rpc_transport(
+            cfg.CONF, url='fake://')
+        self.addCleanup(transport.cleanup)
+        server = rpc_helper.get_rpc_server(
+            transport, oslo_messaging.Target(topic='PTP-Status-v2',
+                                             server='PTP-Tracking-node1'),
+            [], workers=workers, queue_size=queue_size)
+        self.assertIsInstance(server, rpc_helper.PooledRpcServer)
+        # As done by start()
+        server._work_executor = server._executor_cls(max_workers=64)
+        self.addCleanup(server._work_executor.shutdown)
+        return server
+
+    def test_requests_handled_concurrently(self):
+        server = self._server(workers=2, queue_size=0)
+        self.assertEqual(server._work_executor._max_workers, 2)
+        # Only returns once both requests are handled at the same time
+        barrier = threading.Barrier(2, timeout=5)
+        handled = []
+
+        def process(incoming):
+            barrier.wait()
+            handled.append(incoming)
+
+        with mock.patch.object(server, '_process_incoming',
+                               side_effect=process):
+            server._on_incoming('a')
+            server._on_incoming('b')
+            server._work_executor.shutdown(wait=True)
+
+        self.assertEqual(sorted(handled), ['a', 'b'])
+        stats = server.stats()
+        self.assertEqual(stats['handled'], 2)
+        self.assertEqual(stats['backlog'], 0)
+        self.assertEqual(stats['inline'], 0)
+
+    def test_full_backlog_handled_by_listener(self):
+        server = self._server(workers=1, queue_size=1)
+        server._work_executor = mock.Mock()
+        with mock.patch.object(server, '_process_incoming') as process:
+            server._on_incoming('first')
+            server._on_incoming('second')
+            process.assert_not_called()
+            server._on_incoming('third')
+            process.assert_called_once_with('third')
+        self.assertEqual(server._work_executor.submit.call_count, 2)
+        stats = server.stats()
+        self.assertEqual(stats['inline'], 1)
+        self.assertEqual(stats['backlog'], 2)
+        self.assertEqual(stats['handled'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
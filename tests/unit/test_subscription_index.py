@@ -0,0 +1,156 @@
+"""
+Unit tests for matching notifications to subscribers
+with the in-memory subscription index of the sidecar.
+"""
+"""
+Copyright (c) 2026 Wind River Systems, Inc.
+SPDX-License-Identifier: Apache-2.0
+"""
+import json
+import unittest
+
+from notificationclientsdk.common.helpers import constants
+from notificationclientsdk.common.helpers.nodeinfo_helper import \
+    NodeInfoHelper
+from notificationclientsdk.model.dto.resourcetype import ResourceType
+from notificationclientsdk.services import subscription_index
+
+LOCK_STATE = constants.SOURCE_SYNC_PTP_LOCK_STATE
+
+
+class Subscription(object):
+    """Stand-in for the Subscription ORM entries"""
+
+    def __init__(self, subscription_id, resource_address=None,
+                 node_name=None, status=1):
+        self.SubscriptionId = subscription_id
+        self.UriLocation = '/subscriptions/' + subscription_id
+        self.EndpointUri = 'http://127.0.0.1:9090/' + subscription_id
+        self.ResourceAddress = resource_address
+        self.Status = status
+        if node_name:
+            self.ResourceType = ResourceType.TypePTP
+            self.ResourceQualifierJson = json.dumps({'NodeName': node_name})
+        else:
+            self.ResourceType = None
+            self.ResourceQualifierJson = None
+
+
+class TestSplitResourceAddress(unittest.TestCase):
+    """Test split_resource_address."""
+
+    def test_split(self):
+        self.assertEqual(
+            subscription_index.split_resource_address(
+                '/./controller-0' + LOCK_STATE),
+            ('controller-0', ('sync', 'ptp-status', 'lock-state')))
+        self.assertEqual(
+            subscription_index.split_resource_address('/./*/sync'),
+            ('*', ('sync',)))
+
+    def test_instance_dropped(self):
+        self.assertEqual(
+            subscription_index.split_resource_address(
+                '/./controller-0/ptp1' + LOCK_STATE),
+            ('controller-0', ('sync', 'ptp-status', 'lock-state')))
+
+
+class TestSubscriptionIndex(unittest.TestCase):
+    """Test SubscriptionIndex."""
+
+    def setUp(self):
+        residing_node = NodeInfoHelper.residing_node_name
+        self.addCleanup(NodeInfoHelper.set_residing_node, residing_node)
+        NodeInfoHelper.set_residing_node('controller-0')
+        self.index = subscription_index.SubscriptionIndex()
+
+    def _match(self, resource_address):
+        node_name, path = subscription_index.split_resource_address(
+            resource_address)
+        return sorted(subscriptionid for subscriptionid, _ in
+                      self.index.match(node_name, path))
+
+    def test_not_built(self):
+        self.assertFalse(self.index.is_built())
+        self.assertEqual(self.index.match('controller-0', ('sync',)), [])
+        self.index.rebuild([])
+        self.assertTrue(self.index.is_built())
+
+    def test_current_and_all_nodes(self):
+        self.index.rebuild([
+            Subscription('current', '/./.' + LOCK_STATE),
+            Subscription('all', '/./*/sync'),
+            Subscription('other', '/./controller-1/sync'),
+            Subscription('inactive', '/./controller-0/sync', status=0),
+        ])
+        self.assertEqual(self._match('/./controller-0' + LOCK_STATE),
+                         ['all', 'current'])
+        self.assertEqual(self._match('/./controller-1' + LOCK_STATE),
+                         ['all', 'other'])
+        self.assertEqual(self.index.subscription_ids(),
+                         {'current', 'all', 'other'})
+
+    def test_parent_paths_and_instances(self):
+        self.index.rebuild([
+            Subscription('sync', '/./controller-0/sync'),
+            Subscription('lock-state', '/./controller-0' + LOCK_STATE),
+            Subscription('ptp1', '/./controller-0/ptp1' + LOCK_STATE),
+            Subscription('clock-class', '/./controller-0' +
+                         constants.SOURCE_SYNC_PTP_CLOCK_CLASS),
+        ])
+        # The instance of the event and of the subscription are dropped
+        self.assertEqual(self._match('/./controller-0/ptp2' + LOCK_STATE),
+                         ['lock-state', 'ptp1', 'sync'])
+        self.assertEqual(
+            self._match('/./controller-0' + constants.SOURCE_SYNC_OS_CLOCK),
+            ['sync'])
+
+    def test_prefix_matches_whole_segments(self):
+        self.index.rebuild([
+            Subscription('lock-state', '/./controller-0' +
+                         constants.SOURCE_SYNCE_LOCK_STATE),
+        ])
+        self.assertEqual(
+            self._match('/./controller-0' +
+                        constants.SOURCE_SYNCE_LOCK_STATE_EXTENDED), [])
+        self.assertEqual(
+            self._match('/./controller-0' +
+                        constants.SOURCE_SYNCE_LOCK_STATE), ['lock-state'])
+
+    def test_v1_subscriptions(self):
+        self.index.rebuild([
+            Subscription('v1', node_name='.'),
+            Subscription('v1-all', node_name='*'),
+            Subscription('v1-other', node_name='controller-1'),
+            Subscription('v2', '/./controller-0/sync'),
+        ])
+        matched = self.index.match('controller-0',
+                                   resource_type=ResourceType.TypePTP)
+        self.assertEqual(sorted(subscriptionid
+                                for subscriptionid, _ in matched),
+                         ['v1', 'v1-all'])
+        self.assertEqual(matched[0][1].EndpointUri,
+                         'http://127.0.0.1:9090/v1')
+        self.assertEqual(
+            self.index.match('controller-0', resource_type='unknown'), [])
+        # v2 events go to the v1 subscriptions of the node as well
+        self.assertEqual(self._match('/./controller-0' + LOCK_STATE),
+                         ['v1', 'v1-all', 'v2'])
+
+    def test_rebuild_after_changes(self):
+        subscriptions = [Subscription('first', '/./controller-0/sync')]
+        self.index.rebuild(subscriptions)
+        subscriptions.append(
+            Subscription('second', '/./controller-0' + LOCK_STATE))
+        self.index.rebuild(subscriptions)
+        self.assertEqual(self._match('/./controller-0' + LOCK_STATE),
+                         ['first', 'second'])
+        del subscriptions[0]
+        self.index.rebuild(subscriptions)
+        self.assertEqual(self._match('/./controller-0' + LOCK_STATE),
+                         ['second'])
+        self.assertEqual(self.index.subscription_ids(), {'second'})
+
+
+if __name__ == '__main__':
+    unittest.main()